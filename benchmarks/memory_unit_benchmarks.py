@@ -100,3 +100,23 @@ class MemSolveModel(MemDiscretiseModel):
         t = np.linspace(0, 3600, 600)
         solver.solve(self.model, t)
         return solver
+
+
+class MemBuildDFN:
+    model: pybamm.BaseModel
+
+    def setup(self):
+        set_random_seed()
+
+    def mem_build_DFN(self):
+        param = pybamm.ParameterValues("Marquis2019")
+        self.model = pybamm.lithium_ion.DFN()
+        geometry = self.model.default_geometry
+        param.process_model(self.model)
+        param.process_geometry(geometry)
+        mesh = pybamm.Mesh(
+            geometry, self.model.default_submesh_types, self.model.default_var_pts
+        )
+        disc = pybamm.Discretisation(mesh, self.model.default_spatial_methods)
+        disc.process_model(self.model)
+        return self.model
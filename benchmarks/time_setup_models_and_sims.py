@@ -77,6 +77,28 @@ class TimeBuildDFN:
         compute_discretisation(self.model, self.param).process_model(self.model)
 
 
+class TimeBuildMPM:
+    param: pybamm.ParameterValues
+    model: pybamm.BaseModel
+
+    def setup(self):
+        set_random_seed()
+
+    def time_setup_MPM(self):
+        self.param = pybamm.get_size_distribution_parameters(
+            pybamm.ParameterValues("Marquis2019")
+        )
+        self.model = pybamm.lithium_ion.MPM()
+        self.param.process_model(self.model)
+        geometry = self.model.default_geometry
+        self.param.process_geometry(geometry)
+        mesh = pybamm.Mesh(
+            geometry, self.model.default_submesh_types, self.model.default_var_pts
+        )
+        disc = pybamm.Discretisation(mesh, self.model.default_spatial_methods)
+        disc.process_model(self.model)
+
+
 class TimeBuildSPMSimulation:
     param_names = ["with experiment", "parameter"]
     params = ([False, True], parameters)
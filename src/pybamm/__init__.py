@@ -62,6 +62,8 @@ from .expression_tree.operations.evaluate_python import JaxCooMatrix
 from .expression_tree.operations.jacobian import Jacobian
 from .expression_tree.operations.convert_to_casadi import CasadiConverter
 from .expression_tree.operations.unpack_symbols import SymbolUnpacker
+from .expression_tree.operations.symbol_interner import SymbolInterner
+from .expression_tree.operations.traversal import post_order
 
 # Model classes
 from .models.base_model import BaseModel
@@ -158,10 +160,22 @@ from .spatial_methods.spectral_volume import SpectralVolume
 from .spatial_methods.scikit_finite_element import ScikitFiniteElement
 
 # Solver classes
-from .solvers.solution import Solution, EmptySolution, make_cycle_solution
+from .solvers.solution import (
+    Solution,
+    EmptySolution,
+    SolutionBuilder,
+    make_cycle_solution,
+)
 from .solvers.processed_variable_time_integral import ProcessedVariableTimeIntegral
 from .solvers.processed_variable import ProcessedVariable, process_variable
 from .solvers.processed_variable_computed import ProcessedVariableComputed
+from .solvers.function_cache import FunctionCache
+from .solvers.observation_function_cache import (
+    ObservationFunctionCache,
+    observation_function_cache,
+)
+from .solvers.output_sink import OutputSink, NpzOutputSink
+from .solvers.columnar_solution import load_columnar_solution
 from .solvers.base_solver import BaseSolver
 from .solvers.dummy_solver import DummySolver
 from .solvers.algebraic_solver import AlgebraicSolver
@@ -190,6 +204,7 @@ from .plotting.plot_summary_variables import plot_summary_variables
 from .plotting.dynamic_plot import dynamic_plot
 
 # Simulation
+from .model_cache import ModelCache
 from .simulation import Simulation, load_sim, is_notebook
 
 # Batch Study
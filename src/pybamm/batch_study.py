@@ -1,9 +1,16 @@
 #
 # BatchStudy class
 #
-import pybamm
+import multiprocessing as mp
+import platform
 from itertools import product
 
+import pybamm
+
+# Simulations built by the current worker process, see `BatchStudy.solve`
+_worker_data = None
+_worker_simulations = {}
+
 
 class BatchStudy:
     """
@@ -46,6 +53,8 @@ class BatchStudy:
         Default is False
     """
 
+    DEFAULT_COMPACT_VARIABLES = ["Time [s]", "Current [A]", "Voltage [V]"]
+
     INPUT_LIST = [
         "experiments",
         "geometries",
@@ -107,13 +116,43 @@ class BatchStudy:
         starting_solution=None,
         initial_soc=None,
         t_interp=None,
+        nproc=1,
+        chunksize=None,
+        compact_variables=None,
         **kwargs,
     ):
         """
         For more information on the parameters used in the solve,
         See :meth:`pybamm.Simulation.solve`
+
+        If `nproc` is greater than 1, the simulations are solved in parallel by a
+        pool of `nproc` worker processes. Each worker builds each combination of
+        model, experiment, geometry, parameter values, submesh types, number of
+        points, spatial methods and C-rate that it is assigned only once, and reuses
+        it for all the solvers (and repeats) of that combination. Instead of the
+        simulations, the workers only return the data of the variables in
+        `compact_variables`, which is stored in :attr:`BatchStudy.results`, and
+        :attr:`BatchStudy.sims` is set to None.
+
+        Parameters
+        ----------
+        solver : :class:`pybamm.BaseSolver`, optional
+            If given, the solver used for all the simulations, instead of the
+            solvers given to :class:`BatchStudy`.
+        nproc : int, optional
+            The number of worker processes. Default is 1, in which case the
+            simulations are solved in the current process.
+        chunksize : int, optional
+            The number of simulations sent to a worker at a time. Consecutive
+            simulations often share a model, so larger chunks allow more reuse of
+            the built models, at the cost of load balancing. By default, the
+            simulations are split into about four chunks per worker.
+        compact_variables : list of str, optional
+            The variables to return from the workers if `nproc` is greater than 1.
+            By default, the output variables of each simulation are returned if
+            they are given, and otherwise `["Time [s]", "Current [A]",
+            "Voltage [V]"]`.
         """
-        self.sims = []
         iter_func = product if self.permutations else zip
 
         # Instantiate items in INPUT_LIST based on the value of self.permutations
@@ -127,6 +166,27 @@ class BatchStudy:
                 inp_value = [None] * len(self.models)
             inp_values.append(inp_value)
 
+        if nproc > 1:
+            self._solve_in_parallel(
+                iter_func,
+                inp_values,
+                (
+                    t_eval,
+                    solver,
+                    save_at_cycles,
+                    calc_esoh,
+                    starting_solution,
+                    initial_soc,
+                ),
+                kwargs,
+                nproc,
+                chunksize,
+                compact_variables,
+            )
+            return
+
+        self.sims = []
+        self.results = None
         for (
             model,
             experiment,
@@ -135,7 +195,7 @@ class BatchStudy:
             submesh_type,
             var_pt,
             spatial_method,
-            solver,
+            sim_solver,
             output_variable,
             C_rate,
         ) in iter_func(self.models.values(), *inp_values):
@@ -147,7 +207,7 @@ class BatchStudy:
                 submesh_types=submesh_type,
                 var_pts=var_pt,
                 spatial_methods=spatial_method,
-                solver=solver,
+                solver=sim_solver,
                 output_variables=output_variable,
                 C_rate=C_rate,
             )
@@ -170,11 +230,67 @@ class BatchStudy:
             sim.solution.integration_time = integration_time / self.repeats
             self.sims.append(sim)
 
+    def _solve_in_parallel(
+        self,
+        iter_func,
+        inp_values,
+        solve_args,
+        solve_kwargs,
+        nproc,
+        chunksize,
+        compact_variables,
+    ):
+        """
+        Solve the simulations with a pool of worker processes, see
+        :meth:`BatchStudy.solve`.
+        """
+        items = [list(self.models.values())] + [list(value) for value in inp_values]
+        names = [list(self.models.keys())] + [
+            list(getattr(self, name).keys()) if getattr(self, name) else None
+            for name in self.INPUT_LIST
+        ]
+        # Each simulation is sent to the workers as the indices of its items
+        tasks = list(iter_func(*[range(len(item)) for item in items]))
+        if chunksize is None:
+            chunksize, extra = divmod(len(tasks), nproc * 4)
+            if extra or chunksize == 0:
+                chunksize += 1
+
+        data = (items, solve_args, solve_kwargs, self.repeats, compact_variables)
+        context = pybamm.BaseSolver.get_platform_context(platform.system())
+        with mp.get_context(context).Pool(
+            processes=nproc, initializer=_initialise_worker, initargs=(data,)
+        ) as pool:
+            results = list(pool.imap(_solve_task, tasks, chunksize=chunksize))
+            pool.close()
+            pool.join()
+
+        for task, result in zip(tasks, results):
+            result["names"] = {
+                name: item_names[index]
+                for name, item_names, index in zip(
+                    ["models", *self.INPUT_LIST], names, task
+                )
+                if item_names is not None
+            }
+        self.sims = None
+        self.results = results
+
+    def _check_sims(self):
+        if not hasattr(self, "sims"):
+            raise ValueError("The simulations have not been solved yet.")
+        if self.sims is None:
+            raise ValueError(
+                "The simulations were solved in parallel, so only the data in "
+                "`BatchStudy.results` is available."
+            )
+
     def plot(self, output_variables=None, **kwargs):
         """
         For more information on the parameters used in the plot,
         See :meth:`pybamm.Simulation.plot`
         """
+        self._check_sims()
         self.quick_plot = pybamm.dynamic_plot(
             self.sims, output_variables=output_variables, **kwargs
         )
@@ -195,8 +311,7 @@ class BatchStudy:
             Name of the generated GIF file.
 
         """
-        if not hasattr(self, "sims"):
-            raise ValueError("The simulations have not been solved yet.")
+        self._check_sims()
         if self.quick_plot is None:
             self.quick_plot = pybamm.QuickPlot(self.sims)
 
@@ -205,3 +320,76 @@ class BatchStudy:
             duration=duration,
             output_filename=output_filename,
         )
+
+
+def _initialise_worker(data):
+    global _worker_data
+    _worker_data = data
+    _worker_simulations.clear()
+
+
+def _solve_task(task):
+    """
+    Solve one simulation of a batch study in a worker process, reusing the
+    simulation built by this worker for the same settings if there is one.
+    """
+    items, solve_args, solve_kwargs, repeats, compact_variables = _worker_data
+    (
+        model,
+        experiment,
+        geometry,
+        parameter_value,
+        submesh_type,
+        var_pt,
+        spatial_method,
+        solver,
+        output_variable,
+        C_rate,
+    ) = (item[index] for item, index in zip(items, task))
+    t_eval, solve_solver, *other_solve_args = solve_args
+
+    # The solver is only part of the built simulation for experiments, where a copy
+    # of it is used for each step. The output variables are only used for plotting.
+    build_key = task[:7] + task[9:]
+    if experiment is not None:
+        build_key += (task[7],)
+    sim = _worker_simulations.get(build_key)
+    if sim is None:
+        sim = pybamm.Simulation(
+            model,
+            experiment=experiment,
+            geometry=geometry,
+            parameter_values=parameter_value,
+            submesh_types=submesh_type,
+            var_pts=var_pt,
+            spatial_methods=spatial_method,
+            solver=solver,
+            C_rate=C_rate,
+        )
+        _worker_simulations[build_key] = sim
+    if solve_solver is None and experiment is None:
+        solve_solver = solver
+
+    solve_time = 0
+    integration_time = 0
+    for _ in range(repeats):
+        sol = sim.solve(t_eval, solve_solver, *other_solve_args, **solve_kwargs)
+        solve_time += sol.solve_time
+        integration_time += sol.integration_time
+
+    if compact_variables is not None:
+        variables = compact_variables
+    elif output_variable is not None:
+        # output variables can be nested for plotting
+        variables = []
+        for var in output_variable:
+            variables.extend([var] if isinstance(var, str) else var)
+    else:
+        variables = BatchStudy.DEFAULT_COMPACT_VARIABLES
+    # don't keep the solution in the worker
+    sim._solution = None
+    return {
+        "data": {var: sol[var].data for var in variables},
+        "solve_time": solve_time / repeats,
+        "integration_time": integration_time / repeats,
+    }
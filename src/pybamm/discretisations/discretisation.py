@@ -1,6 +1,8 @@
 #
 # Interface for discretisation
 #
+import copy
+
 import pybamm
 import numpy as np
 from collections import defaultdict, OrderedDict
@@ -71,6 +73,10 @@ class Discretisation:
         self._bcs = {}
         self.y_slices = {}
         self._discretised_symbols = {}
+        # Table of the discretised symbols, so that equal subtrees are shared objects
+        self._symbol_interner = pybamm.SymbolInterner()
+        # The domains that the meshes of each discretised symbol were assigned from
+        self._mesh_domains = {}
         self._check_model_flag = check_model
         self._remove_independent_variables_from_rhs_flag = (
             remove_independent_variables_from_rhs
@@ -241,6 +247,11 @@ class Discretisation:
             pybamm.logger.verbose(f"Performing model checks for {model.name}")
             self.check_model(model_disc)
 
+        interner = self._symbol_interner
+        pybamm.logger.verbose(
+            f"Shared {interner.hits} of {interner.hits + interner.misses} discretised "
+            f"symbols ({interner.node_count_reduction:.1%} fewer nodes)"
+        )
         pybamm.logger.info(f"Finish discretising {model.name}")
 
         # Record that the model has been discretised
@@ -720,24 +731,58 @@ class Discretisation:
         try:
             return self._discretised_symbols[symbol]
         except KeyError:
-            discretised_symbol = self._process_symbol(symbol)
-            self._discretised_symbols[symbol] = discretised_symbol
+            pass
+        # Walk the tree with an explicit stack rather than recursively, so that deep
+        # trees do not hit the recursion limit. The children of operators are then
+        # already discretised when the operator is discretised
+        for node in pybamm.post_order(
+            symbol,
+            known=self._discretised_symbols,
+            expand=self._discretises_children_first,
+        ):
+            discretised_symbol = self._symbol_interner.intern(
+                self._process_symbol(node)
+            )
+            # The meshes are assigned from the domains of the node, so a discretised
+            # symbol that is shared with a node on other domains (e.g. through
+            # interning, or an average rewritten as an integral) is copied
+            mesh_domains = (tuple(node.domain), tuple(node.domains["secondary"]))
+            _, known_domains = self._mesh_domains.setdefault(
+                id(discretised_symbol), (discretised_symbol, mesh_domains)
+            )
+            if known_domains != mesh_domains:
+                discretised_symbol = copy.copy(discretised_symbol)
+                self._mesh_domains[id(discretised_symbol)] = (
+                    discretised_symbol,
+                    mesh_domains,
+                )
+            self._discretised_symbols[node] = discretised_symbol
             discretised_symbol.test_shape()
 
             # Assign mesh as an attribute to the processed variable
-            if symbol.domain != []:
-                discretised_symbol.mesh = self.mesh[symbol.domain]
+            if node.domain != []:
+                discretised_symbol.mesh = self.mesh[node.domain]
             else:
                 discretised_symbol.mesh = None
 
             # Assign secondary mesh
-            if symbol.domains["secondary"] != []:
-                discretised_symbol.secondary_mesh = self.mesh[
-                    symbol.domains["secondary"]
-                ]
+            if node.domains["secondary"] != []:
+                discretised_symbol.secondary_mesh = self.mesh[node.domains["secondary"]]
             else:
                 discretised_symbol.secondary_mesh = None
-            return discretised_symbol
+        return self._discretised_symbols[symbol]
+
+    @staticmethod
+    def _discretises_children_first(symbol):
+        """
+        Whether :meth:`Discretisation._process_symbol()` discretises all the children
+        of a symbol before the symbol itself. Averages are replaced by integrals, and
+        the children of concatenations of variables are copied, before being
+        discretised.
+        """
+        return pybamm.operates_on_children(symbol) and not isinstance(
+            symbol, (pybamm._BaseAverage, pybamm.ConcatenationVariable)
+        )
 
     def _process_symbol(self, symbol):
         """See :meth:`Discretisation.process_symbol()`."""
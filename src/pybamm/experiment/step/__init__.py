@@ -1,5 +1,6 @@
 from .steps import *
 from .base_step import BaseStep, BaseStepExplicit, BaseStepImplicit
 from .step_termination import *
+from .step_model_builder import StepModelBuilder
 
-__all__ = ['base_step', 'step_termination', 'steps']
+__all__ = ['base_step', 'step_termination', 'step_model_builder', 'steps']
@@ -367,14 +367,7 @@ class BaseStep:
             if event is not None:
                 new_model.events.append(event)
 
-        # Keep the min and max voltages as safeguards but add some tolerances
-        # so that they are not triggered before the voltage limits in the
-        # experiment
-        for i, event in enumerate(new_model.events):
-            if event.name in ["Minimum voltage [V]", "Maximum voltage [V]"]:
-                new_model.events[i] = pybamm.Event(
-                    event.name, event.expression + 1, event.event_type
-                )
+        relax_voltage_limit_events(new_model)
 
     def value_based_charge_or_discharge(self):
         """
@@ -484,6 +477,18 @@ class BaseStepImplicit(BaseStep):
         return new_model, new_parameter_values
 
 
+def relax_voltage_limit_events(model):
+    """
+    Keep the min and max voltages of a model as safeguards but add some tolerances so
+    that they are not triggered before the voltage limits in the experiment
+    """
+    for i, event in enumerate(model.events):
+        if event.name in ["Minimum voltage [V]", "Maximum voltage [V]"]:
+            model.events[i] = pybamm.Event(
+                event.name, event.expression + 1, event.event_type
+            )
+
+
 _type_to_units = {
     "current": "[A]",
     "voltage": "[V]",
@@ -0,0 +1,450 @@
+#
+# Build the models for the steps of an experiment from a shared discretisation
+#
+import numbers
+
+import numpy as np
+from scipy.sparse import block_diag, csr_matrix
+
+import pybamm
+
+from .base_step import BaseStepExplicit, BaseStepImplicit, relax_voltage_limit_events
+
+
+class StepModelBuilder:
+    """
+    Builds the models for the steps of an experiment from a "core" model, whose
+    parameters are processed and which is discretised only once (for each ambient
+    temperature used in the experiment). The model for each step is then derived from
+    the core model by substituting the current, and any other parameters set by the
+    step, and adding the equations and events of the external circuit submodel of the
+    step, which is much cheaper than processing the parameters of and discretising
+    each model separately.
+
+    Steps that cannot be derived from the core model (steps with a differential
+    control, or whose values are given by data) are processed and discretised as
+    in :meth:`pybamm.step.BaseStep.process_model`.
+
+    Parameters
+    ----------
+    model : :class:`pybamm.BaseModel`
+        The model, whose parameters have not been processed.
+    parameter_values : :class:`pybamm.ParameterValues`
+        The parameter values to use for all the steps.
+    mesh : :class:`pybamm.Mesh`
+        The mesh to use for the discretisation.
+    spatial_methods : dict
+        The spatial methods to use for the discretisation.
+    steps : list of :class:`pybamm.step.BaseStep`
+        The steps for which models will be built.
+    discretisation_kwargs : dict, optional
+        Any keyword arguments to pass to the Discretisation class.
+    """
+
+    def __init__(
+        self,
+        model,
+        parameter_values,
+        mesh,
+        spatial_methods,
+        steps,
+        discretisation_kwargs=None,
+    ):
+        self.model = model
+        self.parameter_values = parameter_values
+        self.mesh = mesh
+        self.spatial_methods = spatial_methods
+        self.discretisation_kwargs = discretisation_kwargs or {}
+
+        # The parameters set by the steps are replaced by placeholders in the core
+        # model, which are substituted for the value of the parameter in each step
+        names = {"Current function [A]"}
+        for step in steps:
+            if isinstance(step, BaseStepImplicit):
+                names.update(step.get_parameter_values([]).keys())
+        self._placeholders = {
+            name: pybamm.InputParameter(f"{name} [experiment step]") for name in names
+        }
+        self._placeholder_names = {
+            placeholder.name: name for name, placeholder in self._placeholders.items()
+        }
+
+        options = getattr(model, "options", None) or {}
+        self._can_share = options.get("operating mode", "current") == "current"
+        self._cores = {}
+        self._disc = None
+
+    def build(self, step, ambient_temperature=None):
+        """
+        Build the model for a step.
+
+        Parameters
+        ----------
+        step : :class:`pybamm.step.BaseStep`
+            The step.
+        ambient_temperature : float or str, optional
+            The ambient temperature to use if the step doesn't set the temperature.
+            If None (default), the ambient temperature in the parameter values is
+            used.
+
+        Returns
+        -------
+        :class:`pybamm.BaseModel`
+            The discretised model for the step.
+        """
+        if step.temperature is not None:
+            ambient_temperature = step.temperature
+
+        built_model = None
+        if self._can_share:
+            core = self._get_core(ambient_temperature)
+            built_model = self._build_from_core(core, step)
+        if built_model is None:
+            pybamm.logger.verbose(f"Processing model for step '{step}' separately")
+            built_model = self._build_separately(step, ambient_temperature)
+        return built_model
+
+    def _parameter_values_for(self, ambient_temperature):
+        parameter_values = self.parameter_values.copy()
+        if ambient_temperature is not None:
+            parameter_values["Ambient temperature [K]"] = ambient_temperature
+        return parameter_values
+
+    def _build_separately(self, step, ambient_temperature):
+        """Process and discretise the model for a step from scratch"""
+        parameter_values = self._parameter_values_for(ambient_temperature)
+        parameterised_model = step.process_model(self.model, parameter_values)
+        if self._disc is None:
+            self._disc = pybamm.Discretisation(
+                self.mesh, self.spatial_methods, **self.discretisation_kwargs
+            )
+        return self._disc.process_model(parameterised_model, inplace=True)
+
+    def _get_core(self, ambient_temperature):
+        """Process and discretise the core model for an ambient temperature"""
+        if ambient_temperature in self._cores:
+            return self._cores[ambient_temperature]
+
+        parameter_values = self._parameter_values_for(ambient_temperature)
+        parameter_values.update(self._placeholders, check_already_exists=False)
+        model = self.model.new_copy()
+        relax_voltage_limit_events(model)
+        parameterised_model = parameter_values.process_model(model, inplace=False)
+        disc = pybamm.Discretisation(
+            self.mesh, self.spatial_methods, **self.discretisation_kwargs
+        )
+        built_model = disc.process_model(parameterised_model, inplace=True)
+
+        core = _Core(self, parameter_values, disc, built_model)
+        self._cores[ambient_temperature] = core
+        return core
+
+    def _process(self, core, symbol):
+        """Process the parameters of and discretise an expression of the core model"""
+        return core.disc.process_symbol(core.parameter_values.process_symbol(symbol))
+
+    def _build_from_core(self, core, step):
+        """
+        Derive the model for a step from the core model. Returns None if the model
+        can't be derived from the core model.
+        """
+        variables = self.model.variables
+        parameter_values = core.parameter_values
+        disc = core.disc
+        base_model = core.model
+
+        if isinstance(step, BaseStepExplicit):
+            values = {"Current function [A]": step.current_value(variables)}
+            submodel = None
+        elif isinstance(step, BaseStepImplicit):
+            # Set up the external circuit submodel as in
+            # `pybamm.step.BaseStepImplicit.set_up`
+            submodel = step.get_submodel(self.model)
+            variables = variables.copy()
+            submodel.variables = submodel.get_fundamental_variables()
+            variables.update(submodel.variables)
+            submodel.variables.update(submodel.get_coupled_variables(variables))
+            variables.update(submodel.variables)
+            submodel.set_rhs(variables)
+            submodel.set_algebraic(variables)
+            submodel.set_initial_conditions(variables)
+            # Only an algebraic equation for a scalar current variable, which is
+            # appended to the end of the state vector, can be added to the core model
+            new_keys = [
+                var for var in submodel.algebraic if var not in self.model.algebraic
+            ]
+            if (
+                len(submodel.rhs) > 0
+                or len(new_keys) != 1
+                or new_keys[0].domain != []
+                or new_keys[0] not in submodel.initial_conditions
+            ):
+                return None
+            values = {
+                "Current function [A]": submodel.variables["Current [A]"],
+                **step.get_parameter_values(variables),
+            }
+        else:
+            return None
+
+        y_slices = disc.y_slices
+        y_slices_explicit = disc.y_slices_explicit
+        try:
+            if submodel is not None:
+                # Add the current variable to the end of the state vector
+                current_var = parameter_values.process_symbol(new_keys[0])
+                n = base_model.len_rhs_and_alg
+                disc.y_slices = {**y_slices, current_var: [slice(n, n + 1)]}
+                disc.y_slices_explicit = {
+                    **y_slices_explicit,
+                    current_var: [slice(n, n + 1)],
+                }
+
+            # Process the values of the parameters set by the step
+            replacements = {}
+            processed_replacements = {}
+            for name, value in values.items():
+                placeholder = self._placeholders.get(name)
+                if placeholder is None:
+                    return None
+                if isinstance(value, numbers.Number):
+                    value = pybamm.Scalar(value, name=name)
+                elif not (
+                    isinstance(value, pybamm.Symbol) and value.size_for_testing == 1
+                ):
+                    return None
+                processed_value = parameter_values.process_symbol(value)
+                # Data (e.g. drive cycles) need extrapolation events, which are only
+                # added when processing the whole model
+                if processed_value.has_symbol_of_classes(pybamm.Interpolant):
+                    return None
+                processed_replacements[placeholder.name] = processed_value
+                replacements[placeholder.name] = disc.process_symbol(processed_value)
+            if not core.placeholders <= replacements.keys():
+                return None
+
+            # Process the equations and variables of the external circuit submodel
+            rhs = dict(base_model.rhs)
+            algebraic = dict(base_model.algebraic)
+            initial_conditions = dict(base_model.initial_conditions)
+            step_variables = {}
+            if submodel is not None:
+                algebraic.update(
+                    disc.process_dict(
+                        {
+                            current_var: parameter_values.process_symbol(
+                                submodel.algebraic[new_keys[0]]
+                            )
+                        }
+                    )
+                )
+                initial_conditions.update(
+                    disc.process_dict(
+                        {
+                            current_var: parameter_values.process_symbol(
+                                submodel.initial_conditions[new_keys[0]]
+                            )
+                        },
+                        ics=True,
+                    )
+                )
+                step_variables = {
+                    name: self._process(core, var)
+                    for name, var in submodel.variables.items()
+                }
+
+            # Events for the termination conditions of the step
+            step_events = []
+            for term in step.termination:
+                event = term.get_event(variables, step)
+                if event is not None:
+                    step_events.append(
+                        pybamm.Event(
+                            event.name,
+                            self._process(core, event.expression),
+                            event.event_type,
+                        )
+                    )
+
+            # The step must set all the parameters that the equations depend on
+            step_symbols = (
+                list(algebraic.values())[len(base_model.algebraic) :]
+                + list(initial_conditions.values())[
+                    len(base_model.initial_conditions) :
+                ]
+                + list(step_variables.values())
+                + [event.expression for event in step_events]
+            )
+            if any(
+                core.placeholders_in(value) for value in replacements.values()
+            ) or any(
+                not core.placeholders_in(symbol) <= replacements.keys()
+                for symbol in step_symbols
+            ):
+                return None
+
+            # Substitute the values of the parameters into the core model
+            memo = {}
+
+            def substitute(symbol):
+                return core.substitute(symbol, replacements, memo)
+
+            rhs = {var: substitute(eqn) for var, eqn in rhs.items()}
+            algebraic = {var: substitute(eqn) for var, eqn in algebraic.items()}
+            initial_conditions = {
+                var: substitute(eqn) for var, eqn in initial_conditions.items()
+            }
+            new_variables = {}
+            for name, var in {**base_model.variables, **step_variables}.items():
+                new_var = substitute(var)
+                if new_var is not var:
+                    new_var.mesh = var.mesh
+                    new_var.secondary_mesh = var.secondary_mesh
+                new_variables[name] = new_var
+            events = [
+                pybamm.Event(event.name, substitute(event.expression), event.event_type)
+                for event in base_model.events
+                if event.event_type != pybamm.EventType.INTERPOLANT_EXTRAPOLATION
+            ]
+            events += [
+                pybamm.Event(event.name, substitute(event.expression), event.event_type)
+                for event in step_events
+            ]
+            events += [
+                pybamm.Event(event.name, substitute(event.expression), event.event_type)
+                for event in base_model.events
+                if event.event_type == pybamm.EventType.INTERPOLANT_EXTRAPOLATION
+            ]
+            bcs = {
+                var: {side: (substitute(bc), typ) for side, (bc, typ) in sides.items()}
+                for var, sides in base_model.bcs.items()
+            }
+            processed_memo = {}
+            boundary_conditions = {
+                var: {
+                    side: (
+                        core.substitute(bc, processed_replacements, processed_memo),
+                        typ,
+                    )
+                    for side, (bc, typ) in sides.items()
+                }
+                for var, sides in base_model.boundary_conditions.items()
+            }
+
+            # Assemble the model for the step
+            new_model = base_model.new_copy()
+            new_model.rhs = rhs
+            new_model.algebraic = algebraic
+            new_model.initial_conditions = initial_conditions
+            new_model.boundary_conditions = boundary_conditions
+            new_model.variables = new_variables
+            new_model.events = events
+            new_model.bcs = bcs
+            new_model.concatenated_rhs = disc._concatenate_in_order(rhs)
+            new_model.concatenated_algebraic = disc._concatenate_in_order(algebraic)
+            new_model.concatenated_initial_conditions = disc._concatenate_in_order(
+                initial_conditions, check_complete=True
+            )
+            if submodel is not None:
+                new_model.y_slices = disc.y_slices_explicit
+                new_model.bounds = tuple(
+                    np.append(bound, current_var.bounds[i].evaluate())
+                    for i, bound in enumerate(base_model.bounds)
+                )
+                new_model.mass_matrix = pybamm.Matrix(
+                    block_diag(
+                        (base_model.mass_matrix.entries, csr_matrix((1, 1))),
+                        format="csr",
+                    )
+                )
+                new_model.len_alg = base_model.len_alg + 1
+                new_model.len_rhs_and_alg = base_model.len_rhs_and_alg + 1
+        finally:
+            disc.y_slices = y_slices
+            disc.y_slices_explicit = y_slices_explicit
+
+        return new_model
+
+
+class _Core:
+    """
+    The core model, with the parameters set by the steps replaced by placeholders,
+    and the discretisation used to discretise it.
+    """
+
+    def __init__(self, builder, parameter_values, disc, model):
+        self.parameter_values = parameter_values
+        self.disc = disc
+        self.model = model
+        self._placeholder_names = builder._placeholder_names
+        # The names of the placeholders in each symbol, by id. The symbols are kept
+        # so that their ids aren't reused
+        self._placeholders_in = {}
+
+        # Names of all the placeholders in the core model
+        self.placeholders = set()
+        for symbol in (
+            list(model.rhs.values())
+            + list(model.algebraic.values())
+            + list(model.initial_conditions.values())
+            + list(model.variables.values())
+            + [event.expression for event in model.events]
+            + [bc for sides in model.bcs.values() for bc, _ in sides.values()]
+            + [
+                bc
+                for sides in model.boundary_conditions.values()
+                for bc, _ in sides.values()
+            ]
+        ):
+            self.placeholders.update(self.placeholders_in(symbol))
+
+    def placeholders_in(self, symbol):
+        """The names of the placeholders in a symbol"""
+        try:
+            return self._placeholders_in[id(symbol)][1]
+        except KeyError:
+            if (
+                isinstance(symbol, pybamm.InputParameter)
+                and symbol.name in self._placeholder_names
+            ):
+                names = frozenset([symbol.name])
+            else:
+                names = _no_placeholders
+                for child in symbol.children:
+                    child_names = self.placeholders_in(child)
+                    if child_names and not child_names <= names:
+                        names = names | child_names
+            self._placeholders_in[id(symbol)] = (symbol, names)
+            return names
+
+    def substitute(self, symbol, replacements, memo):
+        """
+        Substitute the placeholders in a symbol by their values in `replacements`.
+        Only the parts of the expression tree that contain placeholders are copied.
+        """
+        if not self.placeholders_in(symbol):
+            return symbol
+        try:
+            return memo[id(symbol)]
+        except KeyError:
+            if isinstance(symbol, pybamm.InputParameter):
+                new_symbol = replacements[symbol.name]
+            else:
+                new_children = [
+                    self.substitute(child, replacements, memo)
+                    for child in symbol.children
+                ]
+                # Simplifications can return one of the children, whose domains are
+                # then overwritten, so they must not be applied to symbols shared
+                # with the core model
+                try:
+                    new_symbol = symbol.create_copy(
+                        new_children=new_children, perform_simplifications=False
+                    )
+                except NotImplementedError:
+                    new_symbol = symbol.create_copy(new_children=new_children)
+            memo[id(symbol)] = new_symbol
+            return new_symbol
+
+
+_no_placeholders = frozenset()
@@ -36,6 +36,8 @@ class Array(pybamm.Symbol):
         String representing the entries (slow to recalculate when copying)
     """
 
+    __slots__ = ("_entries", "_entries_string")
+
     def __init__(
         self,
         entries: np.ndarray | list[float] | csr_matrix,
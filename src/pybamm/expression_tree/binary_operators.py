@@ -66,6 +66,8 @@ class BinaryOperator(pybamm.Symbol):
         rhs child node (converted to :class:`Scalar` if Number)
     """
 
+    __slots__ = ("left", "right")
+
     def __init__(
         self, name: str, left_child: ChildSymbol, right_child: ChildSymbol
     ) -> None:
@@ -149,16 +151,16 @@ class BinaryOperator(pybamm.Symbol):
         """
         return self._binary_evaluate(left, right)
 
-    def evaluate(
+    def _evaluate_node(
         self,
+        children_eval: list,
         t: float | None = None,
         y: np.ndarray | None = None,
         y_dot: np.ndarray | None = None,
         inputs: dict | str | None = None,
     ):
-        """See :meth:`pybamm.Symbol.evaluate()`."""
-        left = self.left.evaluate(t, y, y_dot, inputs)
-        right = self.right.evaluate(t, y, y_dot, inputs)
+        """See :meth:`pybamm.Symbol._evaluate_node()`."""
+        left, right = children_eval
         return self._binary_evaluate(left, right)
 
     def _evaluate_for_shape(self):
@@ -183,8 +185,8 @@ class BinaryOperator(pybamm.Symbol):
             dimension
         )
 
-    def is_constant(self):
-        """See :meth:`pybamm.Symbol.is_constant()`."""
+    def _is_constant(self):
+        """See :meth:`pybamm.Symbol._is_constant()`."""
         return self.left.is_constant() and self.right.is_constant()
 
     def _sympy_operator(self, left, right):
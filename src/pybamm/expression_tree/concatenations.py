@@ -118,15 +118,15 @@ class Concatenation(pybamm.Symbol):
         else:
             return self.concatenation_function(children_eval)
 
-    def evaluate(
+    def _evaluate_node(
         self,
+        children_eval: list,
         t: float | None = None,
         y: np.ndarray | None = None,
         y_dot: np.ndarray | None = None,
         inputs: dict | str | None = None,
     ):
-        """See :meth:`pybamm.Symbol.evaluate()`."""
-        children_eval = [child.evaluate(t, y, y_dot, inputs) for child in self.children]
+        """See :meth:`pybamm.Symbol._evaluate_node()`."""
         return self._concatenation_evaluate(children_eval)
 
     def create_copy(
@@ -165,8 +165,8 @@ class Concatenation(pybamm.Symbol):
                 [child.evaluate_for_shape() for child in self.children]
             )
 
-    def is_constant(self):
-        """See :meth:`pybamm.Symbol.is_constant()`."""
+    def _is_constant(self):
+        """See :meth:`pybamm.Symbol._is_constant()`."""
         return all(child.is_constant() for child in self.children)
 
     def _sympy_operator(self, *children):
@@ -229,6 +229,16 @@ class NumpyConcatenation(Concatenation):
 
         return instance
 
+    def _concatenation_evaluate(self, children_eval: list[np.ndarray]):
+        """See :meth:`Concatenation._concatenation_evaluate()`."""
+        # Some children, e.g. pybamm.min, evaluate to a number rather than a column
+        return super()._concatenation_evaluate(
+            [
+                np.reshape(child, (1, 1)) if np.ndim(child) == 0 else child
+                for child in children_eval
+            ]
+        )
+
     def _concatenation_jac(self, children_jacs):
         """See :meth:`pybamm.Concatenation.concatenation_jac()`."""
         children = self.children
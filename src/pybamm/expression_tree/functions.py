@@ -29,6 +29,8 @@ class Function(pybamm.Symbol):
         The function which was differentiated to obtain this one. Default is None.
     """
 
+    __slots__ = ("function", "differentiated_function")
+
     def __init__(
         self,
         function: Callable,
@@ -119,25 +121,23 @@ class Function(pybamm.Symbol):
 
         return jacobian
 
-    def evaluate(
+    def _evaluate_node(
         self,
+        children_eval: list,
         t: float | None = None,
         y: np.ndarray | None = None,
         y_dot: np.ndarray | None = None,
         inputs: dict | str | None = None,
     ):
-        """See :meth:`pybamm.Symbol.evaluate()`."""
-        evaluated_children = [
-            child.evaluate(t, y, y_dot, inputs) for child in self.children
-        ]
-        return self._function_evaluate(evaluated_children)
+        """See :meth:`pybamm.Symbol._evaluate_node()`."""
+        return self._function_evaluate(children_eval)
 
     def _evaluates_on_edges(self, dimension: str) -> bool:
         """See :meth:`pybamm.Symbol._evaluates_on_edges()`."""
         return any(child.evaluates_on_edges(dimension) for child in self.children)
 
-    def is_constant(self):
-        """See :meth:`pybamm.Symbol.is_constant()`."""
+    def _is_constant(self):
+        """See :meth:`pybamm.Symbol._is_constant()`."""
         return all(child.is_constant() for child in self.children)
 
     def _evaluate_for_shape(self):
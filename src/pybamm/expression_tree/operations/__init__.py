@@ -1,2 +1,2 @@
 __all__ = ['convert_to_casadi', 'evaluate_python', 'jacobian', 'latexify',
-           'serialise', 'unpack_symbols']
+           'serialise', 'traversal', 'unpack_symbols']
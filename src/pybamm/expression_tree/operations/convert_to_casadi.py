@@ -15,6 +15,12 @@ class CasadiConverter:
 
         pybamm.citations.register("Andersson2019")
 
+    @property
+    def n_converted(self):
+        """The number of symbols that have been converted, and are reused by later
+        conversions."""
+        return len(self._casadi_symbols)
+
     def convert(
         self,
         symbol: pybamm.Symbol,
@@ -24,7 +30,7 @@ class CasadiConverter:
         inputs: dict | None,
     ) -> casadi.MX:
         """
-        This function recurses down the tree, converting the PyBaMM expression tree to
+        This function walks through the tree, converting the PyBaMM expression tree to
         a CasADi expression tree
 
         Parameters
@@ -48,12 +54,17 @@ class CasadiConverter:
         try:
             return self._casadi_symbols[symbol]
         except KeyError:
-            # Change inputs to empty dictionary if it's None
-            inputs = inputs or {}
-            casadi_symbol = self._convert(symbol, t, y, y_dot, inputs)
-            self._casadi_symbols[symbol] = casadi_symbol
-
-            return casadi_symbol
+            pass
+        # Change inputs to empty dictionary if it's None
+        inputs = inputs or {}
+        # Walk the tree with an explicit stack rather than recursively, so that deep
+        # trees do not hit the recursion limit. The children of each symbol are then
+        # already converted when the symbol is converted
+        for node in pybamm.post_order(
+            symbol, known=self._casadi_symbols, expand=pybamm.operates_on_children
+        ):
+            self._casadi_symbols[node] = self._convert(node, t, y, y_dot, inputs)
+        return self._casadi_symbols[symbol]
 
     def _convert(self, symbol, t, y, y_dot, inputs):
         """See :meth:`CasadiConverter.convert()`."""
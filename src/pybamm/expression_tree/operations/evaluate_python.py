@@ -306,6 +306,14 @@ def find_symbols(
             if len(children_vars) == 1:
                 symbol_str = children_vars[0]
             else:
+                # some children, e.g. pybamm.min, evaluate to a number, so make
+                # them columns before concatenating
+                children_vars = [
+                    f"np.reshape({child_var}, (1, 1))"
+                    if child.shape == ()
+                    else child_var
+                    for child, child_var in zip(symbol.children, children_vars)
+                ]
                 symbol_str = "np.concatenate(({}))".format(",".join(children_vars))
 
         elif isinstance(symbol, pybamm.SparseStack):
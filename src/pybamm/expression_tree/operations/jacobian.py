@@ -29,7 +29,7 @@ class Jacobian:
 
     def jac(self, symbol: pybamm.Symbol, variable: pybamm.Symbol) -> pybamm.Symbol:
         """
-        This function recurses down the tree, computing the Jacobian using
+        This function walks through the tree, computing the Jacobian using
         the Jacobians defined in classes derived from pybamm.Symbol. E.g. the
         Jacobian of a 'pybamm.Multiplication' is computed via the product rule.
         If the Jacobian of a symbol has already been calculated, the stored value
@@ -53,9 +53,15 @@ class Jacobian:
         try:
             return self._known_jacs[symbol]
         except KeyError:
-            jac = self._jac(symbol, variable)
-            self._known_jacs[symbol] = jac
-            return jac
+            pass
+        # Walk the tree with an explicit stack rather than recursively, so that deep
+        # trees do not hit the recursion limit. The Jacobians of the children are
+        # then known when the Jacobian of each symbol is calculated
+        for node in pybamm.post_order(
+            symbol, known=self._known_jacs, expand=pybamm.operates_on_children
+        ):
+            self._known_jacs[node] = self._jac(node, variable)
+        return self._known_jacs[symbol]
 
     def _jac(self, symbol: pybamm.Symbol, variable: pybamm.Symbol):
         """See :meth:`Jacobian.jac()`."""
@@ -6,14 +6,22 @@ import json
 import importlib
 import numpy as np
 import re
+import zipfile
+from scipy.sparse import issparse
 
 
 class Serialise:
     """
-    Converts a discretised model to and from a JSON file.
+    Converts a discretised model to and from a JSON file, or a binary (``.npz``)
+    file.
 
     """
 
+    # version of the binary format, see `save_model`
+    BINARY_FORMAT_VERSION = 1
+    # numeric lists with fewer entries than this are kept in the binary file header
+    _BINARY_BUFFER_MIN_SIZE = 16
+
     def __init__(self):
         pass
 
@@ -67,6 +75,94 @@ class Serialise:
             node_dict["json"] = json.JSONEncoder.default(self, node)  # pragma: no cover
             return node_dict  # pragma: no cover
 
+    class _NodeTable:
+        """
+        Converts PyBaMM symbols and events into a table of unique nodes, for the
+        binary format. Each node refers to its children by their index in the table,
+        and its (large) arrays are stored as separate, raw buffers.
+        """
+
+        def __init__(self):
+            self.nodes = []
+            self.buffers = []
+            self._indices = {}
+
+        def add(self, node) -> int:
+            """Add a node and its children to the table, and return its index"""
+            if isinstance(node, pybamm.Symbol):
+                # symbols with the same id are equal, so are only stored once
+                key = (type(node), node.id)
+            else:
+                key = (type(node), id(node))
+            index = self._indices.get(key)
+            if index is not None:
+                return index
+
+            node_dict = {"py/object": str(type(node))[8:-2]}
+            if isinstance(node, pybamm.Array):
+                # avoid converting the entries to lists, as in `Array.to_json`
+                node_dict.update(
+                    {
+                        "name": node.name,
+                        "domains": node.domains,
+                        "entries": self.pack_array(node.entries),
+                    }
+                )
+            else:
+                node_dict.update(self.pack(node.to_json()))
+            if isinstance(node, pybamm.Symbol):
+                node_dict["children"] = [self.add(c) for c in node.children]
+                if hasattr(node, "initial_condition"):  # for ExplicitTimeIntegral
+                    node_dict["initial_condition"] = self.add(node.initial_condition)
+            elif isinstance(node, pybamm.Event):
+                node_dict["expression"] = self.add(node._expression)
+            else:
+                raise TypeError(  # pragma: no cover
+                    f"Cannot serialise object of type {type(node)}"
+                )
+
+            index = len(self.nodes)
+            self.nodes.append(node_dict)
+            self._indices[key] = index
+            return index
+
+        def pack_array(self, entries):
+            """Store dense or sparse array entries as raw buffers"""
+            if issparse(entries):
+                entries = entries.tocsr()
+                return {
+                    "shape": list(entries.shape),
+                    "data": self._add_buffer(entries.data),
+                    "row_indices": self._add_buffer(entries.indices),
+                    "column_pointers": self._add_buffer(entries.indptr),
+                }
+            entries = np.asarray(entries)
+            if entries.size < Serialise._BINARY_BUFFER_MIN_SIZE:
+                return entries.tolist()
+            return self._add_buffer(entries)
+
+        def pack(self, obj):
+            """Replace the long numeric lists in a JSON-serialisable object"""
+            if isinstance(obj, dict):
+                return {k: self.pack(v) for k, v in obj.items()}
+            if isinstance(obj, (list, tuple)):
+                if len(obj) >= Serialise._BINARY_BUFFER_MIN_SIZE:
+                    try:
+                        array = np.asarray(obj)
+                    except ValueError:  # ragged nested lists
+                        array = None
+                    if array is not None and array.dtype.kind in "biuf":
+                        return self._add_buffer(array, as_list=True)
+                return [self.pack(v) for v in obj]
+            return obj
+
+        def _add_buffer(self, array, as_list=False):
+            self.buffers.append(array)
+            buffer = {"py/buffer": len(self.buffers) - 1}
+            if as_list:
+                buffer["list"] = True
+            return buffer
+
     class _Empty:
         """A dummy class to aid deserialisation"""
 
@@ -83,12 +179,19 @@ class Serialise:
         mesh: pybamm.Mesh | None = None,
         variables: pybamm.FuzzyDict | None = None,
         filename: str | None = None,
+        binary: bool = False,
     ):
-        """Saves a discretised model to a JSON file.
+        """Saves a discretised model to a JSON file, or a binary file.
 
         As the model is discretised and ready to solve, only the right hand side,
         algebraic and initial condition variables are saved.
 
+        The binary format is a NumPy ``.npz`` archive, which is smaller and faster
+        to write and read than JSON for large models. Each unique node of the
+        expression trees is only stored once, in a table in the (JSON) header of the
+        archive, and the entries of the vectors and matrices of the model are stored
+        as raw arrays rather than as lists of numbers.
+
         Parameters
         ----------
         model : :class:`pybamm.BaseModel`
@@ -100,14 +203,23 @@ class Serialise:
             The discretised model varaibles. Not necessary to solve a model, but
             required to use pybamm's plotting tools.
         filename: str (optional)
-            The desired name of the JSON file. If no name is provided, one will be
-            created based on the model name, and the current datetime.
+            The desired name of the file, without the extension (".json", or ".npz"
+            for the binary format). If no name is provided, one will be created based
+            on the model name, and the current datetime.
+        binary: bool (optional)
+            Whether to save the model in the binary format. Default is False.
         """
         if model.is_discretised is False:
             raise NotImplementedError(
                 "PyBaMM can only serialise a discretised, ready-to-solve model."
             )
 
+        if binary:
+            node_table = self._NodeTable()
+            encode = node_table.add
+        else:
+            encode = self._SymbolEncoder().default
+
         model_json = {
             "py/object": str(type(model))[8:-2],
             "py/id": id(model),
@@ -115,33 +227,46 @@ class Serialise:
             "name": model.name,
             "options": model.options,
             "bounds": [bound.tolist() for bound in model.bounds],  # type: ignore[attr-defined]
-            "concatenated_rhs": self._SymbolEncoder().default(model._concatenated_rhs),
-            "concatenated_algebraic": self._SymbolEncoder().default(
-                model._concatenated_algebraic
-            ),
-            "concatenated_initial_conditions": self._SymbolEncoder().default(
+            "concatenated_rhs": encode(model._concatenated_rhs),
+            "concatenated_algebraic": encode(model._concatenated_algebraic),
+            "concatenated_initial_conditions": encode(
                 model._concatenated_initial_conditions
             ),
-            "events": [self._SymbolEncoder().default(event) for event in model.events],
-            "mass_matrix": self._SymbolEncoder().default(model.mass_matrix),
-            "mass_matrix_inv": self._SymbolEncoder().default(model.mass_matrix_inv),
+            "events": [encode(event) for event in model.events],
+            "mass_matrix": encode(model.mass_matrix),
+            "mass_matrix_inv": encode(model.mass_matrix_inv),
         }
 
         if mesh:
             model_json["mesh"] = self._MeshEncoder().default(mesh)
+            if binary:
+                model_json["mesh"] = node_table.pack(model_json["mesh"])
 
         if variables:
             if model._geometry:
                 model_json["geometry"] = self._deconstruct_pybamm_dicts(model._geometry)
-            model_json["variables"] = {
-                k: self._SymbolEncoder().default(v) for k, v in dict(variables).items()
-            }
+            model_json["variables"] = {k: encode(v) for k, v in dict(variables).items()}
 
         if filename is None:
             filename = model.name + "_" + datetime.now().strftime("%Y_%m_%d-%p%I_%M")
 
-        with open(filename + ".json", "w") as f:
-            json.dump(model_json, f)
+        if binary:
+            model_json["binary_format_version"] = self.BINARY_FORMAT_VERSION
+            model_json["nodes"] = node_table.nodes
+            model_json["number_of_buffers"] = len(node_table.buffers)
+            header = np.frombuffer(json.dumps(model_json).encode(), dtype=np.uint8)
+            with open(filename + ".npz", "wb") as f:
+                np.savez(
+                    f,
+                    header=header,
+                    **{
+                        f"buffer_{i}": buffer
+                        for i, buffer in enumerate(node_table.buffers)
+                    },
+                )
+        else:
+            with open(filename + ".json", "w") as f:
+                json.dump(model_json, f)
 
     def load_model(
         self, filename: str, battery_model: pybamm.BaseModel | None = None
@@ -153,7 +278,7 @@ class Serialise:
         and the results plotted as usual.
 
         Currently only available for pybamm models which have previously been written
-        out using the `save_model()` option.
+        out using the `save_model()` option, in either the JSON or the binary format.
 
         Warning: This only loads in discretised models. If you wish to make edits to the
         model or initial conditions, a new model will need to be constructed seperately.
@@ -162,7 +287,7 @@ class Serialise:
         ----------
 
         filename: str
-            Path to the JSON file containing the serialised model file
+            Path to the JSON (or binary) file containing the serialised model file
         battery_model:  :class:`pybamm.BaseModel` (optional)
             PyBaMM model to be created (e.g. pybamm.lithium_ion.SPM), which will
             override any model names within the file. If None, the function will look
@@ -175,30 +300,26 @@ class Serialise:
             `battery_model`.
         """
 
-        with open(filename) as f:
-            model_data = json.load(f)
+        if zipfile.is_zipfile(filename):
+            model_data, nodes = self._read_binary_model(filename)
+            reconstruct = nodes.__getitem__
+        else:
+            with open(filename) as f:
+                model_data = json.load(f)
+            reconstruct = self._reconstruct_expression_tree
 
         recon_model_dict = {
             "name": model_data["name"],
             "options": self._convert_options(model_data["options"]),
             "bounds": tuple(np.array(bound) for bound in model_data["bounds"]),
-            "concatenated_rhs": self._reconstruct_expression_tree(
-                model_data["concatenated_rhs"]
-            ),
-            "concatenated_algebraic": self._reconstruct_expression_tree(
-                model_data["concatenated_algebraic"]
-            ),
-            "concatenated_initial_conditions": self._reconstruct_expression_tree(
+            "concatenated_rhs": reconstruct(model_data["concatenated_rhs"]),
+            "concatenated_algebraic": reconstruct(model_data["concatenated_algebraic"]),
+            "concatenated_initial_conditions": reconstruct(
                 model_data["concatenated_initial_conditions"]
             ),
-            "events": [
-                self._reconstruct_expression_tree(event)
-                for event in model_data["events"]
-            ],
-            "mass_matrix": self._reconstruct_expression_tree(model_data["mass_matrix"]),
-            "mass_matrix_inv": self._reconstruct_expression_tree(
-                model_data["mass_matrix_inv"]
-            ),
+            "events": [reconstruct(event) for event in model_data["events"]],
+            "mass_matrix": reconstruct(model_data["mass_matrix"]),
+            "mass_matrix_inv": reconstruct(model_data["mass_matrix_inv"]),
         }
 
         recon_model_dict["geometry"] = (
@@ -214,10 +335,7 @@ class Serialise:
         )
 
         recon_model_dict["variables"] = (
-            {
-                k: self._reconstruct_expression_tree(v)
-                for k, v in model_data["variables"].items()
-            }
+            {k: reconstruct(v) for k, v in model_data["variables"].items()}
             if "variables" in model_data.keys()
             else None
         )
@@ -237,6 +355,48 @@ class Serialise:
 
     # Helper functions
 
+    def _read_binary_model(self, filename: str):
+        """
+        Read a model saved in the binary format, returning the model data (in which
+        the expression trees are given by their index in the node table) and the
+        reconstructed nodes.
+        """
+        with np.load(filename, allow_pickle=False) as data:
+            model_data = json.loads(data["header"].tobytes())
+            version = model_data.get("binary_format_version")
+            if version != self.BINARY_FORMAT_VERSION:
+                raise ValueError(f"Unsupported binary model format version {version}")
+            buffers = [
+                data[f"buffer_{i}"] for i in range(model_data["number_of_buffers"])
+            ]
+
+        def unpack(obj):
+            if isinstance(obj, dict):
+                if "py/buffer" in obj:
+                    buffer = buffers[obj["py/buffer"]]
+                    return buffer.tolist() if obj.get("list") else buffer
+                return {k: unpack(v) for k, v in obj.items()}
+            if isinstance(obj, list):
+                return [unpack(v) for v in obj]
+            return obj
+
+        # the children of each node come before it in the table
+        nodes = []
+        for node in model_data.pop("nodes"):
+            node = unpack(node)
+            if "children" in node:
+                node["children"] = [nodes[i] for i in node["children"]]
+                if "initial_condition" in node:
+                    node["initial_condition"] = nodes[node["initial_condition"]]
+            elif "expression" in node:
+                node["expression"] = nodes[node["expression"]]
+            nodes.append(self._reconstruct_symbol(node))
+
+        if "mesh" in model_data:
+            model_data["mesh"] = unpack(model_data["mesh"])
+
+        return model_data, nodes
+
     def _get_pybamm_class(self, snippet: dict):
         """Find a pybamm class to initialise from object path"""
         parts = snippet["py/object"].split(".")
@@ -244,6 +404,10 @@ class Serialise:
 
         class_ = getattr(module, parts[-1])
 
+        if issubclass(class_, pybamm.Symbol):
+            # Symbols have slots, so a dummy object cannot take their class
+            return class_.__new__(class_)
+
         try:
             empty_class = self._Empty()
             empty_class.__class__ = class_
@@ -0,0 +1,88 @@
+#
+# Helper class to share structurally equal symbols
+#
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pybamm
+
+
+class SymbolInterner:
+    """
+    Helper class to make structurally equal symbols shared objects ("interning").
+
+    The symbols are keyed on their :attr:`pybamm.Symbol.id`, which is a hash of
+    their structure. Interning each new symbol after its children have been interned
+    (e.g. in :meth:`pybamm.ParameterValues.process_symbol` and
+    :meth:`pybamm.Discretisation.process_symbol`) makes the expression trees a
+    graph in which each distinct subtree is a single object, however many
+    expressions it appears in. This reduces the memory used by the expression trees
+    and the time spent converting them, e.g. with :class:`pybamm.CasadiConverter`.
+
+    Attributes
+    ----------
+    hits : int
+        The number of symbols that were replaced by an equal, existing symbol.
+    misses : int
+        The number of symbols that were added to the table.
+    """
+
+    def __init__(self):
+        self._symbols: dict[int, pybamm.Symbol] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (
+            f"SymbolInterner(size={len(self)}, hits={self.hits}, misses={self.misses})"
+        )
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def intern(self, symbol: pybamm.Symbol) -> pybamm.Symbol:
+        """
+        Return the symbol in the table that is equal to `symbol`, adding `symbol` to
+        the table if there is none.
+
+        Parameters
+        ----------
+        symbol : :class:`pybamm.Symbol`
+            The symbol to intern
+
+        Returns
+        -------
+        :class:`pybamm.Symbol`
+            A symbol equal to `symbol`
+        """
+        key = symbol.id
+        existing = self._symbols.get(key)
+        # the existing symbol is not used if it has been modified since it was added
+        if (
+            existing is not None
+            and existing.id == key
+            and type(existing) is type(symbol)
+        ):
+            if existing is not symbol:
+                self.hits += 1
+            return existing
+        self._symbols[key] = symbol
+        self.misses += 1
+        return symbol
+
+    @property
+    def node_count_reduction(self) -> float:
+        """
+        The fraction of the (distinct) symbols passed to :meth:`intern` that were
+        replaced by an equal, existing symbol, i.e. the fraction by which interning
+        reduced the number of nodes created.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """Remove all the symbols from the table and reset the counters."""
+        self._symbols.clear()
+        self.hits = 0
+        self.misses = 0
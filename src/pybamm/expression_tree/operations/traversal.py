@@ -0,0 +1,71 @@
+#
+# Iterative traversal of expression trees
+#
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable
+from collections.abc import Container, Iterator
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pybamm
+
+
+def post_order(
+    symbol: pybamm.Symbol,
+    known: Container | None = None,
+    expand: Callable[[pybamm.Symbol], bool] | None = None,
+) -> Iterator[pybamm.Symbol]:
+    """
+    Step through an expression tree in post-order fashion, i.e. each node is
+    returned after all of its children. The tree is walked with an explicit stack
+    rather than by recursion, so that passes over the tree (e.g.
+    :meth:`pybamm.Symbol.evaluate`, :class:`pybamm.Jacobian`,
+    :class:`pybamm.CasadiConverter`, :meth:`pybamm.ParameterValues.process_symbol`
+    and :meth:`pybamm.Discretisation.process_symbol`) are not limited by the
+    recursion limit on deep trees.
+
+    Each node object is returned once, even if it appears several times in the
+    tree. The iterator is lazy, so a pass can fill its memo table (`known`) with
+    the nodes it has been given, and the subtrees of these nodes are then skipped.
+
+    Parameters
+    ----------
+    symbol : :class:`pybamm.Symbol`
+        The root of the tree to step through
+    known : container, optional
+        Nodes that have already been handled by the pass (e.g. its memo table).
+        These nodes, and their children, are not returned.
+    expand : callable, optional
+        Function that returns whether the children of a node should be returned
+        before the node. Nodes whose children are not expanded are handled by the
+        pass themselves. By default, the children of all nodes are expanded.
+
+    Examples
+    --------
+
+    >>> a = pybamm.Symbol('a')
+    >>> b = pybamm.Symbol('b')
+    >>> for node in pybamm.post_order(a * b):
+    ...     print(node.name)
+    a
+    b
+    *
+    """
+    if known is None:
+        known = ()
+    seen = set()
+    # each entry is a node and whether its children have already been returned
+    stack = [(symbol, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            # a pass may have handled the node while handling its children
+            if node not in known:
+                yield node
+            continue
+        if id(node) in seen or node in known:
+            continue
+        seen.add(id(node))
+        stack.append((node, True))
+        if expand is None or expand(node):
+            # push the children in reverse so that they are returned in order
+            stack.extend((child, False) for child in reversed(node.children))
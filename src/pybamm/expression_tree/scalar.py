@@ -24,6 +24,8 @@ class Scalar(pybamm.Symbol):
 
     """
 
+    __slots__ = ("_value",)
+
     def __init__(
         self,
         value: Numeric,
@@ -34,6 +34,8 @@ class StateVectorBase(pybamm.Symbol):
         evaluation_array is computed from y_slices.
     """
 
+    __slots__ = ("_y_slices", "_first_point", "_last_point", "_evaluation_array")
+
     def __init__(
         self,
         *y_slices: slice,
@@ -3,12 +3,12 @@
 #
 from __future__ import annotations
 import numbers
+import sys
 import warnings
 
 import numpy as np
 import sympy
 from scipy.sparse import csr_matrix, issparse
-from functools import cached_property
 from typing import TYPE_CHECKING, cast
 from collections.abc import Sequence
 
@@ -27,7 +27,69 @@ if TYPE_CHECKING:  # pragma: no cover
     )
 
 DOMAIN_LEVELS = ["primary", "secondary", "tertiary", "quaternary"]
-EMPTY_DOMAINS: dict[str, list] = {k: [] for k in DOMAIN_LEVELS}
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError(
+        "Symbol domains are shared between symbols and cannot be modified in place, "
+        "set symbol.domains instead"
+    )
+
+
+class _DomainList(list):
+    """
+    A list of domain names that cannot be modified in place, so that it can be
+    shared between symbols. It compares equal to the corresponding list.
+    """
+
+    __slots__ = ()
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __reduce__(self):
+        return (_DomainList, (list(self),))
+
+
+class _Domains(dict):
+    """
+    A dictionary of domains that cannot be modified in place, so that it can be
+    shared between symbols. Copying or unpickling it gives the shared dictionary.
+    """
+
+    __slots__ = ()
+
+    pop = popitem = clear = update = setdefault = _read_only
+    __setitem__ = __delitem__ = __ior__ = _read_only
+
+    def __reduce__(self):
+        return (_share_domains, (dict(self),))
+
+
+EMPTY_DOMAINS: dict[str, list] = _Domains(
+    {level: _DomainList() for level in DOMAIN_LEVELS}
+)
+# The distinct domains of symbols, so that symbols with the same domains share one
+# dictionary. Like EMPTY_DOMAINS, these dictionaries cannot be modified in place
+_SHARED_DOMAINS: dict[tuple, dict[str, list]] = {
+    tuple(() for _ in DOMAIN_LEVELS): EMPTY_DOMAINS
+}
+
+
+def _share_domains(domains: dict[str, list]) -> dict[str, list]:
+    """
+    Utility function to get the shared dictionary equal to a (complete) dictionary
+    of domains
+    """
+    key = tuple(tuple(domains[level]) for level in DOMAIN_LEVELS)
+    try:
+        return _SHARED_DOMAINS[key]
+    except KeyError:
+        shared = _Domains(
+            {level: _DomainList(dom) for level, dom in zip(DOMAIN_LEVELS, key)}
+        )
+        _SHARED_DOMAINS[key] = shared
+        return shared
 
 
 def domain_size(domain: list[str] | str):
@@ -186,6 +248,31 @@ def simplify_if_constant(symbol: pybamm.Symbol):
     return symbol
 
 
+def operates_on_children(symbol: pybamm.Symbol):
+    """
+    Utility function to test if a symbol is an operation on its children (a binary
+    or unary operator, function or concatenation), i.e. if evaluating, converting or
+    differentiating the symbol uses the results for its children
+    """
+    return isinstance(
+        symbol,
+        (
+            pybamm.BinaryOperator,
+            pybamm.UnaryOperator,
+            pybamm.Function,
+            pybamm.Concatenation,
+        ),
+    )
+
+
+def _overrides_evaluate(symbol: pybamm.Symbol):
+    """
+    Whether the class of a symbol overrides :meth:`Symbol.evaluate`, rather than
+    :meth:`Symbol._evaluate_node`, e.g. a custom operator
+    """
+    return type(symbol).evaluate is not Symbol.evaluate
+
+
 class Symbol:
     """
     Base node class for the expression tree.
@@ -215,6 +302,29 @@ class Symbol:
         deprecated.
     """
 
+    # Expression trees can have hundreds of thousands of nodes, so the attributes
+    # common to all symbols are kept in slots. Attributes specific to a class, or
+    # set by users, are kept in the instance dictionary, which is only created when
+    # such an attribute is set
+    __slots__ = (
+        "_name",
+        "_children",
+        "_orphans",
+        "_domains",
+        "_id",
+        "_saved_evaluates_on_edges",
+        "_saved_evaluate_for_shape",
+        "_saved_shape",
+        "_saved_size",
+        "_saved_is_constant",
+        "_print_name",
+        "_raw_print_name",
+        "mesh",
+        "secondary_mesh",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         name: str,
@@ -245,7 +355,7 @@ class Symbol:
             if not any(
                 issubclass(pybamm.Symbol, type(x))
                 or issubclass(pybamm.BinaryOperator, type(x))
-                for x in self.pre_order()
+                for x in pybamm.post_order(self)
             ):
                 self.test_shape()
 
@@ -284,7 +394,8 @@ class Symbol:
     def name(self, value: str):
         if not isinstance(value, str):
             raise TypeError(f"{value} must be of type str")
-        self._name = value
+        # many symbols have the same name, e.g. "+" or the name of a parameter
+        self._name = sys.intern(str(value))
 
     @property
     def domains(self):
@@ -332,7 +443,7 @@ class Symbol:
                 # don't test further if we have already found a missing domain
                 break
 
-        self._domains = domains
+        self._domains = _share_domains(domains)
         self.set_id()
 
     @property
@@ -788,6 +899,29 @@ class Symbol:
             f"{self!s} of type {type(self)}"
         )
 
+    def _evaluate_node(
+        self,
+        children_eval: list,
+        t: float | None = None,
+        y: np.ndarray | None = None,
+        y_dot: np.ndarray | None = None,
+        inputs: dict | str | None = None,
+    ):
+        """
+        Evaluate this node, given the values of its children. Nodes without
+        children are evaluated with :meth:`Symbol._base_evaluate()`, and operators
+        apply their operation (e.g. :meth:`pybamm.BinaryOperator._binary_evaluate()`)
+        to the values of their children.
+
+        Parameters
+        ----------
+        children_eval : list
+            The values of the children of the node
+        t, y, y_dot, inputs
+            See :meth:`Symbol.evaluate()`
+        """
+        return self._base_evaluate(t, y, y_dot, inputs)
+
     def evaluate(
         self,
         t: float | None = None,
@@ -814,7 +948,29 @@ class Symbol:
         number or array
             the node evaluated at (t,y)
         """
-        return self._base_evaluate(t, y, y_dot, inputs)
+        if not self.children:
+            return self._evaluate_node([], t, y, y_dot, inputs)
+
+        # Symbols whose class overrides `evaluate` are evaluated with their own
+        # method, rather than from the values of their children
+        def expand(node):
+            return operates_on_children(node) and (
+                node is self or not _overrides_evaluate(node)
+            )
+
+        # Walk the tree with an explicit stack rather than recursively, so that deep
+        # trees do not hit the recursion limit, evaluating each node once
+        values = {}
+        for node in pybamm.post_order(self, expand=expand):
+            if node is not self and _overrides_evaluate(node):
+                values[id(node)] = node.evaluate(t, y, y_dot, inputs)
+                continue
+            if operates_on_children(node):
+                children_eval = [values[id(child)] for child in node.children]
+            else:
+                children_eval = []
+            values[id(node)] = node._evaluate_node(children_eval, t, y, y_dot, inputs)
+        return values[id(self)]
 
     def evaluate_for_shape(self):
         """
@@ -843,6 +999,31 @@ class Symbol:
         --------
         evaluate : evaluate the expression
         """
+        if not operates_on_children(self):
+            return self._is_constant()
+        try:
+            return self._saved_is_constant
+        except AttributeError:
+            pass
+
+        def expand(node):
+            return operates_on_children(node) and not hasattr(
+                node, "_saved_is_constant"
+            )
+
+        # Walk the tree with an explicit stack rather than recursively, so that deep
+        # trees do not hit the recursion limit. The result is saved for each
+        # operator, so the children of an operator are known when it is reached
+        for node in pybamm.post_order(self, expand=expand):
+            if expand(node):
+                node._saved_is_constant = node._is_constant()
+        return self._saved_is_constant
+
+    def _is_constant(self):
+        """
+        See :meth:`Symbol.is_constant()`. Operators find whether they are constant
+        from their children, whose results are already saved.
+        """
         # Default behaviour is False
         return False
 
@@ -998,18 +1179,30 @@ class Symbol:
         )
         return self.create_copy(new_children, perform_simplifications)
 
-    @cached_property
+    @property
     def size(self):
         """
         Size of an object, found by evaluating it with appropriate t and y
         """
-        return np.prod(self.shape)
+        try:
+            return self._saved_size
+        except AttributeError:
+            self._saved_size = np.prod(self.shape)
+            return self._saved_size
 
-    @cached_property
+    @property
     def shape(self):
         """
         Shape of an object, found by evaluating it with appropriate t and y.
         """
+        try:
+            return self._saved_shape
+        except AttributeError:
+            self._saved_shape = self._shape()
+            return self._saved_shape
+
+    def _shape(self):
+        """See :meth:`Symbol.shape`"""
         # Default behaviour is to try to evaluate the object directly
         # Try with some large y, to avoid having to unpack (slow)
         try:
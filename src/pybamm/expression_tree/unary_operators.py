@@ -28,6 +28,8 @@ class UnaryOperator(pybamm.Symbol):
         A dictionary equivalent to {'primary': domain, auxiliary_domains}.
     """
 
+    __slots__ = ("child",)
+
     def __init__(
         self,
         name: str,
@@ -90,16 +92,16 @@ class UnaryOperator(pybamm.Symbol):
             f"{self.__class__} does not implement _unary_evaluate."
         )
 
-    def evaluate(
+    def _evaluate_node(
         self,
+        children_eval: list,
         t: float | None = None,
         y: np.ndarray | None = None,
         y_dot: np.ndarray | None = None,
         inputs: dict | str | None = None,
     ):
-        """See :meth:`pybamm.Symbol.evaluate()`."""
-        child = self.child.evaluate(t, y, y_dot, inputs)
-        return self._unary_evaluate(child)
+        """See :meth:`pybamm.Symbol._evaluate_node()`."""
+        return self._unary_evaluate(children_eval[0])
 
     def _evaluate_for_shape(self):
         """
@@ -112,8 +114,8 @@ class UnaryOperator(pybamm.Symbol):
         """See :meth:`pybamm.Symbol._evaluates_on_edges()`."""
         return self.child.evaluates_on_edges(dimension)
 
-    def is_constant(self):
-        """See :meth:`pybamm.Symbol.is_constant()`."""
+    def _is_constant(self):
+        """See :meth:`pybamm.Symbol._is_constant()`."""
         return self.child.is_constant()
 
     def _sympy_operator(self, child):
@@ -1088,7 +1090,7 @@ class ExplicitTimeIntegral(UnaryOperator):
     def _unary_new_copy(self, child, perform_simplifications=True):
         return self.__class__(child, self.initial_condition)
 
-    def is_constant(self):
+    def _is_constant(self):
         return False
 
     def to_json(self):
@@ -1236,8 +1238,8 @@ class NotConstant(UnaryOperator):
         """See :meth:`UnaryOperator._unary_evaluate()`."""
         return child
 
-    def is_constant(self):
-        """See :meth:`pybamm.Symbol.is_constant()`."""
+    def _is_constant(self):
+        """See :meth:`pybamm.Symbol._is_constant()`."""
         # This symbol is not constant
         return False
 
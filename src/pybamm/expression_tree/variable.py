@@ -53,6 +53,8 @@ class VariableBase(pybamm.Symbol):
         Default is 0.
     """
 
+    __slots__ = ("_scale", "_reference", "_bounds")
+
     def __init__(
         self,
         name: str,
@@ -0,0 +1,495 @@
+#
+# ModelCache class
+#
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import numbers
+import os
+import re
+
+import numpy as np
+from scipy.sparse import issparse
+
+import pybamm
+from pybamm.expression_tree.operations.serialise import Serialise
+
+
+class ModelCache:
+    """
+    A content-addressed, on-disk cache of built (parameterised and discretised)
+    models, which can be passed to :class:`pybamm.Simulation` so that repeated builds
+    of the same configuration are replaced by a file load.
+
+    Each entry is keyed by a hash of the model (class, name, options and equations),
+    the parameter values, the geometry, the number of points, the submesh types, the
+    spatial methods and the discretisation keyword arguments. The discretised model
+    is stored using :meth:`pybamm.Serialise.save_model`, together with a small file
+    describing the layout of the state vector, which is required to update the
+    initial conditions of a cached model from a solution (e.g. between the steps of
+    an experiment).
+
+    Parameters
+    ----------
+    directory : str or path-like
+        The directory in which to store the cached models. It is created if it does
+        not exist.
+
+    Examples
+    --------
+    >>> cache = pybamm.ModelCache("pybamm_model_cache")  # doctest: +SKIP
+    >>> sim = pybamm.Simulation(pybamm.lithium_ion.DFN(), model_cache=cache)  # doctest: +SKIP
+    >>> sim.solve([0, 3600])  # doctest: +SKIP
+    """
+
+    def __init__(self, directory):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"ModelCache({self.directory!r}, hits={self.hits}, misses={self.misses})"
+
+    def key(
+        self,
+        model,
+        parameter_values,
+        geometry,
+        submesh_types,
+        var_pts,
+        spatial_methods,
+        discretisation_kwargs=None,
+        extra=None,
+    ):
+        """
+        Compute the cache key for a model built with the given settings.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The unprocessed model.
+        parameter_values : :class:`pybamm.ParameterValues`
+            The parameter values used to process the model.
+        geometry : :class:`pybamm.Geometry`
+            The geometry of the model. The geometry is not modified.
+        submesh_types : dict
+            The types of submesh to use on each subdomain.
+        var_pts : dict
+            The number of points used by each spatial variable.
+        spatial_methods : dict
+            The spatial method to use on each domain.
+        discretisation_kwargs : dict, optional
+            Any keyword arguments passed to :class:`pybamm.Discretisation`.
+        extra : optional
+            Any other (hashable by value) data that distinguishes the built model,
+            e.g. the experiment step that the model was processed for.
+
+        Returns
+        -------
+        str
+            The hexadecimal key of the cache entry.
+        """
+        # Normalise the settings in the same way as `pybamm.Mesh` and
+        # `pybamm.Discretisation` (which modify them inplace), so that the key is the
+        # same before and after building
+        geometry = _copy_dict(geometry)
+        parameter_values.process_geometry(geometry)
+        geometry = _copy_dict(
+            geometry,
+            lambda value: (
+                value.evaluate() if isinstance(value, pybamm.Symbol) else value
+            ),
+        )
+        submesh_types = {
+            domain: pybamm.MeshGenerator(submesh_type)
+            if isinstance(submesh_type, type)
+            and issubclass(submesh_type, pybamm.SubMesh)
+            else submesh_type
+            for domain, submesh_type in submesh_types.items()
+        }
+        spatial_methods = dict(spatial_methods)
+        if "macroscale" in spatial_methods:
+            for domain in ["negative electrode", "separator", "positive electrode"]:
+                spatial_methods[domain] = spatial_methods["macroscale"]
+        tokeniser = _Tokeniser()
+        tokeniser.update("pybamm", pybamm.__version__)
+        tokeniser.update("model", _model_summary(model))
+        tokeniser.update("parameter values", dict(parameter_values.items()))
+        tokeniser.update("geometry", geometry)
+        tokeniser.update("submesh types", submesh_types)
+        tokeniser.update("var pts", var_pts)
+        tokeniser.update("spatial methods", spatial_methods)
+        tokeniser.update("discretisation kwargs", discretisation_kwargs or {})
+        tokeniser.update("extra", extra)
+        return tokeniser.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key) + ".json") and os.path.exists(
+            self._path(key) + "_states.json"
+        )
+
+    def load(self, key):
+        """
+        Load a built model from the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the cache entry, as returned by :meth:`ModelCache.key`.
+
+        Returns
+        -------
+        :class:`pybamm.BaseModel` or None
+            The discretised model, or None if there is no (readable) entry for this
+            key.
+        """
+        if key not in self:
+            self.misses += 1
+            return None
+        try:
+            with open(self._path(key) + "_states.json") as f:
+                states = json.load(f)
+            model = Serialise().load_model(self._path(key) + ".json")
+            _set_states(model, states)
+        # the entry is unreadable, corrupt or was written by an incompatible version
+        except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+            pybamm.logger.warning(f"Could not load model '{key}' from the cache: {e}")
+            self.misses += 1
+            return None
+        model.name = states["name"]
+        self.hits += 1
+        pybamm.logger.info(f"Loaded model '{model.name}' from the cache")
+        return model
+
+    def save(self, key, model, mesh=None):
+        """
+        Save a built model to the cache. Models that cannot be serialised are not
+        cached, and a warning is logged.
+
+        Parameters
+        ----------
+        key : str
+            The key of the cache entry, as returned by :meth:`ModelCache.key`.
+        model : :class:`pybamm.BaseModel`
+            The discretised model.
+        mesh : :class:`pybamm.Mesh`, optional
+            The mesh the model has been discretised over, required to use the
+            plotting tools with the cached model.
+
+        Returns
+        -------
+        bool
+            Whether the model was saved.
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            Serialise().save_model(
+                model, mesh=mesh, variables=model.variables, filename=tmp_path
+            )
+            states = _get_states(model)
+            with open(tmp_path + "_states.json", "w") as f:
+                json.dump(states, f)
+        # the model (or some of its settings) cannot be serialised, or written
+        except (NotImplementedError, TypeError, OSError) as e:
+            for suffix in [".json", "_states.json"]:
+                if os.path.exists(tmp_path + suffix):
+                    os.remove(tmp_path + suffix)
+            pybamm.logger.warning(
+                f"Could not save model '{model.name}' to the cache: {e}"
+            )
+            return False
+        # Write the states file last, as it marks the entry as complete
+        os.replace(tmp_path + ".json", path + ".json")
+        os.replace(tmp_path + "_states.json", path + "_states.json")
+        return True
+
+    def clear(self):
+        """
+        Remove all the entries from the cache, including any temporary files left
+        by a save that was interrupted.
+        """
+        for filename in os.listdir(self.directory):
+            if _KEY_PATTERN.match(filename):
+                os.remove(os.path.join(self.directory, filename))
+
+
+# All the files written by the cache start with the (sha256) key of their entry
+_KEY_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def _copy_dict(dct, func=None):
+    """Copy a nested dictionary, optionally applying `func` to the values."""
+    return {
+        k: _copy_dict(v, func)
+        if isinstance(v, dict)
+        else (v if func is None else func(v))
+        for k, v in dct.items()
+    }
+
+
+def _model_summary(model):
+    """The parts of an unprocessed model that identify it for caching."""
+    return {
+        "class": f"{type(model).__module__}.{type(model).__qualname__}",
+        "name": model.name,
+        "options": getattr(model, "options", None),
+        "rhs": list(model.rhs.items()),
+        "algebraic": list(model.algebraic.items()),
+        "initial conditions": list(model.initial_conditions.items()),
+        "boundary conditions": [
+            (var, sorted(bcs.items())) for var, bcs in model.boundary_conditions.items()
+        ],
+        "events": [
+            (event.name, event.expression, event.event_type.name)
+            for event in model.events
+        ],
+        "variables": dict(model.variables),
+    }
+
+
+class _Tokeniser:
+    """
+    Hash arbitrary settings by value. Unlike :attr:`pybamm.Symbol.id`, the resulting
+    hash is stable across Python processes, so it can be used as a persistent key.
+    """
+
+    # Attributes that identify symbols which cannot be serialised to JSON
+    _symbol_attributes = [
+        "scale",
+        "reference",
+        "bounds",
+        "function",
+        "input_names",
+        "diff_variable",
+        "broadcast_domain",
+        "coord_sys",
+        "direction",
+        "side",
+        "slice",
+        "value",
+        "entries",
+    ]
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        # tokens of symbols, memoized by object identity to avoid re-hashing
+        # shared subtrees
+        self._symbol_tokens = {}
+        # ids of the functions being hashed, to stop at recursive references
+        self._functions_in_progress = set()
+
+    def update(self, *objs):
+        for obj in objs:
+            self._hash.update(self.token(obj).encode())
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+    def token(self, obj):
+        if obj is None or isinstance(obj, (bool, str)):
+            return f"{type(obj).__name__}:{obj!r}"
+        elif isinstance(obj, numbers.Integral):
+            return f"int:{int(obj)!r}"
+        elif isinstance(obj, numbers.Real):
+            return f"float:{float(obj)!r}"
+        elif isinstance(obj, numbers.Number):
+            return f"complex:{complex(obj)!r}"
+        elif isinstance(obj, pybamm.Symbol):
+            return self._symbol_token(obj)
+        elif isinstance(obj, np.ndarray):
+            data = np.ascontiguousarray(obj)
+            digest = hashlib.sha256(data.tobytes()).hexdigest()
+            return f"array:{data.dtype}:{data.shape}:{digest}"
+        elif issparse(obj):
+            obj = obj.tocsr()
+            digest = hashlib.sha256()
+            for data in [obj.data, obj.indices, obj.indptr]:
+                digest.update(np.ascontiguousarray(data).tobytes())
+            return f"sparse:{obj.dtype}:{obj.shape}:{digest.hexdigest()}"
+        elif isinstance(obj, dict):
+            items = sorted(
+                (self.token(key), self.token(value)) for key, value in obj.items()
+            )
+            return "{" + ",".join(f"{k}:{v}" for k, v in items) + "}"
+        elif isinstance(obj, (list, tuple)):
+            return f"{type(obj).__name__}(" + ",".join(map(self.token, obj)) + ")"
+        elif isinstance(obj, (set, frozenset)):
+            return "set(" + ",".join(sorted(map(self.token, obj))) + ")"
+        elif isinstance(obj, type):
+            return f"type:{obj.__module__}.{obj.__qualname__}"
+        elif isinstance(obj, pybamm.MeshGenerator):
+            return "MeshGenerator:" + self.token((obj.submesh_type, obj.submesh_params))
+        elif isinstance(obj, pybamm.SpatialMethod):
+            return f"{self.token(type(obj))}:{self.token(obj.options)}"
+        elif hasattr(obj, "__code__"):
+            return self._function_token(obj)
+        else:
+            return f"{type(obj).__module__}.{type(obj).__qualname__}:{obj!r}"
+
+    def _function_token(self, func):
+        """
+        Hash a function by its code and by the values it uses: its defaults, the
+        contents of its closure and the globals that its code refers to.
+        """
+        name = f"function:{func.__module__}.{func.__qualname__}"
+        if id(func) in self._functions_in_progress:
+            return name
+        self._functions_in_progress.add(id(func))
+        try:
+            code = hashlib.sha256(marshal.dumps(func.__code__)).hexdigest()
+            defaults = self.token(getattr(func, "__defaults__", None))
+            closure = self.token(
+                [
+                    _cell_contents(cell)
+                    for cell in getattr(func, "__closure__", None) or []
+                ]
+            )
+            func_globals = getattr(func, "__globals__", {})
+            referenced_globals = self.token(
+                {
+                    global_name: func_globals[global_name]
+                    for global_name in _global_names(func.__code__)
+                    if global_name in func_globals
+                }
+            )
+        finally:
+            self._functions_in_progress.discard(id(func))
+        return f"{name}:{code}:{defaults}:{closure}:{referenced_globals}"
+
+    def _symbol_token(self, symbol):
+        try:
+            return self._symbol_tokens[id(symbol)][0]
+        except KeyError:
+            pass
+        if isinstance(symbol, pybamm.Array):
+            # hash the entries directly, rather than their JSON representation
+            attributes = {"entries": symbol.entries}
+        else:
+            try:
+                attributes = symbol.to_json()
+                attributes.pop("id", None)
+            except (NotImplementedError, AttributeError, TypeError):
+                attributes = {
+                    name: getattr(symbol, name)
+                    for name in self._symbol_attributes
+                    if _has_attribute(symbol, name)
+                    or _has_attribute(symbol, f"_{name}")
+                }
+        attributes["domains"] = symbol.domains
+        attributes["children"] = symbol.children
+        digest = hashlib.sha256(
+            (
+                f"{type(symbol).__qualname__}:{symbol.name!r}:" + self.token(attributes)
+            ).encode()
+        ).hexdigest()
+        # keep a reference to the symbol so that its id cannot be reused
+        self._symbol_tokens[id(symbol)] = (digest, symbol)
+        return digest
+
+
+def _has_attribute(obj, name):
+    """Whether an object stores an attribute, either in its __dict__ or a slot."""
+    if name in getattr(obj, "__dict__", {}):
+        return True
+    for cls in type(obj).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        if name in ((slots,) if isinstance(slots, str) else slots):
+            # slots that have not been assigned raise an AttributeError
+            return hasattr(obj, name)
+    return False
+
+
+def _cell_contents(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:
+        # empty cell
+        return None
+
+
+def _global_names(code):
+    """The names that a code object, or the code nested in it, may look up."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, type(code)):
+            names |= _global_names(const)
+    return names
+
+
+def _get_states(model):
+    """
+    Record the layout of the state vector of a discretised model, i.e. the
+    variables that have initial conditions and their slices.
+    """
+
+    def state(var):
+        if isinstance(var, pybamm.Concatenation):
+            return {
+                "name": var.name,
+                "children": [state(child) for child in var.orphans],
+            }
+        return {
+            "name": var.name,
+            "domains": var.domains,
+            "scale": np.asarray(var.scale.evaluate()).tolist(),
+            "reference": np.asarray(var.reference.evaluate()).tolist(),
+            "slices": [[s.start, s.stop] for s in model.y_slices[var]],
+        }
+
+    return {
+        "name": model.name,
+        "variables": [state(var) for var in model.initial_conditions],
+    }
+
+
+def _set_states(model, states):
+    """
+    Restore the initial conditions and slices of a discretised model loaded with
+    :meth:`pybamm.Serialise.load_model`, from the layout given by
+    :func:`_get_states`.
+    """
+
+    def to_symbol(value):
+        value = np.array(value)
+        if value.ndim == 0:
+            return pybamm.Scalar(value)
+        return pybamm.Vector(value)
+
+    y_slices = {}
+
+    def variable(state):
+        if "children" in state:
+            return pybamm.ConcatenationVariable(
+                *[variable(child) for child in state["children"]]
+            )
+        var = pybamm.Variable(
+            state["name"],
+            domains=state["domains"],
+            scale=to_symbol(state["scale"]),
+            reference=to_symbol(state["reference"]),
+        )
+        y_slices[var] = [slice(start, stop) for start, stop in state["slices"]]
+        return var
+
+    initial_conditions = {}
+    for state in states["variables"]:
+        var = variable(state)
+        if isinstance(var, pybamm.Concatenation):
+            y_slice = slice(
+                y_slices[var.children[0]][0].start,
+                y_slices[var.children[-1]][-1].stop,
+            )
+        else:
+            y_slice = y_slices[var][0]
+        initial_conditions[var] = pybamm.Index(
+            model.concatenated_initial_conditions, y_slice
+        )
+    model.y_slices = y_slices
+    model.initial_conditions = initial_conditions
@@ -1388,7 +1388,7 @@ class BaseModel:
 
         return disc_symbol
 
-    def save_model(self, filename=None, mesh=None, variables=None):
+    def save_model(self, filename=None, mesh=None, variables=None, binary=False):
         """
         Write out a discretised model to a JSON file
 
@@ -1397,6 +1397,9 @@ class BaseModel:
         filename: str, optional
         The desired name of the JSON file. If no name is provided, one will be created
         based on the model name, and the current datetime.
+        binary: bool, optional
+        Whether to write the model to a (smaller and faster to load) binary ".npz"
+        file instead, see :meth:`pybamm.Serialise.save_model`. Default is False.
         """
         if variables and not mesh:
             warnings.warn(
@@ -1408,17 +1411,19 @@ class BaseModel:
                 stacklevel=2,
             )
 
-        Serialise().save_model(self, filename=filename, mesh=mesh, variables=variables)
+        Serialise().save_model(
+            self, filename=filename, mesh=mesh, variables=variables, binary=binary
+        )
 
 
 def load_model(filename, battery_model: BaseModel | None = None):
     """
-    Load in a saved model from a JSON file
+    Load in a saved model from a JSON (or binary) file
 
     Parameters
     ----------
     filename: str
-        Path to the JSON file containing the serialised model file
+        Path to the JSON (or binary) file containing the serialised model file
     battery_model: :class: pybamm.BaseBatteryModel, optional
             PyBaMM model to be created (e.g. pybamm.lithium_ion.SPM), which will
             override any model names within the file. If None, the function will look
@@ -1514,7 +1514,7 @@ class BaseBatteryModel(pybamm.BaseModel):
         """
         pass
 
-    def save_model(self, filename=None, mesh=None, variables=None):
+    def save_model(self, filename=None, mesh=None, variables=None, binary=False):
         """
         Write out a discretised model to a JSON file
 
@@ -1523,10 +1523,15 @@ class BaseBatteryModel(pybamm.BaseModel):
         filename: str, optional
         The desired name of the JSON file. If no name is provided, one will be created
         based on the model name, and the current datetime.
+        binary: bool, optional
+        Whether to write the model to a (smaller and faster to load) binary ".npz"
+        file instead, see :meth:`pybamm.Serialise.save_model`. Default is False.
         """
         if variables and not mesh:
             raise ValueError(
                 "Serialisation: Please provide the mesh if variables are required"
             )
 
-        Serialise().save_model(self, filename=filename, mesh=mesh, variables=variables)
+        Serialise().save_model(
+            self, filename=filename, mesh=mesh, variables=variables, binary=binary
+        )
@@ -1,6 +1,8 @@
 #
 # A model to calculate electrode-specific SOH
 #
+import numbers
+import casadi
 import pybamm
 import numpy as np
 from functools import lru_cache
@@ -305,6 +307,9 @@ class ElectrodeSOHSolver:
 
         self.lims_ocp = self._get_lims_ocp()
         self.OCV_function = None
+        self._energy_integrands = {}
+        self._batch_functions = None
+        self._initial_soc_solvers = {}
         self._get_electrode_soh_sims_full = lru_cache()(
             self.__get_electrode_soh_sims_full
         )
@@ -375,6 +380,25 @@ class ElectrodeSOHSolver:
         return [x100_sim, x0_sim]
 
     def solve(self, inputs):
+        """
+        Solve the electrode SOH model. The built models are kept between calls, and
+        each solve starts from the previous solution.
+
+        Parameters
+        ----------
+        inputs : dict or list of dict
+            The inputs of the model ("Q_n", "Q_p" and "Q_Li" or "Q"). If a list is
+            given, all the problems are solved together with a single vectorised
+            call, and a list of results is returned.
+
+        Returns
+        -------
+        dict or list of dict
+            The value of each variable of the electrode SOH model.
+        """
+        if isinstance(inputs, list):
+            return self._solve_batch(inputs)
+
         ics = self._set_up_solve(inputs)
         try:
             sol = self._solve_full(inputs, ics)
@@ -388,15 +412,114 @@ class ElectrodeSOHSolver:
                 # if that didn't raise an error, raise the original error instead
                 raise split_error
 
-        sol_dict = {key: sol[key].data[0] for key in sol.all_models[0].variables.keys()}
+        # evaluate all the variables at once, if possible
+        variables = list(sol.all_models[0].variables.keys())
+        sol_dict = sol._evaluate_scalar_variables(variables, 0)
+        if sol_dict is None:
+            sol_dict = {key: sol[key].data[0] for key in variables}
 
-        # Calculate theoretical energy
+        self._add_theoretical_energy(sol_dict, inputs)
+        return sol_dict
+
+    def _add_theoretical_energy(self, sol_dict, inputs):
         # TODO: energy calc for MSMR
         if self.options["open-circuit potential"] != "MSMR":
             energy_inputs = {**sol_dict, **inputs}
             energy = self.theoretical_energy_integral(energy_inputs)
             sol_dict.update({"Maximum theoretical energy [W.h]": energy})
-        return sol_dict
+
+    def _get_batch_functions(self):
+        """
+        Create CasADi functions to solve the full electrode SOH model and evaluate its
+        variables for many inputs at once. Returns None if the model can't be solved
+        in this way.
+        """
+        if self._batch_functions is None:
+            sim = self._get_electrode_soh_sims_full()
+            sim.build()
+            model = sim.built_model
+            input_parameters = sorted(model.input_parameters, key=lambda p: p.name)
+            variables = list(model.variables.keys())
+            if any(model.variables[name].size != 1 for name in variables):
+                self._batch_functions = False
+                return None
+
+            t = casadi.MX(0)
+            y = casadi.MX.sym("y", model.len_alg)
+            inputs = {
+                p.name: casadi.MX.sym(p.name, p._expected_size)
+                for p in input_parameters
+            }
+            p = casadi.vertcat(*inputs.values())
+            residual = model.concatenated_algebraic.to_casadi(t, y, inputs=inputs)
+            variables_casadi = casadi.vertcat(
+                *[
+                    model.variables[name].to_casadi(t, y, inputs=inputs)
+                    for name in variables
+                ]
+            )
+            rootfinder = casadi.rootfinder(
+                "esoh",
+                "newton",
+                {"x": y, "p": p, "g": residual},
+                {"error_on_fail": False},
+            )
+            self._batch_functions = {
+                "input names": list(inputs.keys()),
+                "variables": variables,
+                "rootfinder": rootfinder,
+                "residual": casadi.Function("esoh_residual", [y, p], [residual]),
+                "evaluate": casadi.Function(
+                    "esoh_variables", [y, p], [variables_casadi]
+                ),
+            }
+        return self._batch_functions or None
+
+    def _solve_batch(self, all_inputs, tol=1e-6):
+        """
+        Solve the electrode SOH model for a list of inputs with a single vectorised
+        call, starting from the previous solution. Problems that don't converge in
+        this way are solved one by one with :meth:`ElectrodeSOHSolver.solve`.
+        """
+        if len(all_inputs) == 0:
+            return []
+        functions = self._get_batch_functions()
+        if functions is None:
+            return [self.solve(inputs) for inputs in all_inputs]
+
+        # warm start from the last solution (or from the stoichiometry limits)
+        model = self._get_electrode_soh_sims_full().built_model
+        model.set_initial_conditions_from(self._set_up_solve(all_inputs[0]))
+        y0 = model.concatenated_initial_conditions.evaluate(inputs=all_inputs[0])
+
+        n = len(all_inputs)
+        p = np.column_stack(
+            [
+                np.concatenate(
+                    [
+                        np.atleast_1d(np.asarray(inputs[name], dtype=float)).ravel()
+                        for name in functions["input names"]
+                    ]
+                )
+                for inputs in all_inputs
+            ]
+        )
+        y = functions["rootfinder"].map(n)(np.tile(y0, (1, n)), p)
+        residuals = functions["residual"].map(n)(y, p).full()
+        values = functions["evaluate"].map(n)(y, p).full()
+        converged = np.all(np.abs(residuals) < tol, axis=0) & np.all(
+            np.isfinite(values), axis=0
+        )
+
+        sol_dicts = []
+        for i, inputs in enumerate(all_inputs):
+            if converged[i]:
+                sol_dict = dict(zip(functions["variables"], values[:, i]))
+                self._add_theoretical_energy(sol_dict, inputs)
+            else:
+                sol_dict = self.solve(inputs)
+            sol_dicts.append(sol_dict)
+        return sol_dicts
 
     def _set_up_solve(self, inputs):
         # Try with full sim
@@ -648,11 +771,13 @@ class ElectrodeSOHSolver:
 
         Parameters
         ----------
-        initial_value : float
+        initial_value : float or str, or list of these
             Target initial value.
             If integer, interpreted as SOC, must be between 0 and 1.
             If string e.g. "4 V", interpreted as voltage,
             must be between V_min and V_max.
+            If a list (or array) of values is given, the minimum and maximum
+            stoichiometries are only calculated once for all the values.
         tol : float, optional
             The tolerance for the solver used to compute the initial stoichiometries.
             A lower value results in higher precision but may increase computation time.
@@ -664,14 +789,32 @@ class ElectrodeSOHSolver:
         -------
         x, y
             The initial stoichiometries that give the desired initial state of charge
+            (arrays if a list of values is given)
         """
-        parameter_values = self.parameter_values
         x_0, x_100, y_100, y_0 = self.get_min_max_stoichiometries(inputs=inputs)
+        stoichiometry_limits = {"x_0": x_0, "x_100": x_100, "y_100": y_100, "y_0": y_0}
+
+        if isinstance(initial_value, (list, np.ndarray)):
+            initial_soc = np.array(
+                [
+                    self._get_initial_soc(value, stoichiometry_limits, tol)
+                    for value in initial_value
+                ]
+            )
+        else:
+            initial_soc = self._get_initial_soc(
+                initial_value, stoichiometry_limits, tol
+            )
 
+        x = x_0 + initial_soc * (x_100 - x_0)
+        y = y_0 - initial_soc * (y_0 - y_100)
+
+        return x, y
+
+    def _get_initial_soc(self, initial_value, stoichiometry_limits, tol):
         if isinstance(initial_value, str) and initial_value.endswith("V"):
             V_init = float(initial_value[:-1])
-            V_min = parameter_values.evaluate(self.param.ocp_soc_0)
-            V_max = parameter_values.evaluate(self.param.ocp_soc_100)
+            V_min, V_max = self._get_voltage_limits()
 
             if not V_min <= V_init <= V_max:
                 raise ValueError(
@@ -680,6 +823,41 @@ class ElectrodeSOHSolver:
                 )
 
             # Solve simple model for initial soc based on target voltage
+            soc_model, solver = self._get_initial_soc_model(tol)
+            soc_inputs = {**stoichiometry_limits, "V_init": V_init}
+            initial_soc = solver.solve(soc_model, [0], inputs=soc_inputs)["soc"].data[0]
+        elif isinstance(initial_value, numbers.Real):
+            initial_soc = initial_value
+            if not 0 <= initial_soc <= 1:
+                raise ValueError("Initial SOC should be between 0 and 1")
+
+        else:
+            raise ValueError(
+                "Initial value must be a float between 0 and 1, "
+                "or a string ending in 'V'"
+            )
+        return initial_soc
+
+    def _get_voltage_limits(self):
+        V_min = self.parameter_values.evaluate(self.param.ocp_soc_0)
+        V_max = self.parameter_values.evaluate(self.param.ocp_soc_100)
+        return V_min, V_max
+
+    def _get_initial_soc_model(self, tol):
+        """
+        Model for the initial soc based on a target voltage. The model is only built
+        once (for each tolerance), with the target voltage and the stoichiometry
+        limits as inputs, so that the solver can be reused.
+        """
+        if tol not in self._initial_soc_solvers:
+            parameter_values = self.parameter_values
+            V_min, V_max = self._get_voltage_limits()
+            V_init = pybamm.InputParameter("V_init")
+            x_0 = pybamm.InputParameter("x_0")
+            x_100 = pybamm.InputParameter("x_100")
+            y_100 = pybamm.InputParameter("y_100")
+            y_0 = pybamm.InputParameter("y_0")
+
             soc_model = pybamm.BaseModel()
             soc = pybamm.Variable("soc")
             x = x_0 + soc * (x_100 - x_0)
@@ -704,24 +882,11 @@ class ElectrodeSOHSolver:
             soc_model.initial_conditions[soc] = (V_init - V_min) / (V_max - V_min)
             soc_model.variables["soc"] = soc
             parameter_values.process_model(soc_model)
-            initial_soc = (
-                pybamm.AlgebraicSolver(tol=tol).solve(soc_model, [0])["soc"].data[0]
+            self._initial_soc_solvers[tol] = (
+                soc_model,
+                pybamm.AlgebraicSolver(tol=tol),
             )
-        elif isinstance(initial_value, (int, float)):
-            initial_soc = initial_value
-            if not 0 <= initial_soc <= 1:
-                raise ValueError("Initial SOC should be between 0 and 1")
-
-        else:
-            raise ValueError(
-                "Initial value must be a float between 0 and 1, "
-                "or a string ending in 'V'"
-            )
-
-        x = x_0 + initial_soc * (x_100 - x_0)
-        y = y_0 - initial_soc * (y_0 - y_100)
-
-        return x, y
+        return self._initial_soc_solvers[tol]
 
     def get_min_max_stoichiometries(self, inputs=None):
         """
@@ -833,12 +998,20 @@ class ElectrodeSOHSolver:
         Q_p = inputs["Q_p"]
         x_vals = np.linspace(x_100, x_0, num=points)
         y_vals = np.linspace(y_100, y_0, num=points)
-        # Calculate OCV at each stoichiometry
-        T = self.param.T_amb_av(0)
-        Vs = self.parameter_values.evaluate(
-            self.param.p.prim.U(y_vals, T) - self.param.n.prim.U(x_vals, T),
-            inputs=inputs,
-        ).flatten()
+        # Calculate OCV at each stoichiometry. The OCV is only parameterised once for
+        # each number of points, with the stoichiometries as states
+        if points not in self._energy_integrands:
+            T = self.param.T_amb_av(0)
+            x = pybamm.StateVector(slice(0, points))
+            y = pybamm.StateVector(slice(points, 2 * points))
+            self._energy_integrands[points] = self.parameter_values.process_symbol(
+                self.param.p.prim.U(y, T) - self.param.n.prim.U(x, T)
+            )
+        Vs = (
+            self._energy_integrands[points]
+            .evaluate(y=np.concatenate([x_vals, y_vals]), inputs=inputs)
+            .flatten()
+        )
         # Calculate dQ
         Q = Q_p * (y_0 - y_100)
         dQ = Q / (points - 1)
@@ -855,6 +1028,7 @@ def get_initial_stoichiometries(
     options=None,
     tol=1e-6,
     inputs=None,
+    esoh_solver=None,
 ):
     """
     Calculate initial stoichiometries to start off the simulation at a particular
@@ -885,13 +1059,18 @@ def get_initial_stoichiometries(
         Default is 1e-6.
     inputs : dict, optional
         A dictionary of input parameters passed to the model.
+    esoh_solver : :class:`pybamm.lithium_ion.ElectrodeSOHSolver`, optional
+        An electrode SOH solver for these parameter values, param, known value and
+        options to reuse, e.g. from a previous call. If not provided, a new solver is
+        created.
 
     Returns
     -------
     x, y
         The initial stoichiometries that give the desired initial state of charge
     """
-    esoh_solver = ElectrodeSOHSolver(parameter_values, param, known_value, options)
+    if esoh_solver is None:
+        esoh_solver = ElectrodeSOHSolver(parameter_values, param, known_value, options)
     return esoh_solver.get_initial_stoichiometries(initial_value, tol, inputs=inputs)
 
 
@@ -934,6 +1113,7 @@ def get_initial_ocps(
     options=None,
     tol=1e-6,
     inputs=None,
+    esoh_solver=None,
 ):
     """
     Calculate initial open-circuit potentials to start off the simulation at a
@@ -962,13 +1142,18 @@ def get_initial_ocps(
         Tolerance for the solver used in calculating initial open-circuit potentials.
     inputs : dict, optional
         A dictionary of input parameters passed to the model.
+    esoh_solver : :class:`pybamm.lithium_ion.ElectrodeSOHSolver`, optional
+        An electrode SOH solver for these parameter values, param, known value and
+        options to reuse, e.g. from a previous call. If not provided, a new solver is
+        created.
 
     Returns
     -------
     Un, Up
         The initial electrode OCPs that give the desired initial state of charge
     """
-    esoh_solver = ElectrodeSOHSolver(parameter_values, param, known_value, options)
+    if esoh_solver is None:
+        esoh_solver = ElectrodeSOHSolver(parameter_values, param, known_value, options)
     return esoh_solver.get_initial_ocps(initial_value, tol, inputs=inputs)
 
 
@@ -64,6 +64,8 @@ class ParameterValues:
 
         # Initialise empty _processed_symbols dict (for caching)
         self._processed_symbols = {}
+        # Table of the processed symbols, so that equal subtrees are shared objects
+        self._symbol_interner = pybamm.SymbolInterner()
 
         # save citations
         if "citations" in self._dict_items:
@@ -279,6 +281,7 @@ class ParameterValues:
                 self._dict_items[name] = value
         # reset processed symbols
         self._processed_symbols = {}
+        self._symbol_interner = pybamm.SymbolInterner()
 
     def set_initial_stoichiometry_half_cell(
         self,
@@ -327,10 +330,12 @@ class ParameterValues:
         options=None,
         inputs=None,
         tol=1e-6,
+        esoh_solver=None,
     ):
         """
         Set the initial stoichiometry of each electrode, based on the initial
-        SOC or voltage
+        SOC or voltage. An electrode SOH solver for these parameter values can be
+        passed as `esoh_solver` to reuse it between calls.
         """
         param = param or pybamm.LithiumIonParameters(options)
         x, y = pybamm.lithium_ion.get_initial_stoichiometries(
@@ -341,6 +346,7 @@ class ParameterValues:
             options=options,
             tol=tol,
             inputs=inputs,
+            esoh_solver=esoh_solver,
         )
         if inplace:
             parameter_values = self
@@ -363,14 +369,21 @@ class ParameterValues:
         known_value="cyclable lithium capacity",
         inplace=True,
         options=None,
+        esoh_solver=None,
     ):
         """
         Set the initial OCP of each electrode, based on the initial
-        SOC or voltage
+        SOC or voltage. An electrode SOH solver for these parameter values can be
+        passed as `esoh_solver` to reuse it between calls.
         """
         param = param or pybamm.LithiumIonParameters(options)
         Un, Up = pybamm.lithium_ion.get_initial_ocps(
-            initial_value, self, param=param, known_value=known_value, options=options
+            initial_value,
+            self,
+            param=param,
+            known_value=known_value,
+            options=options,
+            esoh_solver=esoh_solver,
         )
         if inplace:
             parameter_values = self
@@ -497,6 +510,11 @@ class ParameterValues:
 
         model.events = new_events
 
+        interner = self._symbol_interner
+        pybamm.logger.verbose(
+            f"Shared {interner.hits} of {interner.hits + interner.misses} processed "
+            f"symbols ({interner.node_count_reduction:.1%} fewer nodes)"
+        )
         pybamm.logger.info(f"Finish setting parameters for {model.name}")
 
         return model
@@ -609,10 +627,17 @@ class ParameterValues:
         try:
             return self._processed_symbols[symbol]
         except KeyError:
-            processed_symbol = self._process_symbol(symbol)
-            self._processed_symbols[symbol] = processed_symbol
-
-            return processed_symbol
+            pass
+        # Walk the tree with an explicit stack rather than recursively, so that deep
+        # trees do not hit the recursion limit. The children of operators are then
+        # already processed when the operator is processed
+        for node in pybamm.post_order(
+            symbol, known=self._processed_symbols, expand=pybamm.operates_on_children
+        ):
+            self._processed_symbols[node] = self._symbol_interner.intern(
+                self._process_symbol(node)
+            )
+        return self._processed_symbols[symbol]
 
     def _process_symbol(self, symbol):
         """See :meth:`ParameterValues.process_symbol()`."""
@@ -627,7 +652,11 @@ class ParameterValues:
                 return pybamm.Scalar(value, name=symbol.name)
             elif isinstance(value, pybamm.Symbol):
                 new_value = self.process_symbol(value)
-                new_value.copy_domains(symbol)
+                if new_value.domains != symbol.domains:
+                    # copy the processed value, which may be shared, before changing
+                    # its domains
+                    new_value = new_value.create_copy(new_children=new_value.children)
+                    new_value.copy_domains(symbol)
                 return new_value
             else:
                 raise TypeError(f"Cannot process parameter '{value}'")
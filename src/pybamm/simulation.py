@@ -3,6 +3,7 @@
 #
 from __future__ import annotations
 
+import contextlib
 import pickle
 import pybamm
 import numpy as np
@@ -65,6 +66,24 @@ class Simulation:
     discretisation_kwargs: dict (optional)
         Any keyword arguments to pass to the Discretisation class.
         See :class:`pybamm.Discretisation` for details.
+    model_cache: :class:`pybamm.ModelCache` (optional)
+        A cache of built models. If given, the built model (or, for experiments, the
+        built model for each step) is loaded from the cache if it has already been
+        built with the same settings, and saved to the cache otherwise.
+    share_experiment_discretisation: bool (optional)
+        If True, the parameters of the model are processed and the model is
+        discretised only once for an experiment, and the model for each step of the
+        experiment is derived from this model by substituting the external circuit
+        equations and events of the step, see :class:`pybamm.step.StepModelBuilder`.
+        This reduces the time taken to build experiments with several different
+        steps. Default is False.
+    initial_soc_as_input: bool (optional)
+        If True, the initial concentrations (or, for MSMR models, the initial
+        voltages) set by `initial_soc` are treated as input parameters of the built
+        model, and their values are passed to the solver at solve time. Changing the
+        initial SOC then only requires the electrode SOH calculation, and the built
+        model and solver set-up are reused instead of being rebuilt. This speeds up
+        sweeps over the initial SOC. Default is False.
     """
 
     def __init__(
@@ -80,6 +99,9 @@ class Simulation:
         output_variables=None,
         C_rate=None,
         discretisation_kwargs=None,
+        model_cache=None,
+        share_experiment_discretisation=False,
+        initial_soc_as_input=False,
     ):
         self._parameter_values = parameter_values or model.default_parameter_values
         self._unprocessed_parameter_values = self._parameter_values
@@ -124,11 +146,16 @@ class Simulation:
         self._solver = solver or self._model.default_solver
         self._output_variables = output_variables
         self._discretisation_kwargs = discretisation_kwargs or {}
+        self._model_cache = model_cache
+        self._share_experiment_discretisation = share_experiment_discretisation
+        self._initial_soc_as_input = initial_soc_as_input
 
         # Initialize empty built states
         self._model_with_set_params = None
         self._built_model = None
         self._built_initial_soc = None
+        self._initial_soc_esoh_solver = None
+        self._initial_soc_inputs = None
         self.steps_to_built_models = None
         self.steps_to_built_solvers = None
         self._mesh = None
@@ -153,6 +180,7 @@ class Simulation:
         """
         result = self.__dict__.copy()
         result["get_esoh_solver"] = None  # Exclude LRU cache
+        result["_initial_soc_esoh_solver"] = None  # Exclude LRU caches
         return result
 
     def __setstate__(self, state):
@@ -181,7 +209,34 @@ class Simulation:
         This increases set-up time since several models to be processed, but
         reduces simulation time since the model formulation is efficient.
         """
-        parameter_values = self._parameter_values.copy()
+        parameter_values = self._get_experiment_parameter_values(solve_kwargs)
+
+        # Process each step
+        self.experiment_unique_steps_to_model = {}
+        for step in self.experiment.unique_steps:
+            parameterised_model = step.process_model(self._model, parameter_values)
+            self.experiment_unique_steps_to_model[step.basic_repr()] = (
+                parameterised_model
+            )
+
+        # Set up rest model if experiment has start times
+        if self.experiment.initial_start_time:
+            # duration doesn't matter, we just need the model
+            rest_step = pybamm.step.rest(duration=1)
+            # Change ambient temperature to be an input, which will be changed at
+            # solve time
+            parameter_values["Ambient temperature [K]"] = "[input]"
+            parameterised_model = rest_step.process_model(self._model, parameter_values)
+            self.experiment_unique_steps_to_model["Rest for padding"] = (
+                parameterised_model
+            )
+
+    def _get_experiment_parameter_values(self, solve_kwargs=None):
+        """
+        Check that the parameter values can be used with the experiment, and return
+        the parameter values to use for all the steps of the experiment.
+        """
+        parameter_values = self._get_parameter_values_to_process().copy()
 
         # some parameters are used to control the experiment, and should not be
         # input parameters
@@ -232,25 +287,7 @@ class Simulation:
         if init_temp is not None:
             parameter_values["Initial temperature [K]"] = init_temp
 
-        # Process each step
-        self.experiment_unique_steps_to_model = {}
-        for step in self.experiment.unique_steps:
-            parameterised_model = step.process_model(self._model, parameter_values)
-            self.experiment_unique_steps_to_model[step.basic_repr()] = (
-                parameterised_model
-            )
-
-        # Set up rest model if experiment has start times
-        if self.experiment.initial_start_time:
-            # duration doesn't matter, we just need the model
-            rest_step = pybamm.step.rest(duration=1)
-            # Change ambient temperature to be an input, which will be changed at
-            # solve time
-            parameter_values["Ambient temperature [K]"] = "[input]"
-            parameterised_model = rest_step.process_model(self._model, parameter_values)
-            self.experiment_unique_steps_to_model["Rest for padding"] = (
-                parameterised_model
-            )
+        return parameter_values
 
     def set_parameters(self):
         """
@@ -260,14 +297,43 @@ class Simulation:
         if self._model_with_set_params:
             return
 
-        self._model_with_set_params = self._parameter_values.process_model(
-            self._unprocessed_model, inplace=False
+        self._model_with_set_params = (
+            self._get_parameter_values_to_process().process_model(
+                self._unprocessed_model, inplace=False
+            )
         )
         self._parameter_values.process_geometry(self._geometry)
         self._model = self._model_with_set_params
 
+    def _get_parameter_values_to_process(self):
+        """
+        Return the parameter values with which to process the model. If the initial
+        SOC is treated as an input, the parameters set by the initial SOC are
+        replaced by input parameters.
+        """
+        if not self._initial_soc_inputs:
+            return self._parameter_values
+        parameter_values = self._parameter_values.copy()
+        parameter_values.update({key: "[input]" for key in self._initial_soc_inputs})
+        return parameter_values
+
+    def _add_initial_soc_inputs(self, inputs):
+        """
+        Add the values of the parameters set by the initial SOC to the inputs, if
+        the initial SOC is treated as an input. Inputs given by the user take
+        precedence.
+        """
+        if not self._initial_soc_inputs:
+            return inputs
+        if isinstance(inputs, list):
+            return [{**self._initial_soc_inputs, **inp} for inp in inputs]
+        return {**self._initial_soc_inputs, **inputs}
+
     def set_initial_soc(self, initial_soc, inputs=None):
-        if self._built_initial_soc != initial_soc:
+        if self._built_initial_soc != initial_soc and not (
+            # models built with the initial SOC as an input can be reused
+            self._initial_soc_as_input and self._initial_soc_inputs is not None
+        ):
             # reset
             self._model_with_set_params = None
             self._built_model = None
@@ -276,12 +342,28 @@ class Simulation:
 
         options = self._model.options
         param = self._model.param
+        if (
+            self._initial_soc_esoh_solver is None
+            and options["working electrode"] == "both"
+        ):
+            # keep the electrode SOH solver (and its built models) for later calls
+            self._initial_soc_esoh_solver = pybamm.lithium_ion.ElectrodeSOHSolver(
+                self._unprocessed_parameter_values, param, options=options
+            )
         if options["open-circuit potential"] == "MSMR":
             self._parameter_values = (
                 self._unprocessed_parameter_values.set_initial_ocps(
-                    initial_soc, param=param, inplace=False, options=options
+                    initial_soc,
+                    param=param,
+                    inplace=False,
+                    options=options,
+                    esoh_solver=self._initial_soc_esoh_solver,
                 )
             )
+            keys = [
+                "Initial voltage in negative electrode [V]",
+                "Initial voltage in positive electrode [V]",
+            ]
         elif options["working electrode"] == "positive":
             self._parameter_values = (
                 self._unprocessed_parameter_values.set_initial_stoichiometry_half_cell(
@@ -292,6 +374,7 @@ class Simulation:
                     inputs=inputs,
                 )
             )
+            keys = ["Initial concentration in positive electrode [mol.m-3]"]
         else:
             self._parameter_values = (
                 self._unprocessed_parameter_values.set_initial_stoichiometries(
@@ -300,8 +383,18 @@ class Simulation:
                     inplace=False,
                     options=options,
                     inputs=inputs,
+                    esoh_solver=self._initial_soc_esoh_solver,
                 )
             )
+            keys = [
+                "Initial concentration in negative electrode [mol.m-3]",
+                "Initial concentration in positive electrode [mol.m-3]",
+            ]
+
+        if self._initial_soc_as_input:
+            self._initial_soc_inputs = {
+                key: self._parameter_values[key] for key in keys
+            }
 
         # Save solved initial SOC in case we need to re-build the model
         self._built_initial_soc = initial_soc
@@ -332,16 +425,25 @@ class Simulation:
             self._model_with_set_params = self._model
             self._built_model = self._model
         else:
-            self.set_parameters()
+            if self._model_cache is not None:
+                key = self._model_cache_key()
+                self._built_model = self._model_cache.load(key)
+            if self._built_model is None:
+                self.set_parameters()
+            else:
+                self._parameter_values.process_geometry(self._geometry)
             self._mesh = pybamm.Mesh(self._geometry, self._submesh_types, self._var_pts)
             self._disc = pybamm.Discretisation(
                 self._mesh, self._spatial_methods, **self._discretisation_kwargs
             )
-            self._built_model = self._disc.process_model(
-                self._model_with_set_params, inplace=False
-            )
+            if self._built_model is None:
+                self._built_model = self._disc.process_model(
+                    self._model_with_set_params, inplace=False
+                )
+                if self._model_cache is not None:
+                    self._model_cache.save(key, self._built_model, mesh=self._mesh)
             # rebuilt model so clear solver setup
-            self._solver._model_set_up = {}
+            self._solver._model_set_up.clear()
 
     def build_for_experiment(self, initial_soc=None, inputs=None, solve_kwargs=None):
         """
@@ -353,6 +455,10 @@ class Simulation:
 
         if self.steps_to_built_models:
             return
+        elif self._model_cache is not None and self._build_for_experiment_from_cache():
+            return
+        elif self._share_experiment_discretisation:
+            self._build_for_experiment_with_shared_discretisation(solve_kwargs)
         else:
             self.set_up_and_parameterise_experiment(solve_kwargs)
 
@@ -367,6 +473,8 @@ class Simulation:
             # Process all the different models
             self.steps_to_built_models = {}
             self.steps_to_built_solvers = {}
+            # a single solver holds the set-up of the models of all the steps
+            solver = self._solver.copy()
             for (
                 step,
                 model_with_set_params,
@@ -376,9 +484,106 @@ class Simulation:
                 built_model = self._disc.process_model(
                     model_with_set_params, inplace=True
                 )
-                solver = self._solver.copy()
                 self.steps_to_built_solvers[step] = solver
                 self.steps_to_built_models[step] = built_model
+        if self._model_cache is not None:
+            for step, key in self._experiment_model_cache_keys().items():
+                self._model_cache.save(
+                    key, self.steps_to_built_models[step], mesh=self._mesh
+                )
+
+    def _build_for_experiment_with_shared_discretisation(self, solve_kwargs=None):
+        """
+        Build the models for each step of the experiment from a model that is
+        parameterised and discretised once, see :class:`pybamm.step.StepModelBuilder`.
+        """
+        parameter_values = self._get_experiment_parameter_values(solve_kwargs)
+        self._parameter_values.process_geometry(self._geometry)
+        self._mesh = pybamm.Mesh(self._geometry, self._submesh_types, self._var_pts)
+        self._disc = pybamm.Discretisation(
+            self._mesh, self._spatial_methods, **self._discretisation_kwargs
+        )
+        builder = pybamm.step.StepModelBuilder(
+            self._model,
+            parameter_values,
+            self._mesh,
+            self._spatial_methods,
+            self.experiment.unique_steps,
+            discretisation_kwargs=self._discretisation_kwargs,
+        )
+        self.steps_to_built_models = {}
+        for step in self.experiment.unique_steps:
+            self.steps_to_built_models[step.basic_repr()] = builder.build(step)
+        if self.experiment.initial_start_time:
+            # Ambient temperature is an input, which will be changed at solve time
+            self.steps_to_built_models["Rest for padding"] = builder.build(
+                pybamm.step.rest(duration=1), ambient_temperature="[input]"
+            )
+        solver = self._solver.copy()
+        self.steps_to_built_solvers = {
+            step: solver for step in self.steps_to_built_models
+        }
+
+    def _model_cache_key(self, parameter_values=None, extra=None):
+        """
+        Key of the built model in the model cache, see :meth:`pybamm.ModelCache.key`.
+        """
+        return self._model_cache.key(
+            self._unprocessed_model,
+            parameter_values or self._get_parameter_values_to_process(),
+            self._geometry,
+            self._submesh_types,
+            self._var_pts,
+            self._spatial_methods,
+            discretisation_kwargs=self._discretisation_kwargs,
+            extra=extra,
+        )
+
+    def _experiment_model_cache_keys(self):
+        """
+        Keys of the built model for each step of the experiment in the model cache.
+        """
+        # The models for each step are processed from the same parameter values,
+        # up to the initial temperature (see `set_up_and_parameterise_experiment`),
+        # so the step and initial temperature are passed as extra data
+        extra = (
+            "experiment",
+            self.experiment.steps[0].temperature,
+            self._share_experiment_discretisation,
+        )
+        keys = {}
+        for step in self.experiment.unique_steps:
+            keys[step.basic_repr()] = self._model_cache_key(
+                extra=(*extra, type(step).__name__, step.basic_repr())
+            )
+        if self.experiment.initial_start_time:
+            keys["Rest for padding"] = self._model_cache_key(
+                extra=(*extra, "Rest for padding")
+            )
+        return keys
+
+    def _build_for_experiment_from_cache(self):
+        """
+        Load the built models for each step of the experiment from the model cache.
+        Returns False, without loading any models, if any of the models are not in
+        the cache.
+        """
+        keys = self._experiment_model_cache_keys()
+        if not all(key in self._model_cache for key in keys.values()):
+            return False
+        models = {step: self._model_cache.load(key) for step, key in keys.items()}
+        if any(model is None for model in models.values()):
+            return False
+
+        self._parameter_values.process_geometry(self._geometry)
+        self._mesh = pybamm.Mesh(self._geometry, self._submesh_types, self._var_pts)
+        self._disc = pybamm.Discretisation(
+            self._mesh, self._spatial_methods, **self._discretisation_kwargs
+        )
+        self.steps_to_built_models = models
+        solver = self._solver.copy()
+        self.steps_to_built_solvers = {step: solver for step in models}
+        return True
 
     def solve(
         self,
@@ -392,6 +597,7 @@ class Simulation:
         showprogress=False,
         inputs=None,
         t_interp=None,
+        output_sink=None,
         **kwargs,
     ):
         """
@@ -446,10 +652,53 @@ class Simulation:
         t_interp : None, list or ndarray, optional
             The times (in seconds) at which to interpolate the solution. Defaults to None.
             Only valid for solvers that support intra-solve interpolation (`IDAKLUSolver`).
+        output_sink : :class:`pybamm.OutputSink`, optional
+            A sink to which the output of each cycle of the experiment is written as
+            soon as the cycle is completed (e.g. :class:`pybamm.NpzOutputSink`). If
+            given, and `save_at_cycles` is None, only the first and last cycles are
+            kept in memory, so that the memory used by long experiments is bounded.
+            Can only be used if simulating an Experiment.
         **kwargs
             Additional key-word arguments passed to `solver.solve`.
             See :meth:`pybamm.BaseSolver.solve`.
         """
+        # Close the output sink once the solve ends, even if it is interrupted
+        with (
+            contextlib.closing(output_sink)
+            if output_sink is not None
+            else contextlib.nullcontext()
+        ):
+            return self._solve(
+                t_eval=t_eval,
+                solver=solver,
+                save_at_cycles=save_at_cycles,
+                calc_esoh=calc_esoh,
+                starting_solution=starting_solution,
+                initial_soc=initial_soc,
+                callbacks=callbacks,
+                showprogress=showprogress,
+                inputs=inputs,
+                t_interp=t_interp,
+                output_sink=output_sink,
+                **kwargs,
+            )
+
+    def _solve(
+        self,
+        t_eval,
+        solver,
+        save_at_cycles,
+        calc_esoh,
+        starting_solution,
+        initial_soc,
+        callbacks,
+        showprogress,
+        inputs,
+        t_interp,
+        output_sink,
+        **kwargs,
+    ):
+        """See :meth:`Simulation.solve`."""
         # Setup
         if solver is None:
             solver = self._solver
@@ -461,6 +710,7 @@ class Simulation:
 
         if self.operating_mode in ["without experiment", "drive cycle"]:
             self.build(initial_soc=initial_soc, inputs=inputs)
+            inputs = self._add_initial_soc_inputs(inputs)
             if save_at_cycles is not None:
                 raise ValueError(
                     "'save_at_cycles' option can only be used if simulating an "
@@ -470,6 +720,10 @@ class Simulation:
                 raise ValueError(
                     "starting_solution can only be provided if simulating an Experiment"
                 )
+            if output_sink is not None:
+                raise ValueError(
+                    "'output_sink' can only be used if simulating an Experiment"
+                )
             if (
                 self.operating_mode == "without experiment"
                 or "ElectrodeSOH" in self._model.name
@@ -548,7 +802,7 @@ class Simulation:
             # inputs without having to build the simulation again
             self._solution = starting_solution
             # Step through all experimental conditions
-            user_inputs = inputs
+            user_inputs = self._add_initial_soc_inputs(inputs)
             timer = pybamm.Timer()
 
             # Set up eSOH solver (for summary variables)
@@ -663,6 +917,10 @@ class Simulation:
             else:
                 cycle_lengths = self.experiment.cycle_lengths
 
+            # Solutions are appended to builders rather than added together, so that
+            # the cost of adding a step does not grow with the length of the solution
+            solution_builder = pybamm.SolutionBuilder(self._solution)
+
             for cycle_num, cycle_length in enumerate(
                 cycle_lengths,
                 start=1,
@@ -676,6 +934,7 @@ class Simulation:
 
                 steps = []
                 cycle_solution = None
+                cycle_builder = pybamm.SolutionBuilder()
 
                 # Decide whether we should save this cycle
                 save_this_cycle = (
@@ -683,8 +942,8 @@ class Simulation:
                     cycle_num == 1
                     # always save last cycle
                     or cycle_num == num_cycles
-                    # None: save all cycles
-                    or save_at_cycles is None
+                    # None: save all cycles (unless they are written to a sink)
+                    or (save_at_cycles is None and output_sink is None)
                     # list: save all cycles in the list
                     or (
                         isinstance(save_at_cycles, list)
@@ -806,17 +1065,18 @@ class Simulation:
                     # list of returned step solutions we can see which steps were
                     # skipped)
                     if (
-                        cycle_solution is None
+                        len(steps) == 1
                         and isinstance(step_solution, pybamm.EmptySolution)
                         and not isinstance(current_solution, pybamm.EmptySolution)
                     ):
-                        cycle_solution = current_solution.last_state
+                        cycle_builder.append(current_solution.last_state)
                     else:
-                        cycle_solution = cycle_solution + step_solution
+                        cycle_builder.append(step_solution)
 
-                    current_solution = cycle_solution
+                    # Only the final state is needed to start the next step
+                    current_solution = cycle_builder.last_state
 
-                    logs["experiment time"] = cycle_solution.t[-1]
+                    logs["experiment time"] = current_solution.t[-1]
                     callbacks.on_step_end(logs)
 
                     logs["termination"] = step_solution.termination
@@ -849,7 +1109,7 @@ class Simulation:
                         idx += 1
 
                 if save_this_cycle or feasible is False:
-                    self._solution = self._solution + cycle_solution
+                    solution_builder.append(cycle_builder.build())
 
                 # At the final step of the inner loop we save the cycle
                 if len(steps) > 0:
@@ -876,11 +1136,19 @@ class Simulation:
                     cycle_sol = pybamm.make_cycle_solution(
                         steps,
                         esoh_solver=esoh_solver,
-                        save_this_cycle=save_this_cycle,
+                        save_this_cycle=save_this_cycle or output_sink is not None,
                         inputs=user_inputs,
                     )
                     cycle_solution, cycle_sum_vars, cycle_first_state = cycle_sol
-                    all_cycle_solutions.append(cycle_solution)
+                    if output_sink is not None:
+                        output_sink.write_cycle(
+                            cycle_num + cycle_offset, cycle_solution, cycle_sum_vars
+                        )
+                    # cycles that are not saved are only kept until the stopping
+                    # conditions have been checked
+                    all_cycle_solutions.append(
+                        cycle_solution if save_this_cycle else None
+                    )
                     all_summary_variables.append(cycle_sum_vars)
                     all_first_states.append(cycle_first_state)
 
@@ -927,6 +1195,7 @@ class Simulation:
                 if feasible is False:
                     break
 
+            self._solution = solution_builder.build()
             if self._solution is not None and len(all_cycle_solutions) > 0:
                 self._solution.cycles = all_cycle_solutions
                 self._solution.set_summary_variables(all_summary_variables)
@@ -1007,7 +1276,7 @@ class Simulation:
             dt,
             t_eval=t_eval,
             save=save,
-            inputs=inputs,
+            inputs=self._add_initial_soc_inputs(inputs or {}),
             **kwargs,
         )
 
@@ -1169,6 +1438,7 @@ class Simulation:
         filename: str | None = None,
         mesh: bool = False,
         variables: bool = False,
+        binary: bool = False,
     ):
         """
         Write out a discretised model to a JSON file
@@ -1185,6 +1455,10 @@ class Simulation:
         filename: str, optional
             The desired name of the JSON file. If no name is provided, one will be
             created based on the model name, and the current datetime.
+        binary: bool, optional
+            Whether to write the model to a (smaller and faster to load) binary
+            ".npz" file instead, see :meth:`pybamm.Serialise.save_model`. Default is
+            False.
         """
         mesh = self._mesh if (mesh or variables) else None
         variables = self._built_model.variables if variables else None
@@ -1198,7 +1472,11 @@ class Simulation:
 
         if self._built_model:
             Serialise().save_model(
-                self._built_model, filename=filename, mesh=mesh, variables=variables
+                self._built_model,
+                filename=filename,
+                mesh=mesh,
+                variables=variables,
+                binary=binary,
             )
         else:
             raise NotImplementedError(
@@ -5,6 +5,7 @@ import multiprocessing as mp
 import numbers
 import sys
 import warnings
+import weakref
 import platform
 
 import casadi
@@ -13,6 +14,11 @@ import numpy as np
 import pybamm
 from pybamm.expression_tree.binary_operators import _Heaviside
 from pybamm import ParameterValues
+from pybamm.solvers.lrudict import LRUDict
+
+# Solver and model of the current worker process, see `BaseSolver._get_pool`
+_worker_solver = None
+_worker_model = None
 
 
 class BaseSolver:
@@ -40,8 +46,41 @@ class BaseSolver:
     output_variables : list[str], optional
         List of variables to calculate and return. If none are specified then
         the complete state vector is returned (can be very large) (default is [])
+
+    Attributes
+    ----------
+    function_cache : :class:`pybamm.FunctionCache` or None
+        A cache of the CasADi functions generated when setting up a model, which
+        can be shared between processes. Default is None (no cache).
+    models_maxcount : int
+        The maximum number of models the solver keeps the set-up of, evicting the
+        least recently used model when more are solved. If 0 or None, the number
+        of models is unbounded. Default is 100.
+
+    Notes
+    -----
+    When solving for a list of inputs with a solver that does not support parallel
+    solves natively, the inputs are solved by a pool of worker processes, which is
+    kept by the solver between calls to :meth:`BaseSolver.solve`. The model is sent
+    to each worker once, when the pool is created, and only the inputs are sent for
+    each task. The pool is recreated if the model, the number of processes, the
+    set-up of the model or the settings of the solver (e.g. its tolerances) change,
+    and can be shut down with :meth:`BaseSolver.close_pool`.
+
+    A solver can be used to solve several models, keeping the set-up of each model.
+    Models whose discretised equations, events, output variables and input shapes
+    are identical (e.g. the same model built twice) share a single set-up, so the
+    functions of the model are only generated once.
     """
 
+    # attributes of the solver that are set by `set_up` for a given model, which are
+    # restored when that model is solved
+    _set_up_attributes = (
+        "computed_var_fcns",
+        "computed_dvar_dy_fcns",
+        "computed_dvar_dp_fcns",
+    )
+
     def __init__(
         self,
         method=None,
@@ -59,7 +98,8 @@ class BaseSolver:
         self.root_method = root_method
         self.extrap_tol = extrap_tol or -1e-10
         self.output_variables = [] if output_variables is None else output_variables
-        self._model_set_up = {}
+        self._model_set_up = LRUDict(maxsize=100)
+        self.function_cache = None
 
         # Defaults, can be overwritten by specific solver
         self.name = "Base solver"
@@ -69,6 +109,9 @@ class BaseSolver:
         self._on_extrapolation = "warn"
         self.computed_var_fcns = {}
         self._mp_context = self.get_platform_context(platform.system())
+        self._pool = None
+        self._pool_key = None
+        self._pool_finalizer = None
 
     @property
     def ode_solver(self):
@@ -90,10 +133,24 @@ class BaseSolver:
     def supports_parallel_solve(self):
         return False
 
+    @property
+    def models_maxcount(self):
+        return self._model_set_up.maxsize
+
+    @models_maxcount.setter
+    def models_maxcount(self, value):
+        self._model_set_up.maxsize = value
+        while value and len(self._model_set_up) > value:
+            self._model_set_up.popitem(last=False)
+
     @property
     def requires_explicit_sensitivities(self):
         return True
 
+    @property
+    def supports_initial_conditions_per_input(self):
+        return False
+
     @root_method.setter
     def root_method(self, method):
         if method == "casadi":
@@ -114,9 +171,164 @@ class BaseSolver:
         """Returns a copy of the solver"""
         new_solver = copy.copy(self)
         # clear _model_set_up
-        new_solver._model_set_up = {}
+        new_solver._model_set_up = LRUDict(maxsize=self.models_maxcount)
+        # the worker pool belongs to the original solver
+        new_solver._pool = None
+        new_solver._pool_key = None
+        new_solver._pool_finalizer = None
         return new_solver
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # worker pools can't be pickled
+        state["_pool"] = None
+        state["_pool_key"] = None
+        state["_pool_finalizer"] = None
+        return state
+
+    def _get_pool(self, model, nproc):
+        """
+        Return a pool of worker processes that have a copy of the solver and the
+        set-up model, creating it if needed.
+        """
+        # the set-up of the model is replaced if the model is set up again
+        key = (model, self._model_set_up[model], nproc, self._settings())
+        if self._pool is not None and (
+            self._pool_key[0] is key[0]
+            and self._pool_key[1] is key[1]
+            and self._pool_key[2:] == key[2:]
+        ):
+            return self._pool
+        self.close_pool()
+        pybamm.logger.verbose(f"Starting a pool of worker processes for {model.name}")
+        self._pool = mp.get_context(self._mp_context).Pool(
+            processes=nproc, initializer=_initialise_worker, initargs=(self, model)
+        )
+        self._pool_key = key
+        # shut the workers down when the solver is garbage collected
+        self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def _settings(self):
+        """
+        The settings of the solver (and of its root method), i.e. the attributes
+        that hold plain data such as tolerances and options, but not the functions
+        generated for a model.
+        """
+        return {
+            name: value._settings()
+            if isinstance(value, BaseSolver)
+            else copy.deepcopy(value)
+            for name, value in vars(self).items()
+            if name not in ("_pool", "_pool_key", "_pool_finalizer")
+            and (isinstance(value, BaseSolver) or _is_plain_data(value))
+        }
+
+    def close_pool(self):
+        """
+        Shut down the pool of worker processes used to solve for a list of inputs,
+        if there is one.
+        """
+        if self._pool is not None:
+            self._pool_finalizer()
+            self._pool = None
+            self._pool_key = None
+            self._pool_finalizer = None
+
+    def _set_up_model(self, model, inputs, t_eval=None):
+        """
+        Set up a model for solving, sharing the set-up of a model the solver has
+        already set up if the two models have an identical structure (see
+        :meth:`BaseSolver._get_model_structure`), and store the set-up of the model.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model to set up
+        inputs : dict
+            Any input parameters to pass to the model when solving
+        t_eval : numeric type, optional
+            The times at which to stop the integration due to a discontinuity in time.
+        """
+        structure = self._get_model_structure(model, inputs, t_eval)
+        if structure is not None:
+            for other_model, set_up in self._model_set_up.items():
+                if other_model is not model and set_up["structure"] == structure:
+                    pybamm.logger.info(
+                        f"Sharing the solver set-up of {other_model.name} "
+                        f"with {model.name}"
+                    )
+                    self._share_set_up(model, other_model, set_up, inputs)
+                    return
+
+        attributes_before = dict(vars(model))
+        self.set_up(model, inputs, t_eval)
+        self._model_set_up[model] = {
+            "initial conditions": model.concatenated_initial_conditions,
+            "structure": structure,
+            # the attributes of the model and the solver set by `set_up`
+            "model attributes": {
+                name: value
+                for name, value in vars(model).items()
+                if attributes_before.get(name, attributes_before) is not value
+            },
+            "solver attributes": {
+                name: getattr(self, name)
+                for name in self._set_up_attributes
+                if hasattr(self, name)
+            },
+        }
+
+    def _share_set_up(self, model, other_model, set_up, inputs):
+        """
+        Set up `model` with the set-up of `other_model`, which has the same structure.
+        """
+        for name, value in set_up["model attributes"].items():
+            setattr(model, name, value)
+        self._set_initial_conditions(model, 0.0, inputs)
+        self._model_set_up[model] = {
+            **set_up,
+            "initial conditions": model.concatenated_initial_conditions,
+        }
+
+    def _activate_set_up(self, model):
+        """
+        Restore the attributes of the solver that were set when setting up `model`,
+        as the solver may have set up other models since.
+        """
+        for name, value in self._model_set_up[model]["solver attributes"].items():
+            setattr(self, name, value)
+
+    def _get_model_structure(self, model, inputs, t_eval):
+        """
+        Return a key identifying everything the set-up of a model depends on, or None
+        if the model is not discretised. Two models with equal keys have identical
+        discretised equations, and so can share their set-up.
+        """
+        if not model.is_discretised:
+            return None
+        mass_matrix = model.mass_matrix
+        variables_and_events = model.variables_and_events
+        return (
+            model.convert_to_format,
+            model.concatenated_rhs.id,
+            model.concatenated_algebraic.id,
+            model.concatenated_initial_conditions.id,
+            None if mass_matrix is None else mass_matrix.id,
+            tuple(
+                (event.name, event.event_type, event.expression.id)
+                for event in model.events
+            ),
+            tuple(getattr(model, "calculate_sensitivities", [])),
+            tuple((name, np.shape(value)) for name, value in inputs.items()),
+            tuple(
+                getattr(variables_and_events.get(name), "id", None)
+                for name in self.output_variables
+            ),
+            # discontinuity events depend on the final time
+            None if t_eval is None else float(t_eval[-1]),
+        )
+
     def set_up(self, model, inputs=None, t_eval=None, ics_only=False):
         """Unpack model, perform checks, and calculate jacobian.
 
@@ -155,6 +367,18 @@ class BaseSolver:
         vars_for_processing = self._get_vars_for_processing(
             model, inputs, calculate_sensitivities_explicit
         )
+        # the time taken to convert each expression to CasADi, and the size of the
+        # resulting expression, filled in as the expressions are processed
+        model.casadi_conversion_stats = vars_for_processing.get(
+            "casadi_conversion_stats", {}
+        )
+        if self.function_cache is not None and model.convert_to_format == "casadi":
+            vars_for_processing.update(
+                {
+                    "function_cache": self.function_cache,
+                    "function_cache_tokeniser": self.function_cache.tokeniser(),
+                }
+            )
 
         # Process initial conditions
         initial_conditions, _, jacp_ic, _ = process(
@@ -205,6 +429,8 @@ class BaseSolver:
             terminate_events,
             interpolant_extrapolation_events,
             discontinuity_events,
+            events,
+            event_indices,
         ) = self._set_up_events(model, t_eval, inputs, vars_for_processing)
 
         # Add the solver attributes
@@ -215,6 +441,8 @@ class BaseSolver:
         model.terminate_events_eval = terminate_events
         model.discontinuity_events_eval = discontinuity_events
         model.interpolant_extrapolation_events_eval = interpolant_extrapolation_events
+        model.events_eval = events
+        model.event_indices = event_indices
 
         model.jac_rhs_eval = jac_rhs
         model.jac_rhs_action_eval = jac_rhs_action
@@ -277,6 +505,12 @@ class BaseSolver:
                 return_jacp_stacked=True,
             )
 
+        if model.casadi_conversion_stats:
+            stats = model.casadi_conversion_stats.values()
+            pybamm.logger.verbose(
+                f"Converted {len(stats)} expressions to CasADi in "
+                f"{pybamm.TimerTime(sum(stage['time'] for stage in stats))}"
+            )
         pybamm.logger.info("Finish solver set-up")
 
     def _set_initial_conditions(self, model, time, inputs):
@@ -310,6 +544,21 @@ class BaseSolver:
 
         model.y0S = model.jacp_initial_conditions_eval(time, y_zero, inputs_jacp_ics)
 
+    @staticmethod
+    def _initial_conditions_depend_on_inputs(model):
+        """
+        Whether the consistent initial states of the model depend on its input
+        parameters, i.e. whether the initial conditions or the algebraic equations
+        contain an input parameter.
+        """
+        return any(
+            expr is not None and expr.has_symbol_of_classes(pybamm.InputParameter)
+            for expr in (
+                model.concatenated_initial_conditions,
+                model.concatenated_algebraic,
+            )
+        )
+
     @classmethod
     def _wrangle_name(cls, name: str) -> str:
         """
@@ -419,6 +668,11 @@ class BaseSolver:
                     "y_casadi": y_casadi,
                     "p_casadi": p_casadi,
                     "p_casadi_stacked": p_casadi_stacked,
+                    # all the expressions are converted with one converter, so that
+                    # the subtrees they share (e.g. between the rhs, algebraic and
+                    # rhs_algebraic expressions) are only converted once
+                    "casadi_converter": pybamm.CasadiConverter(),
+                    "casadi_conversion_stats": {},
                 }
             )
             # sensitivity vectors
@@ -554,6 +808,9 @@ class BaseSolver:
         casadi_switch_events = []
         terminate_events = []
         interpolant_extrapolation_events = []
+        # terminate and interpolant extrapolation events, in the order of the rows
+        # of the fused events function
+        fused_events = []
         discontinuity_events = []
         for n, event in enumerate(model.events):
             if event.event_type == pybamm.EventType.DISCONTINUITY:
@@ -601,14 +858,34 @@ class BaseSolver:
                 )[0]
                 if event.event_type == pybamm.EventType.TERMINATION:
                     terminate_events.append(event_call)
+                    fused_events.insert(len(terminate_events) - 1, event)
                 elif event.event_type == pybamm.EventType.INTERPOLANT_EXTRAPOLATION:
                     interpolant_extrapolation_events.append(event_call)
+                    fused_events.append(event)
+
+        # Evaluate all the terminate events, followed by all the interpolant
+        # extrapolation events, with a single function, so that the solvers only
+        # make one call to check all the events
+        if fused_events:
+            events = process(
+                pybamm.NumpyConcatenation(
+                    *[event.expression for event in fused_events]
+                ),
+                "events",
+                vars_for_processing,
+                use_jacobian=False,
+            )[0]
+        else:
+            events = None
+        event_indices = {event.name: i for i, event in enumerate(fused_events)}
 
         return (
             casadi_switch_events,
             terminate_events,
             interpolant_extrapolation_events,
             discontinuity_events,
+            events,
+            event_indices,
         )
 
     def _set_consistent_initialization(self, model, time, inputs_dict):
@@ -805,11 +1082,12 @@ class BaseSolver:
         )
 
         # (Re-)calculate consistent initialization
-        # Assuming initial conditions do not depend on input parameters
-        # when len(inputs_list) > 1, only `model_inputs_list[0]`
+        # Unless the solver sets the initial conditions for each set of inputs,
+        # it is assumed that initial conditions do not depend on input parameters
+        # when len(inputs_list) > 1, and only `model_inputs_list[0]`
         # is passed to `_set_consistent_initialization`.
         # See https://github.com/pybamm-team/PyBaMM/pull/1261
-        if len(inputs_list) > 1:
+        if len(inputs_list) > 1 and not self.supports_initial_conditions_per_input:
             all_inputs_names = set(
                 itertools.chain.from_iterable(
                     [model_inputs.keys() for model_inputs in model_inputs_list]
@@ -839,22 +1117,12 @@ class BaseSolver:
         timer = pybamm.Timer()
         # Set the initial conditions
         if model not in self._model_set_up:
-            if len(self._model_set_up) > 0:
-                existing_model = next(iter(self._model_set_up))
-                raise RuntimeError(
-                    "This solver has already been initialised for model "
-                    f'"{existing_model.name}". Please create a separate '
-                    "solver for this model"
-                )
             # It is assumed that when len(inputs_list) > 1, model set
             # up (initial condition, time-scale and length-scale) does
             # not depend on input parameters. Therefore, only `model_inputs[0]`
             # is passed to `set_up`.
             # See https://github.com/pybamm-team/PyBaMM/pull/1261
-            self.set_up(model, model_inputs_list[0], t_eval)
-            self._model_set_up.update(
-                {model: {"initial conditions": model.concatenated_initial_conditions}}
-            )
+            self._set_up_model(model, model_inputs_list[0], t_eval)
         elif (
             self._model_set_up[model]["initial conditions"]
             != model.concatenated_initial_conditions
@@ -874,9 +1142,24 @@ class BaseSolver:
         else:
             # Set the standard initial conditions
             self._set_initial_conditions(model, t_eval[0], model_inputs_list[0])
+        self._activate_set_up(model)
 
         # Solve for the consistent initialization
         self._set_consistent_initialization(model, t_eval[0], model_inputs_list[0])
+        # the initial states only need to be found for each set of inputs if they
+        # depend on the inputs, otherwise those of the first set of inputs are used
+        per_input_initial_conditions = (
+            len(model_inputs_list) > 1
+            and self.supports_initial_conditions_per_input
+            and self._initial_conditions_depend_on_inputs(model)
+        )
+        # the initial states of each set of inputs are kept for this solve only, the
+        # model keeps the states of the first set of inputs
+        initial_states = None
+        if per_input_initial_conditions:
+            initial_states = self._consistent_initialization_per_input(
+                model, t_eval[0], model_inputs_list
+            )
 
         set_up_time = timer.time()
         timer.reset()
@@ -902,11 +1185,15 @@ class BaseSolver:
             )
             if self.supports_parallel_solve:
                 # Jax and IDAKLU solver can accept a list of inputs
+                integrate_kwargs = {}
+                if initial_states is not None:
+                    integrate_kwargs["initial_states"] = initial_states
                 new_solutions = self._integrate(
                     model,
                     t_eval[start_index:end_index],
                     model_inputs_list,
                     t_interp,
+                    **integrate_kwargs,
                 )
             else:
                 ninputs = len(model_inputs_list)
@@ -919,18 +1206,22 @@ class BaseSolver:
                     )
                     new_solutions = [new_solution]
                 else:
-                    with mp.get_context(self._mp_context).Pool(processes=nproc) as p:
-                        new_solutions = p.starmap(
-                            self._integrate,
-                            zip(
-                                [model] * ninputs,
-                                [t_eval[start_index:end_index]] * ninputs,
-                                model_inputs_list,
-                                [t_interp] * ninputs,
-                            ),
-                        )
-                        p.close()
-                        p.join()
+                    # The model is already in the workers, so only the inputs (and
+                    # the current initial conditions) are sent for each task
+                    pool = self._get_pool(model, nproc)
+                    new_solutions = pool.starmap(
+                        _integrate_in_worker,
+                        zip(
+                            [t_eval[start_index:end_index]] * ninputs,
+                            model_inputs_list,
+                            [t_interp] * ninputs,
+                            [model.y0] * ninputs,
+                        ),
+                    )
+                    for new_solution in new_solutions:
+                        new_solution._all_models = [
+                            model if m is None else m for m in new_solution.all_models
+                        ]
             # Setting the solve time for each segment.
             # pybamm.Solution.__add__ assumes attribute solve_time.
             solve_time = timer.time()
@@ -945,7 +1236,15 @@ class BaseSolver:
             if solutions[0].termination != "final time":
                 break
 
-            if end_index != len(t_eval):
+            if end_index != len(t_eval) and per_input_initial_conditions:
+                # restart each set of inputs from its own state
+                initial_states = self._consistent_initialization_per_input(
+                    model,
+                    t_eval[end_index],
+                    model_inputs_list,
+                    [solution.y[:, -1] for solution in solutions],
+                )
+            elif end_index != len(t_eval):
                 # setup for next integration subsection
                 last_state = solutions[0].y[:, -1]
                 # update y0 (for DAE solvers, this updates the initial guess for the
@@ -1065,31 +1364,65 @@ class BaseSolver:
 
         return start_indices, end_indices, t_eval
 
+    @staticmethod
+    def _evaluate_events(model, events, t, y, inputs):
+        """
+        Evaluate terminate or interpolant extrapolation events of a model, with the
+        fused events function created when the model was set up if there is one.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model the events belong to
+        events : list of :class:`pybamm.Event`
+            The events to evaluate
+        t : float
+            The time at which to evaluate the events
+        y : array-like
+            The state at which to evaluate the events
+        inputs : dict
+            The input parameters
+
+        Returns
+        -------
+        dict
+            The value of each event, keyed by its name
+        """
+        events_eval = getattr(model, "events_eval", None)
+        event_indices = getattr(model, "event_indices", {})
+        if events_eval is None or any(
+            event.name not in event_indices for event in events
+        ):
+            return {
+                event.name: event.expression.evaluate(t, y, inputs=inputs)
+                for event in events
+            }
+        if model.convert_to_format == "casadi":
+            # the states of a solution do not include the sensitivities, which
+            # the events do not depend on
+            n_missing = events_eval.size1_in(1) - y.shape[0]
+            if n_missing > 0:
+                y = casadi.vertcat(casadi.DM(y), casadi.DM.zeros(n_missing))
+            values = events_eval(t, y, casadi.vertcat(*inputs.values())).full()
+        else:
+            values = events_eval(t=t, y=y, inputs=inputs)
+        values = np.asarray(values).reshape(-1)
+        return {event.name: values[event_indices[event.name]] for event in events}
+
     @staticmethod
     def _check_events_with_initialization(t_eval, model, inputs_dict):
-        num_terminate_events = len(model.terminate_events_eval)
-        if num_terminate_events == 0:
+        termination_events = [
+            x for x in model.events if x.event_type == pybamm.EventType.TERMINATION
+        ]
+        if not termination_events:
             return
 
-        if model.convert_to_format == "casadi":
-            inputs = casadi.vertcat(*[x for x in inputs_dict.values()])
-
-        events_eval = [None] * num_terminate_events
-        for idx, event in enumerate(model.terminate_events_eval):
-            if model.convert_to_format == "casadi":
-                event_eval = event(t_eval[0], model.y0, inputs)
-            elif model.convert_to_format in ["python", "jax"]:
-                event_eval = event(t=t_eval[0], y=model.y0, inputs=inputs_dict)
-            events_eval[idx] = event_eval
-
-        events_eval = np.array(events_eval)
-        if any(events_eval < 0):
-            # find the events that were triggered by initial conditions
-            termination_events = [
-                x for x in model.events if x.event_type == pybamm.EventType.TERMINATION
-            ]
-            idxs = np.where(events_eval < 0)[0]
-            event_names = [termination_events[idx].name for idx in idxs]
+        events_eval = BaseSolver._evaluate_events(
+            model, termination_events, t_eval[0], model.y0, inputs_dict
+        )
+        # find the events that were triggered by initial conditions
+        event_names = [name for name, value in events_eval.items() if value < 0]
+        if event_names:
             raise pybamm.SolverError(
                 f"Events {event_names} are non-positive at initial conditions"
             )
@@ -1286,17 +1619,8 @@ class BaseSolver:
 
         first_step_this_model = model not in self._model_set_up
         if first_step_this_model or sensitivities_have_changed:
-            if len(self._model_set_up) > 0:
-                existing_model = next(iter(self._model_set_up))
-                raise RuntimeError(
-                    "This solver has already been initialised for model "
-                    f'"{existing_model.name}". Please create a separate '
-                    "solver for this model"
-                )
-            self.set_up(model, model_inputs)
-            self._model_set_up.update(
-                {model: {"initial conditions": model.concatenated_initial_conditions}}
-            )
+            self._set_up_model(model, model_inputs)
+        self._activate_set_up(model)
 
         if (
             isinstance(old_solution, pybamm.EmptySolution)
@@ -1421,14 +1745,13 @@ class BaseSolver:
             )
         else:
             # Get final event value
-            final_event_values = {}
-
-            for event in termination_events:
-                final_event_values[event.name] = event.expression.evaluate(
-                    solution.t_event,
-                    solution.y_event,
-                    inputs=solution.all_inputs[-1],
-                )
+            final_event_values = BaseSolver._evaluate_events(
+                solution.all_models[-1],
+                termination_events,
+                solution.t_event,
+                solution.y_event,
+                solution.all_inputs[-1],
+            )
             termination_event = min(final_event_values, key=final_event_values.get)
 
             # Check that it's actually an event
@@ -1455,6 +1778,7 @@ class BaseSolver:
             )
             event_sol.solve_time = 0
             event_sol.integration_time = 0
+            event_sol.integrator_set_up_time = 0
             solution = solution + event_sol
 
         pybamm.logger.debug("Finish post-processing events")
@@ -1500,12 +1824,20 @@ class BaseSolver:
         if isinstance(y, casadi.DM):
             y = y.full()
 
-        for event in events:
-            if (
-                event.event_type == pybamm.EventType.INTERPOLANT_EXTRAPOLATION
-                and event.expression.evaluate(t, y, inputs=inputs) < self.extrap_tol
-            ):
-                extrap_events.append(event.name)
+        extrap_events_eval = self._evaluate_events(
+            solution.all_models[-1],
+            [
+                event
+                for event in events
+                if event.event_type == pybamm.EventType.INTERPOLANT_EXTRAPOLATION
+            ],
+            t,
+            y,
+            inputs,
+        )
+        for name, value in extrap_events_eval.items():
+            if value < self.extrap_tol:
+                extrap_events.append(name)
 
         if len(extrap_events) == 0:
             # no extrapolation events are within the tolerance
@@ -1538,7 +1870,8 @@ class BaseSolver:
                 "Cannot simulate an empty model, use `pybamm.DummySolver` instead"
             )
 
-    def get_platform_context(self, system_type: str):
+    @staticmethod
+    def get_platform_context(system_type: str):
         # Set context for parallel processing depending on the platform
         if system_type.lower() in ["linux", "darwin"]:
             return "fork"
@@ -1678,9 +2011,41 @@ def process(
         calculate_sensitivities_explicit = vars_for_processing[
             "calculate_sensitivities_explicit"
         ]
+        # Load the functions from the function cache, if there is one
+        function_cache = vars_for_processing.get("function_cache")
+        if function_cache is not None:
+            key = function_cache.key(
+                symbol,
+                name,
+                {
+                    "use_jacobian": use_jacobian,
+                    "return_jacp_stacked": return_jacp_stacked,
+                    "calculate_sensitivities": model.calculate_sensitivities,
+                    "calculate_sensitivities_explicit": calculate_sensitivities_explicit,
+                    "inputs": [(pname, p.shape) for pname, p in p_casadi.items()],
+                    "sizes": [
+                        model.len_rhs,
+                        model.len_alg,
+                        model.len_rhs_sens,
+                        model.len_alg_sens,
+                    ],
+                },
+                tokeniser=vars_for_processing["function_cache_tokeniser"],
+            )
+            functions = function_cache.load(key)
+            if functions is not None:
+                report(f"Loaded {name} from the function cache")
+                return functions
         # Process with CasADi
         report(f"Converting {name} to CasADi")
-        casadi_expression = symbol.to_casadi(t_casadi, y_casadi, inputs=p_casadi)
+        converter = vars_for_processing["casadi_converter"]
+        n_symbols = converter.n_converted
+        timer = pybamm.Timer()
+        casadi_expression = converter.convert(
+            symbol, t_casadi, y_casadi, None, p_casadi
+        )
+        conversion_time = timer.time()
+        n_new_symbols = converter.n_converted - n_symbols
         # Add sensitivity vectors to the rhs and algebraic equations
         jacp = None
         if calculate_sensitivities_explicit:
@@ -1794,5 +2159,51 @@ def process(
         func = casadi.Function(
             name, [t_casadi, y_and_S, p_casadi_stacked], [casadi_expression]
         )
+        stats = {
+            "time": conversion_time.value,
+            "MX nodes": func.n_nodes(),
+            "new symbols": n_new_symbols,
+        }
+        vars_for_processing["casadi_conversion_stats"][name] = stats
+        report(
+            f"Converted {name} to CasADi in {conversion_time} ({stats['MX nodes']} "
+            f"MX nodes, {stats['new symbols']} new symbols)"
+        )
+        if function_cache is not None:
+            function_cache.save(key, (func, jac, jacp, jac_action))
 
     return func, jac, jacp, jac_action
+
+
+def _is_plain_data(value):
+    """Whether a value is a number, string or None, or a container of these"""
+    if value is None or isinstance(value, (bool, numbers.Number, str)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain_data(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            _is_plain_data(key) and _is_plain_data(item) for key, item in value.items()
+        )
+    return False
+
+
+def _initialise_worker(solver, model):
+    global _worker_solver, _worker_model
+    _worker_solver = solver
+    _worker_model = model
+
+
+def _integrate_in_worker(t_eval, inputs, t_interp, y0):
+    """
+    Integrate the model of the worker process for the given inputs. The model is
+    removed from the solution, so that it isn't sent back to the main process.
+    """
+    _worker_model.y0 = y0
+    solution = _worker_solver._integrate(
+        _worker_model, t_eval, inputs, t_interp=t_interp
+    )
+    solution._all_models = [
+        None if m is _worker_model else m for m in solution.all_models
+    ]
+    return solution
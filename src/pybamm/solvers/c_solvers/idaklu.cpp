@@ -195,5 +195,6 @@ PYBIND11_MODULE(idaklu, m)
     .def_readwrite("yS", &Solution::yS)
     .def_readwrite("ypS", &Solution::ypS)
     .def_readwrite("y_term", &Solution::y_term)
-    .def_readwrite("flag", &Solution::flag);
+    .def_readwrite("flag", &Solution::flag)
+    .def_readwrite("setup_time", &Solution::setup_time);
 }
@@ -1,4 +1,5 @@
 #include "IDAKLUSolverGroup.hpp"
+#include <atomic>
 #include <omp.h>
 #include <optional>
 
@@ -92,9 +93,6 @@ std::vector<Solution> IDAKLUSolverGroup::solve(
       "inputs has wrong number of rows. Expected " + std::to_string(number_of_groups) +
       " but got " + std::to_string(inputs.shape()[0]));
 
-  const std::size_t solves_per_thread = number_of_groups / m_solvers.size();
-  const std::size_t remainder_solves = number_of_groups % m_solvers.size();
-
   const realtype *y0 = y0_np.data();
   const realtype *yp0 = yp0_np.data();
   const realtype *inputs_data = inputs.data();
@@ -103,12 +101,21 @@ std::vector<Solution> IDAKLUSolverGroup::solve(
 
   std::optional<std::exception> exception;
 
+  // Each solver takes the next set of inputs when it has finished its last solve,
+  // rather than a fixed share of the inputs, so that the threads stay busy when
+  // the solves take different times (e.g. if some terminate early on events)
+  std::atomic<std::size_t> next_index(0);
+  const std::size_t number_of_solves = number_of_groups;
+
   omp_set_num_threads(m_solvers.size());
   #pragma omp parallel for
   for (int i = 0; i < m_solvers.size(); i++) {
     try {
-      for (int j = 0; j < solves_per_thread; j++) {
-        const std::size_t index = i * solves_per_thread + j;
+      for (
+        std::size_t index = next_index++;
+        index < number_of_solves;
+        index = next_index++
+      ) {
         const realtype *y = y0 + index * y0_np.shape(1);
         const realtype *yp = yp0 + index * yp0_np.shape(1);
         const realtype *input = inputs_data + index * inputs.shape(1);
@@ -128,14 +135,6 @@ std::vector<Solution> IDAKLUSolverGroup::solve(
     throw py::error_already_set();
   }
 
-  for (int i = 0; i < remainder_solves; i++) {
-    const std::size_t index = number_of_groups - remainder_solves + i;
-    const realtype *y = y0 + index * y0_np.shape(1);
-    const realtype *yp = yp0 + index * yp0_np.shape(1);
-    const realtype *input = inputs_data + index * inputs.shape(1);
-    results[index] = m_solvers[i]->solve(t_eval, t_interp, y, yp, input, save_adaptive_steps, save_interp_steps);
-  }
-
   // create solutions (needs to be serial as we're using the Python GIL)
   std::vector<Solution> solutions(number_of_groups);
   for (int i = 0; i < number_of_groups; i++) {
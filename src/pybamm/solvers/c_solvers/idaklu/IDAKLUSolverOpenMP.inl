@@ -1,5 +1,6 @@
 #include "Expressions/Expressions.hpp"
 #include "sundials_functions.hpp"
+#include <chrono>
 #include <vector>
 #include "common.hpp"
 #include "SolutionData.hpp"
@@ -368,6 +369,7 @@ SolutionData IDAKLUSolverOpenMP<ExprSet>::solve(
 )
 {
   DEBUG("IDAKLUSolver::solve");
+  auto const setup_start = std::chrono::steady_clock::now();
   const int number_of_evals = t_eval.size();
   const int number_of_interps = t_interp.size();
 
@@ -437,6 +439,12 @@ SolutionData IDAKLUSolverOpenMP<ExprSet>::solve(
     ConsistentInitialization(t0, t_eval_next, init_type);
   }
 
+  // Time taken to reinitialize the integrator and find consistent initial
+  // conditions, which is reported with the solution
+  realtype const setup_time = std::chrono::duration<realtype>(
+    std::chrono::steady_clock::now() - setup_start
+  ).count();
+
   // Set the initial stop time
   IDASetStopTime(ida_mem, t_eval_next);
 
@@ -619,7 +627,7 @@ SolutionData IDAKLUSolverOpenMP<ExprSet>::solve(
     }
   }
 
-  return SolutionData(
+  SolutionData solution_data(
     retval,
     number_of_timesteps,
     length_of_return_vector,
@@ -633,7 +641,9 @@ SolutionData IDAKLUSolverOpenMP<ExprSet>::solve(
     yp_return,
     yS_return,
     ypS_return,
-    yterm_return);
+    yterm_return,
+    setup_time);
+  return solution_data;
 }
 
 template <class ExprSet>
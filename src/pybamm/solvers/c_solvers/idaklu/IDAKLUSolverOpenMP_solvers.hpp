@@ -3,6 +3,25 @@
 
 #include "IDAKLUSolverOpenMP.hpp"
 
+/**
+ * @brief Initialize a KLU linear solver, keeping its symbolic factorization
+ *
+ * IDA initializes the linear solver each time the integrator is (re)initialized,
+ * i.e. at the start of each solve and at each discontinuity, which makes KLU
+ * repeat the symbolic analysis of the Jacobian. The sparsity pattern of the
+ * Jacobian is fixed, so the analysis is only done once and later factorizations
+ * reuse it (KLU still factorizes from scratch if the pivots become poor).
+ */
+inline int SUNLinSolInitialize_KLUKeepSymbolic(SUNLinearSolver S) {
+  if (
+    SUNLinSol_KLUGetSymbolic(S) == nullptr ||
+    SUNLinSol_KLUGetNumeric(S) == nullptr
+  ) {
+    return SUNLinSolInitialize_KLU(S);
+  }
+  return SUNLS_SUCCESS;
+}
+
 /**
  * @brief IDAKLUSolver Dense implementation with OpenMP class
  */
@@ -29,6 +48,7 @@ public:
   IDAKLUSolverOpenMP_KLU(Args&& ... args) : Base(std::forward<Args>(args) ...)
   {
     Base::LS = SUNLinSol_KLU(Base::yy, Base::J, Base::sunctx);
+    Base::LS->ops->initialize = SUNLinSolInitialize_KLUKeepSymbolic;
     Base::Initialize();
   }
 };
@@ -34,6 +34,7 @@ public:
   np_array yS;
   np_array ypS;
   np_array y_term;
+  realtype setup_time = 0.0;  // time to (re)initialize the integrator [s]
 };
 
 #endif // PYBAMM_IDAKLU_COMMON_HPP
@@ -95,5 +95,7 @@ Solution SolutionData::generate_solution() {
   );
 
   // Store the solution
-  return Solution(flag, t_ret, y_ret, yp_ret, yS_ret, ypS_ret, y_term);
+  Solution solution(flag, t_ret, y_ret, yp_ret, yS_ret, ypS_ret, y_term);
+  solution.setup_time = setup_time;
+  return solution;
 }
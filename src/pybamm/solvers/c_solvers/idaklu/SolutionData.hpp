@@ -33,7 +33,8 @@ class SolutionData
       realtype *yp_return,
       realtype *yS_return,
       realtype *ypS_return,
-      realtype *yterm_return):
+      realtype *yterm_return,
+      realtype setup_time):
       flag(flag),
       number_of_timesteps(number_of_timesteps),
       length_of_return_vector(length_of_return_vector),
@@ -47,7 +48,8 @@ class SolutionData
       yp_return(yp_return),
       yS_return(yS_return),
       ypS_return(ypS_return),
-      yterm_return(yterm_return)
+      yterm_return(yterm_return),
+      setup_time(setup_time)
     {}
 
 
@@ -77,6 +79,7 @@ private:
     realtype *yS_return;
     realtype *ypS_return;
     realtype *yterm_return;
+    realtype setup_time = 0.0;
 };
 
 #endif // PYBAMM_IDAKLU_SOLUTION_DATA_HPP
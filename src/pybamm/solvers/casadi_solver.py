@@ -54,6 +54,10 @@ class CasadiSolver(pybamm.BaseSolver):
         - "max_num_steps": Maximum number of integrator steps
         - "print_stats": Print out statistics after integration
 
+        The integrators solve the model in time rescaled to [0, 1] over each
+        integration interval, so time-valued options (e.g. "max_step_size" or
+        "step0") are given as a fraction of the interval, rather than in seconds.
+
     extra_options_call : dict, optional
         Any options to pass to the CasADi integrator when calling the integrator.
         Please consult `CasADi documentation <https://web.casadi.org/python-api/#integrator>`_ for
@@ -66,9 +70,11 @@ class CasadiSolver(pybamm.BaseSolver):
         can sometimes slow down the solver, but is kept True as default for "safe" mode
         as it seems to be more robust (False by default for other modes).
     integrators_maxcount : int, optional
-        The maximum number of integrators that the solver will retain before
-        ejecting past integrators using an LRU methodology. A value of 0 or
-        None leaves the number of integrators unbound. Default is 100.
+        The maximum number of models, and of time grids for each model, for which
+        the solver will retain integrators before ejecting past integrators using an
+        LRU methodology. Integrators are reused for time grids that are the same up
+        to a shift and scaling. A value of 0 or None leaves the number of
+        integrators unbound. Default is 100.
     """
 
     def __init__(
@@ -133,6 +139,15 @@ class CasadiSolver(pybamm.BaseSolver):
 
         pybamm.citations.register("Andersson2019")
 
+    def _share_set_up(self, model, other_model, set_up, inputs):
+        super()._share_set_up(model, other_model, set_up, inputs)
+        # the integrators only depend on the structure of the model
+        integrators = self.integrators.get(other_model)
+        specs = self.integrator_specs.get(other_model)
+        if integrators is not None and specs is not None:
+            self.integrators[model] = integrators
+            self.integrator_specs[model] = specs
+
     def _integrate(self, model, t_eval, inputs_dict=None, t_interp=None):
         """
         Solve a DAE model defined by residuals with initial conditions y0.
@@ -327,18 +342,30 @@ class CasadiSolver(pybamm.BaseSolver):
         inputs = casadi.vertcat(*[x for x in inputs_dict.values()])
 
         def find_t_event(sol, typ):
-            # Check most recent y to see if any events have been crossed
-            if model.terminate_events_eval:
-                y_last = sol.all_ys[-1][:, -1]
-                crossed_events = np.sign(
-                    np.concatenate(
-                        [
-                            event(sol.t[-1], y_last, inputs)
-                            for event in model.terminate_events_eval
-                        ]
+            # Evaluations of the events are (relatively) expensive, so all the
+            # terminate events are evaluated together with the fused events function,
+            # and each time index is only evaluated once
+            num_terminate_events = len(model.terminate_events_eval)
+            events_eval = {}
+
+            def events(idx):
+                try:
+                    return events_eval[idx]
+                except KeyError:
+                    # We take away 1e-5 to deal with the case where the event sits
+                    # exactly on zero, as can happen when the event switch is used
+                    # (fast with events mode)
+                    events_eval[idx] = (
+                        model.events_eval(sol.t[idx], sol.y[:, idx], inputs)
+                        .full()
+                        .flatten()[:num_terminate_events]
+                        - 1e-5
                     )
-                    - 1e-5
-                )
+                    return events_eval[idx]
+
+            # Check most recent y to see if any events have been crossed
+            if num_terminate_events > 0:
+                crossed_events = np.sign(events(len(sol.t) - 1))
             else:
                 crossed_events = np.sign([])
 
@@ -348,26 +375,15 @@ class CasadiSolver(pybamm.BaseSolver):
 
             # get the index of the events that have been crossed
             event_idx = np.where(crossed_events != 1)[0]
-            active_events = [model.terminate_events_eval[i] for i in event_idx]
 
             # loop over events to compute the time at which they were triggered
-            t_events = [None] * len(active_events)
-            event_idcs_lower = [None] * len(active_events)
-            for i, event in enumerate(active_events):
+            t_events = [None] * len(event_idx)
+            event_idcs_lower = [None] * len(event_idx)
+            for i, idx_event in enumerate(event_idx):
                 # Implement our own bisection algorithm for speed
                 # This is used to find the time range in which the event is triggered
-                # Evaluations of the "event" function are (relatively) expensive
-                f_eval = {}
-
-                def f(idx, f_eval=f_eval, event=event):
-                    try:
-                        return f_eval[idx]
-                    except KeyError:
-                        # We take away 1e-5 to deal with the case where the event sits
-                        # exactly on zero, as can happen when the event switch is used
-                        # (fast with events mode)
-                        f_eval[idx] = event(sol.t[idx], sol.y[:, idx], inputs) - 1e-5
-                        return f_eval[idx]
+                def f(idx, idx_event=idx_event):
+                    return events(idx)[idx_event]
 
                 def integer_bisect():
                     a_n = 0
@@ -491,36 +507,31 @@ class CasadiSolver(pybamm.BaseSolver):
     def create_integrator(self, model, inputs, t_eval=None, use_event_switch=False):
         """
         Method to create a casadi integrator object.
-        If t_eval is provided, the integrator uses t_eval to make the grid.
+
+        The integrator solves the model in time rescaled to [0, 1], with the initial
+        and final times passed as parameters, so the same integrator can be used
+        for any time interval. If t_eval is provided, the integrator uses t_eval,
+        shifted and rescaled to [0, 1], to make the grid, so the integrator is
+        reused for any t_eval that is the same up to a shift and scaling (e.g.
+        uniform grids with the same number of points, whatever their duration).
         Otherwise, the integrator has grid [0,1].
+
+        The integrators of each model are cached, up to `integrators_maxcount`
+        grids per model.
         """
         pybamm.logger.debug("Creating CasADi integrator")
 
-        # Use grid if t_eval is given
-        use_grid = t_eval is not None
-        if use_grid is True:
-            t_eval_shifted = t_eval - t_eval[0]
-            t_eval_shifted_rounded = np.round(t_eval_shifted, decimals=12).tobytes()
-        # Only set up problem once
-        if model in self.integrators:
-            # If we're not using the grid, we don't need to change the integrator
-            if use_grid is False:
-                return self.integrators[model]["no grid"]
-            # Otherwise, create new integrator with an updated grid
-            # We don't need to update the grid if reusing the same t_eval
-            # (up to a shift by a constant)
-            else:
-                if t_eval_shifted_rounded in self.integrators[model]:
-                    return self.integrators[model][t_eval_shifted_rounded]
-                else:
-                    method, problem, options, time_args = self.integrator_specs[model]
-                    time_args = [t_eval_shifted[0], t_eval_shifted[1:]]
-                    integrator = casadi.integrator(
-                        "F", method, problem, *time_args, options
-                    )
-                    self.integrators[model][t_eval_shifted_rounded] = integrator
-                    return integrator
+        grid_key, grid = self._get_grid(t_eval)
+        integrators = self.integrators.get(model)
+        specs = self.integrator_specs.get(model)
+        if integrators is not None and specs is not None:
+            integrator = integrators.get(grid_key)
+            if integrator is not None:
+                return integrator
+            # Create a new integrator with an updated grid, for the same problem
+            method, problem, options = specs
         else:
+            # Only set up problem once
             rhs = model.casadi_rhs
             algebraic = model.casadi_algebraic
 
@@ -540,23 +551,13 @@ class CasadiSolver(pybamm.BaseSolver):
             y_alg = casadi.MX.sym("y_alg", algebraic(0, y0, p).shape[0])
             y_full = casadi.vertcat(y_diff, y_alg)
 
-            if use_grid is False:
-                time_args = []
-                # rescale time
-                t_min = casadi.MX.sym("t_min")
-                t_max = casadi.MX.sym("t_max")
-                t_max_minus_t_min = t_max - t_min
-                t_scaled = t_min + (t_max - t_min) * t
-                # add time limits as inputs
-                p_with_tlims = casadi.vertcat(p, t_min, t_max)
-            else:
-                time_args = [t_eval_shifted[0], t_eval_shifted[1:]]
-                # rescale time
-                t_min = casadi.MX.sym("t_min")
-                # Set dummy parameters for consistency with rescaled time
-                t_max_minus_t_min = 1
-                t_scaled = t_min + t
-                p_with_tlims = casadi.vertcat(p, t_min)
+            # rescale time
+            t_min = casadi.MX.sym("t_min")
+            t_max = casadi.MX.sym("t_max")
+            t_max_minus_t_min = t_max - t_min
+            t_scaled = t_min + (t_max - t_min) * t
+            # add time limits as inputs
+            p_with_tlims = casadi.vertcat(p, t_min, t_max)
 
             # define the event switch as the point when an event is crossed
             # we don't do this for ODE models
@@ -583,14 +584,31 @@ class CasadiSolver(pybamm.BaseSolver):
                         "alg": algebraic(t_scaled, y_full, p),
                     }
                 )
-            integrator = casadi.integrator("F", method, problem, *time_args, options)
-            self.integrator_specs[model] = method, problem, options, time_args
-            if use_grid is False:
-                self.integrators[model] = {"no grid": integrator}
-            else:
-                self.integrators[model] = {t_eval_shifted_rounded: integrator}
+            self.integrator_specs[model] = method, problem, options
+            integrators = LRUDict(maxsize=self.integrators_maxcount)
+            self.integrators[model] = integrators
 
-            return integrator
+        integrator = casadi.integrator("F", method, problem, grid[0], grid[1:], options)
+        integrators[grid_key] = integrator
+        return integrator
+
+    @staticmethod
+    def _get_grid(t_eval=None):
+        """
+        Shift and rescale t_eval to [0, 1] (or use [0, 1] if t_eval is None), and
+        return the rescaled grid and the key of its integrator.
+        """
+        if t_eval is None:
+            grid = np.array([0.0, 1.0])
+        else:
+            t_eval_shifted = t_eval - t_eval[0]
+            if t_eval_shifted[-1] <= 0:
+                raise pybamm.SolverError(
+                    "The final time must be greater than the initial time, but "
+                    f"t_eval goes from {t_eval[0]} to {t_eval[-1]}"
+                )
+            grid = t_eval_shifted / t_eval_shifted[-1]
+        return np.round(grid, decimals=12).tobytes(), grid
 
     def _run_integrator(
         self,
@@ -637,13 +655,12 @@ class CasadiSolver(pybamm.BaseSolver):
             extract_sensitivities_in_solution = explicit_sensitivities
 
         if use_grid is True:
-            pybamm.logger.spam("Calculating t_eval_shifted")
-            t_eval_shifted = t_eval - t_eval[0]
-            t_eval_shifted_rounded = np.round(t_eval_shifted, decimals=12).tobytes()
-            pybamm.logger.spam("Finished calculating t_eval_shifted")
-            integrator = self.integrators[model][t_eval_shifted_rounded]
+            pybamm.logger.spam("Calculating rescaled grid")
+            grid_key, _ = self._get_grid(t_eval)
+            pybamm.logger.spam("Finished calculating rescaled grid")
+            integrator = self.integrators[model][grid_key]
         else:
-            integrator = self.integrators[model]["no grid"]
+            integrator = self.integrators[model][self._get_grid()[0]]
 
         len_rhs = model.concatenated_rhs.size
         len_alg = model.concatenated_algebraic.size
@@ -670,13 +687,17 @@ class CasadiSolver(pybamm.BaseSolver):
         # Try solving
         if use_grid is True:
             t_min = t_eval[0]
-            inputs_with_tmin = casadi.vertcat(inputs, t_min)
+            t_max = t_eval[-1]
+            inputs_with_tlims = casadi.vertcat(inputs, t_min, t_max)
             # Call the integrator once, with the grid
             timer = pybamm.Timer()
             pybamm.logger.debug("Calling casadi integrator")
             try:
                 casadi_sol = integrator(
-                    x0=y0_diff, z0=y0_alg, p=inputs_with_tmin, **self.extra_options_call
+                    x0=y0_diff,
+                    z0=y0_alg,
+                    p=inputs_with_tlims,
+                    **self.extra_options_call,
                 )
             except RuntimeError as error:
                 # If it doesn't work raise error
@@ -0,0 +1,193 @@
+#
+# Columnar, memory-mapped storage of solutions
+#
+import json
+import os
+
+import casadi
+import numpy as np
+
+import pybamm
+from pybamm.expression_tree.operations.serialise import Serialise
+
+FORMAT_VERSION = 1
+
+
+def _to_numpy(array):
+    if isinstance(array, casadi.DM):
+        return array.full()
+    return np.asarray(array)
+
+
+def save_columnar_solution(solution, directory, mesh=None):
+    """
+    Save a solution to a directory in a columnar format, which can be loaded with
+    :func:`pybamm.load_columnar_solution` without reading the states into memory.
+
+    The times, states and (if present) time derivatives of the states of each
+    sub-solution are stored as separate ``.npy`` files, and each model of the
+    solution is serialised once with :class:`pybamm.Serialise`, however many
+    sub-solutions it has. The summary variables of the solution are saved, but its
+    cycles and steps, and any sensitivities, are not.
+
+    Parameters
+    ----------
+    solution : :class:`pybamm.Solution`
+        The solution to save.
+    directory : str or path-like
+        The directory in which to save the solution. It is created if it does not
+        exist, and any solution saved in it before is overwritten.
+    mesh : :class:`pybamm.Mesh`, optional
+        The mesh the models of the solution have been discretised over (e.g.
+        :attr:`pybamm.Simulation.mesh`). The variables of the models are only saved
+        if the mesh is given, otherwise only the states of the loaded solution are
+        available.
+    """
+    directory = os.fspath(directory)
+    os.makedirs(directory, exist_ok=True)
+    metadata_path = os.path.join(directory, "solution.json")
+    if os.path.exists(metadata_path):
+        os.remove(metadata_path)
+
+    model_indices = {}
+    sub_solutions = []
+    for i, (model, ts, ys, inputs) in enumerate(
+        zip(solution.all_models, solution.all_ts, solution.all_ys, solution.all_inputs)
+    ):
+        if model not in model_indices:
+            model_indices[model] = len(model_indices)
+            Serialise().save_model(
+                model,
+                mesh=mesh,
+                variables=model.variables if mesh is not None else None,
+                filename=os.path.join(directory, f"model_{model_indices[model]}"),
+            )
+        np.save(os.path.join(directory, f"t_{i}.npy"), _to_numpy(ts))
+        np.save(os.path.join(directory, f"y_{i}.npy"), _to_numpy(ys))
+        has_yp = solution.all_yps is not None
+        if has_yp:
+            np.save(
+                os.path.join(directory, f"yp_{i}.npy"), _to_numpy(solution.all_yps[i])
+            )
+        sub_solutions.append(
+            {
+                "model": model_indices[model],
+                "inputs": {
+                    name: _to_numpy(value).tolist() for name, value in inputs.items()
+                },
+                "has_yp": has_yp,
+            }
+        )
+
+    if solution.t_event is not None:
+        np.save(os.path.join(directory, "t_event.npy"), _to_numpy(solution.t_event))
+    if solution.y_event is not None:
+        np.save(os.path.join(directory, "y_event.npy"), _to_numpy(solution.y_event))
+
+    summary_variables = getattr(solution, "all_summary_variables", None)
+    if summary_variables:
+        names = list(summary_variables[0].keys())
+        np.savez(
+            os.path.join(directory, "summary_variables.npz"),
+            names=np.array(names),
+            values=np.array(
+                [[cycle[name] for name in names] for cycle in summary_variables],
+                dtype=float,
+            ),
+        )
+
+    metadata = {
+        "format_version": FORMAT_VERSION,
+        "pybamm_version": pybamm.__version__,
+        "number_of_models": len(model_indices),
+        "sub_solutions": sub_solutions,
+        "termination": solution.termination,
+        "has_t_event": solution.t_event is not None,
+        "has_y_event": solution.y_event is not None,
+        "has_summary_variables": bool(summary_variables),
+    }
+    # write the metadata last, as it marks the solution as complete
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f)
+
+
+def load_columnar_solution(directory, mmap_mode="r"):
+    """
+    Load a solution saved with :meth:`pybamm.Solution.save_columnar`.
+
+    Parameters
+    ----------
+    directory : str or path-like
+        The directory in which the solution has been saved.
+    mmap_mode : str or None, optional
+        The mode with which to memory-map the states, see :func:`numpy.load`.
+        Default is "r", in which case the states of each sub-solution are only read
+        from disk when they are used (e.g. when a variable is observed). If None,
+        all the states are read into memory.
+
+    Returns
+    -------
+    :class:`pybamm.Solution`
+        The loaded solution.
+    """
+    directory = os.fspath(directory)
+    with open(os.path.join(directory, "solution.json")) as f:
+        metadata = json.load(f)
+    if metadata["format_version"] != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported columnar solution format version {metadata['format_version']}"
+        )
+
+    models = [
+        Serialise().load_model(os.path.join(directory, f"model_{i}.json"))
+        for i in range(metadata["number_of_models"])
+    ]
+
+    def load(name):
+        return np.load(os.path.join(directory, name), mmap_mode=mmap_mode)
+
+    all_ts = []
+    all_ys = []
+    all_yps = []
+    all_models = []
+    all_inputs = []
+    for i, sub_solution in enumerate(metadata["sub_solutions"]):
+        # the times are small, so they are always read into memory
+        all_ts.append(np.load(os.path.join(directory, f"t_{i}.npy")))
+        all_ys.append(load(f"y_{i}.npy"))
+        if sub_solution["has_yp"]:
+            all_yps.append(load(f"yp_{i}.npy"))
+        all_models.append(models[sub_solution["model"]])
+        all_inputs.append(
+            {name: np.array(value) for name, value in sub_solution["inputs"].items()}
+        )
+
+    solution = pybamm.Solution(
+        all_ts,
+        all_ys,
+        all_models,
+        all_inputs,
+        t_event=(
+            np.load(os.path.join(directory, "t_event.npy"))
+            if metadata["has_t_event"]
+            else None
+        ),
+        y_event=(
+            np.load(os.path.join(directory, "y_event.npy"))
+            if metadata["has_y_event"]
+            else None
+        ),
+        termination=metadata["termination"],
+        all_yps=all_yps or None,
+        # checking the states would read them all
+        check_solution=False,
+    )
+
+    if metadata["has_summary_variables"]:
+        with np.load(os.path.join(directory, "summary_variables.npz")) as data:
+            names = [str(name) for name in data["names"]]
+            values = data["values"]
+        solution.set_summary_variables(
+            [dict(zip(names, cycle_values)) for cycle_values in values]
+        )
+    return solution
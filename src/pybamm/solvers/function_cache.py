@@ -0,0 +1,149 @@
+#
+# FunctionCache class
+#
+import hashlib
+import json
+import os
+
+import casadi
+
+import pybamm
+from pybamm.model_cache import _Tokeniser
+
+
+class FunctionCache:
+    """
+    A content-addressed, on-disk cache of the CasADi functions generated by
+    :meth:`pybamm.BaseSolver.set_up` (residuals, Jacobians, Jacobian actions,
+    sensitivities, events and output variables), so that a solver set up for a
+    model that has been set up before, possibly in another process, can skip the
+    conversion of the model to CasADi.
+
+    Each function is keyed by a hash of the discretised expression it was generated
+    from and the settings used to generate it (input parameter shapes,
+    sensitivities, CasADi and PyBaMM versions). Only models with
+    ``convert_to_format = "casadi"`` use the cache.
+
+    Parameters
+    ----------
+    directory : str or path-like
+        The directory in which to store the cached functions. It is created if it
+        does not exist.
+
+    Examples
+    --------
+    >>> solver = pybamm.IDAKLUSolver()  # doctest: +SKIP
+    >>> solver.function_cache = pybamm.FunctionCache("pybamm_function_cache")  # doctest: +SKIP
+    """
+
+    def __init__(self, directory):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (
+            f"FunctionCache({self.directory!r}, hits={self.hits}, misses={self.misses})"
+        )
+
+    @staticmethod
+    def tokeniser():
+        """
+        Returns a new tokeniser to pass to :meth:`FunctionCache.key`. Using the same
+        tokeniser for several keys avoids re-hashing shared subtrees.
+        """
+        return _Tokeniser()
+
+    def key(self, symbol, name, settings, tokeniser=None):
+        """
+        Compute the cache key for the functions generated from an expression.
+
+        Parameters
+        ----------
+        symbol : :class:`pybamm.Symbol`
+            The discretised expression.
+        name : str
+            The name of the generated functions.
+        settings : dict
+            Any other data that the generated functions depend on.
+        tokeniser : optional
+            A tokeniser returned by :meth:`FunctionCache.tokeniser`.
+
+        Returns
+        -------
+        str
+            The hexadecimal key of the cache entry.
+        """
+        tokeniser = tokeniser or self.tokeniser()
+        token = tokeniser.token(
+            {
+                "pybamm": pybamm.__version__,
+                "casadi": casadi.__version__,
+                "name": name,
+                "settings": settings,
+                "symbol": symbol,
+            }
+        )
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def load(self, key):
+        """
+        Load functions from the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the cache entry, as returned by :meth:`FunctionCache.key`.
+
+        Returns
+        -------
+        tuple of :class:`casadi.Function` (or None) or None
+            The cached functions, or None if there is no (readable) entry for this
+            key.
+        """
+        try:
+            with open(self._path(key)) as f:
+                serialised = json.load(f)
+            functions = tuple(
+                None if s is None else casadi.Function.deserialize(s)
+                for s in serialised
+            )
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (ValueError, RuntimeError) as e:
+            pybamm.logger.warning(
+                f"Could not load function '{key}' from the cache: {e}"
+            )
+            self.misses += 1
+            return None
+        self.hits += 1
+        return functions
+
+    def save(self, key, functions):
+        """
+        Save functions to the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the cache entry, as returned by :meth:`FunctionCache.key`.
+        functions : iterable of :class:`casadi.Function` or None
+            The functions to save.
+        """
+        serialised = [None if f is None else f.serialize() for f in functions]
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(serialised, f)
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        """Remove all the entries from the cache."""
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".json"):
+                os.remove(os.path.join(self.directory, filename))
@@ -171,6 +171,16 @@ class IDAKLUSolver(pybamm.BaseSolver):
 
     """
 
+    # the set-up includes the sundials solver, so models with the same structure also
+    # share the symbolic factorisation of the KLU linear solver
+    _set_up_attributes = (
+        *pybamm.BaseSolver._set_up_attributes,
+        "_setup",
+        "var_idaklu_fcns",
+        "dvar_dy_idaklu_fcns",
+        "dvar_dp_idaklu_fcns",
+    )
+
     def __init__(
         self,
         rtol=1e-4,
@@ -414,12 +424,11 @@ class IDAKLUSolver(pybamm.BaseSolver):
                 "rootfn",
                 [t_casadi, y_casadi, p_casadi_stacked],
                 [
-                    casadi.vertcat(
-                        *[
-                            event(t_casadi, y_casadi, p_casadi_stacked)
-                            for event in model.terminate_events_eval
-                        ]
-                    )
+                    model.events_eval(t_casadi, y_casadi, p_casadi_stacked)[
+                        :num_of_events
+                    ]
+                    if num_of_events > 0
+                    else casadi.MX(0, 1)
                 ],
             )
 
@@ -746,7 +755,13 @@ class IDAKLUSolver(pybamm.BaseSolver):
     def requires_explicit_sensitivities(self):
         return False
 
-    def _integrate(self, model, t_eval, inputs_list=None, t_interp=None):
+    @property
+    def supports_initial_conditions_per_input(self):
+        return True
+
+    def _integrate(
+        self, model, t_eval, inputs_list=None, t_interp=None, initial_states=None
+    ):
         """
         Solve a DAE model defined by residuals with initial conditions y0.
 
@@ -761,6 +776,10 @@ class IDAKLUSolver(pybamm.BaseSolver):
         t_interp : None, list or ndarray, optional
             The times (in seconds) at which to interpolate the solution. Defaults to `None`,
             which returns the adaptive time-stepping times.
+        initial_states : tuple of ndarray, optional
+            The consistent initial states and their time derivatives for each set of
+            inputs, as returned by :meth:`_consistent_initialization_per_input`. By
+            default, the initial states of the model are used for all the inputs.
         """
         if not (
             model.convert_to_format == "casadi"
@@ -785,11 +804,13 @@ class IDAKLUSolver(pybamm.BaseSolver):
         else:
             inputs = np.array([[]])
 
-        # stack y0full and ydot0full so they are a 2D array of shape (number_of_inputs, number_of_states + number_of_parameters * number_of_states)
-        # note that y0full and ydot0full are currently 1D arrays (i.e. independent of inputs), but in the future we will support
-        # different initial conditions for different inputs (see https://github.com/pybamm-team/PyBaMM/pull/4260). For now we just repeat the same initial conditions for each input
-        y0full = np.vstack([model.y0full] * len(inputs_list))
-        ydot0full = np.vstack([model.ydot0full] * len(inputs_list))
+        # y0full and ydot0full are 2D arrays of shape (number_of_inputs, number_of_states + number_of_parameters * number_of_states)
+        # if the initial states are not given for each set of inputs, the initial states of the model are repeated
+        if initial_states is None:
+            y0full = np.vstack([model.y0full] * len(inputs_list))
+            ydot0full = np.vstack([model.ydot0full] * len(inputs_list))
+        else:
+            y0full, ydot0full = initial_states
 
         atol = getattr(model, "atol", self.atol)
         atol = self._check_atol_type(atol, y0full.size)
@@ -866,6 +887,7 @@ class IDAKLUSolver(pybamm.BaseSolver):
         )
 
         newsol.integration_time = integration_time
+        newsol.integrator_set_up_time = sol.setup_time
         if not save_outputs_only:
             return newsol
 
@@ -969,6 +991,52 @@ class IDAKLUSolver(pybamm.BaseSolver):
         model.y0full = y0full
         model.ydot0full = ydot0full
 
+    def _consistent_initialization_per_input(
+        self, model, time, inputs_list, y0_list=None
+    ):
+        """
+        Calculate the consistent initial states of the model for each set of inputs,
+        so that the initial conditions may depend on the input parameters. The states
+        of the model itself are left as those of the first set of inputs (e.g. to
+        check the events).
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model for which to calculate initial conditions.
+        time : numeric type
+            The time at which to calculate the initial conditions.
+        inputs_list : list of dict
+            The input parameters of each solve.
+        y0_list : list of array-like, optional
+            The states to start from for each set of inputs (e.g. when restarting at a
+            discontinuity). By default, the initial conditions of the model are used,
+            and the model must already have the consistent initial states of the first
+            set of inputs.
+
+        Returns
+        -------
+        y0full, ydot0full : :class:`numpy.array`
+            The initial states and their time derivatives (including the
+            sensitivities), with one row per set of inputs.
+        """
+        y0full = []
+        ydot0full = []
+        for i, inputs_dict in enumerate(inputs_list):
+            if y0_list is not None:
+                model.y0 = y0_list[i]
+                self._set_consistent_initialization(model, time, inputs_dict)
+            elif i > 0:
+                self._set_initial_conditions(model, time, inputs_dict)
+                self._set_consistent_initialization(model, time, inputs_dict)
+            # otherwise the model already has the states of the first set of inputs
+            y0full.append(model.y0full)
+            ydot0full.append(model.ydot0full)
+            if i == 0:
+                first_states = (model.y0, model.y0S, model.y0full, model.ydot0full)
+        model.y0, model.y0S, model.y0full, model.ydot0full = first_states
+        return np.vstack(y0full), np.vstack(ydot0full)
+
     def _rhs_dot_consistent_initialization(self, y0, model, time, inputs_dict):
         """
         Compute the consistent initialization of ydot0 for the differential terms
@@ -0,0 +1,127 @@
+#
+# ObservationFunctionCache class
+#
+import numpy as np
+
+import pybamm
+from pybamm.solvers.lrudict import LRUDict
+
+
+class ObservationFunctionCache:
+    """
+    A bounded, in-memory, least-recently-used cache of the CasADi functions used to
+    evaluate ("observe") variables from the states of a solution, and of their
+    serialised form, which is passed to the IDAKLU observation functions.
+
+    Each function is keyed by the ``id`` of the expression it was generated from,
+    the number of states and the shapes of the input parameters, so the functions
+    are shared between all the models and solutions of the process that contain
+    the same expression (e.g. the models for each step of an experiment, or models
+    that are built again). A process-wide instance is available as
+    ``pybamm.observation_function_cache``.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of functions to keep. Default is 1024.
+
+    Attributes
+    ----------
+    hits : int
+        The number of functions (and serialised functions) found in the cache.
+    misses : int
+        The number of functions (and serialised functions) that were not found in
+        the cache.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.hits = 0
+        self.misses = 0
+        # key: [function, serialised function or None]
+        self._entries = LRUDict(maxsize=maxsize)
+        # id of the function: key, for the functions added to the cache (which may
+        # have been evicted since)
+        self._keys = {}
+
+    @property
+    def maxsize(self):
+        return self._entries.maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        self._entries.maxsize = value
+
+    def __repr__(self):
+        return (
+            f"ObservationFunctionCache(maxsize={self.maxsize}, size={len(self)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(symbols, inputs, ys_shape):
+        """
+        Compute the cache key of the function of a list of expressions.
+
+        Parameters
+        ----------
+        symbols : list of :class:`pybamm.Symbol`
+            The expressions, one for each output of the function.
+        inputs : dict
+            The input parameters of the solution.
+        ys_shape : tuple
+            The shape of the states of the solution.
+        """
+        return (
+            tuple(symbol.id for symbol in symbols),
+            ys_shape[0],
+            tuple((name, np.shape(value)) for name, value in inputs.items()),
+        )
+
+    def function(self, key, create):
+        """
+        Return the function with the given key, calling `create()` to create it if
+        it is not in the cache.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = [create(), None]
+            self._entries[key] = entry
+            self._keys[id(entry[0])] = key
+            if len(self._keys) > 2 * len(self._entries):
+                # forget the functions that have been evicted
+                self._keys = {
+                    id(function): key for key, (function, _) in self._entries.items()
+                }
+        else:
+            self.hits += 1
+        return entry[0]
+
+    def serialize(self, function):
+        """
+        Return the serialised form of a function, which is only computed once for
+        the functions in the cache.
+        """
+        entry = self._entries.get(self._keys.get(id(function)))
+        if entry is None or entry[0] is not function:
+            return function.serialize()
+        if entry[1] is None:
+            self.misses += 1
+            entry[1] = function.serialize()
+        else:
+            self.hits += 1
+        return entry[1]
+
+    def clear(self):
+        """Remove all the functions from the cache and reset the counters."""
+        self._entries.clear()
+        self._keys.clear()
+        self.hits = 0
+        self.misses = 0
+        pybamm.logger.debug("Cleared the observation function cache")
+
+
+observation_function_cache = ObservationFunctionCache()
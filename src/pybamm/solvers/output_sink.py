@@ -0,0 +1,156 @@
+#
+# Output sinks for streaming experiment solutions to disk
+#
+import os
+import re
+
+import numpy as np
+
+import pybamm
+
+
+class OutputSink:
+    """
+    Base class for output sinks, which receive the solution of each cycle of an
+    experiment as soon as the cycle is completed, so that the full solution of the
+    cycle does not have to be kept in memory. Pass an output sink to
+    :meth:`pybamm.Simulation.solve` with the ``output_sink`` argument.
+
+    Subclasses must implement :meth:`OutputSink.write_cycle`.
+    """
+
+    def write_cycle(self, cycle_number, cycle_solution, summary_variables):
+        """
+        Write the output of a cycle.
+
+        Parameters
+        ----------
+        cycle_number : int
+            The number of the cycle, starting from 1 (including the cycles of the
+            starting solution, if any).
+        cycle_solution : :class:`pybamm.Solution`
+            The solution of the cycle.
+        summary_variables : dict
+            The summary variables of the cycle.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Called when the experiment ends, or is interrupted by an error. Does nothing
+        by default.
+        """
+
+
+class NpzOutputSink(OutputSink):
+    """
+    Output sink that writes selected variables and the summary variables of each
+    cycle to a separate ``.npz`` file (shard) in a directory.
+
+    Parameters
+    ----------
+    directory : str or path-like
+        The directory in which to write the shards. It is created if it does not
+        exist.
+    output_variables : list of str, optional
+        The variables to write for each cycle. Default is
+        ``["Time [s]", "Current [A]", "Voltage [V]"]``.
+
+    Examples
+    --------
+    >>> sink = pybamm.NpzOutputSink("ageing_output")  # doctest: +SKIP
+    >>> sim.solve(output_sink=sink)  # doctest: +SKIP
+    >>> sink.load_cycle(1000)["Voltage [V]"]  # doctest: +SKIP
+    """
+
+    _shard_name = "cycle_{:06d}.npz"
+
+    def __init__(self, directory, output_variables=None):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.output_variables = output_variables or [
+            "Time [s]",
+            "Current [A]",
+            "Voltage [V]",
+        ]
+
+    def __repr__(self):
+        return f"NpzOutputSink({self.directory!r})"
+
+    def _path(self, cycle_number):
+        return os.path.join(self.directory, self._shard_name.format(cycle_number))
+
+    @property
+    def cycle_numbers(self):
+        """The numbers of the cycles that have been written, in increasing order"""
+        numbers = []
+        for filename in os.listdir(self.directory):
+            match = re.fullmatch(r"cycle_(\d+)\.npz", filename)
+            if match:
+                numbers.append(int(match.group(1)))
+        return sorted(numbers)
+
+    def write_cycle(self, cycle_number, cycle_solution, summary_variables):
+        # Variable names are not valid keys of npz files in general, so the
+        # names are stored separately
+        arrays = {
+            "variable_names": np.array(self.output_variables),
+            "summary_variable_names": np.array(list(summary_variables.keys())),
+            "summary_variable_values": np.array(
+                list(summary_variables.values()), dtype=float
+            ),
+        }
+        for i, name in enumerate(self.output_variables):
+            arrays[f"variable_{i}"] = cycle_solution[name].data
+
+        path = self._path(cycle_number)
+        # write to a temporary file first, so that an interrupted run doesn't leave
+        # a truncated shard
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+        pybamm.logger.verbose(f"Wrote cycle {cycle_number} to {path}")
+
+    def load_cycle(self, cycle_number):
+        """
+        Load the variables of a cycle.
+
+        Parameters
+        ----------
+        cycle_number : int
+            The number of the cycle.
+
+        Returns
+        -------
+        dict
+            The data of each output variable for the cycle.
+        """
+        with np.load(self._path(cycle_number)) as shard:
+            return {
+                str(name): shard[f"variable_{i}"]
+                for i, name in enumerate(shard["variable_names"])
+            }
+
+    def load_summary_variables(self):
+        """
+        Load the summary variables of all the cycles that have been written.
+
+        Returns
+        -------
+        dict
+            The values of each summary variable, with one entry per cycle (in the
+            order given by :attr:`NpzOutputSink.cycle_numbers`).
+        """
+        summary_variables = {}
+        for cycle_number in self.cycle_numbers:
+            with np.load(self._path(cycle_number)) as shard:
+                names = shard["summary_variable_names"]
+                values = shard["summary_variable_values"]
+            for name, value in zip(names, values):
+                summary_variables.setdefault(str(name), []).append(value)
+        return {name: np.array(value) for name, value in summary_variables.items()}
+
+    def clear(self):
+        """Remove all the shards from the directory."""
+        for cycle_number in self.cycle_numbers:
+            os.remove(self._path(cycle_number))
@@ -2,13 +2,19 @@
 # Processed Variable class
 #
 from typing import Optional
+import numbers
 import casadi
 import numpy as np
 import pybamm
+from pybamm.solvers.lrudict import LRUDict
 from scipy.integrate import cumulative_trapezoid
 import xarray as xr
 import bisect
 
+# Indices and weights for the linear interpolation of a coordinate at given points,
+# keyed by the coordinate and the points, see `_interpolation_weights`
+_interpolation_weights_cache = LRUDict(maxsize=64)
+
 
 class ProcessedVariable:
     """
@@ -51,7 +57,8 @@ class ProcessedVariable:
         self.all_inputs_casadi = solution.all_inputs_casadi
 
         self.mesh = base_variables[0].mesh
-        self.domain = base_variables[0].domain
+        # the domain lists of symbols are shared, so keep a list of our own
+        self.domain = list(base_variables[0].domain)
         self.domains = base_variables[0].domains
         self.time_integral = time_integral
 
@@ -84,8 +91,23 @@ class ProcessedVariable:
         if self.entries_raw_initialized:
             return
 
-        entries = self.observe_raw()
+        self._set_entries_raw(self.observe_raw())
+
+    def initialise_from_base_values(self, base_values):
+        """
+        Initialise the variable from the values of the base variable at all the time
+        points of the solution, instead of observing them.
+
+        Parameters
+        ----------
+        base_values : numpy.ndarray
+            The values of the base variable, with shape (size of the base variable,
+            number of time points).
+        """
+        entries = np.reshape(base_values, self._shape(self.t_pts), order="F")
+        self._set_entries_raw(self._observe_postfix(entries, self.t_pts))
 
+    def _set_entries_raw(self, entries):
         t = self.t_pts
         entries_for_interp, coords = self._interp_setup(entries, t)
 
@@ -163,7 +185,7 @@ class ProcessedVariable:
         for i in range(len(idxs)):
             vars = self.base_variables_casadi[idxs[i]]
             if vars not in funcs_unique:
-                funcs_unique[vars] = vars.serialize()
+                funcs_unique[vars] = pybamm.observation_function_cache.serialize(vars)
             funcs[i] = funcs_unique[vars]
 
         return ts, ys, yps, funcs, inputs, is_f_contiguous
@@ -275,7 +297,7 @@ class ProcessedVariable:
                 )
 
             if self.time_integral is None:
-                processed_entries = self._xr_interpolate(
+                processed_entries = self._interpolate(
                     entries_for_interp,
                     coords,
                     observe_raw,
@@ -304,6 +326,74 @@ class ProcessedVariable:
 
         return processed_entries
 
+    def _interpolate(
+        self,
+        entries_for_interp,
+        coords,
+        observe_raw,
+        t=None,
+        x=None,
+        r=None,
+        y=None,
+        z=None,
+        R=None,
+        fill_value=None,
+    ):
+        """
+        Evaluate the variable at arbitrary *dimensional* t (and x, r, y, z and/or R),
+        using linear interpolation along each given dimension. This gives the same
+        result as :meth:`_xr_interpolate`, but operates directly on the arrays, using
+        cached interpolation indices and weights for each query grid, and only
+        falls back to xarray for the cases it does not handle.
+        """
+        kwargs = {"t": t, "x": x, "r": r, "y": y, "z": z, "R": R}
+        kwargs = {key: value for key, value in kwargs.items() if value is not None}
+        all_points = {key: np.asarray(value) for key, value in kwargs.items()}
+        extrapolate = isinstance(fill_value, str) and fill_value == "extrapolate"
+        fast = (
+            (extrapolate or isinstance(fill_value, numbers.Number))
+            and np.issubdtype(entries_for_interp.dtype, np.number)
+            and all(
+                key in coords
+                and len(coords[key]) > 1
+                and _is_sorted(coords[key])
+                and points.ndim <= 1
+                and np.issubdtype(points.dtype, np.number)
+                for key, points in all_points.items()
+            )
+        )
+        if not fast:
+            return self._xr_interpolate(
+                entries_for_interp,
+                coords,
+                observe_raw,
+                fill_value=fill_value,
+                **kwargs,
+            )
+
+        out = entries_for_interp
+        names = list(coords)
+        # interpolate the dimensions that reduce the size of the array most first
+        for key in sorted(
+            all_points, key=lambda key: all_points[key].size / len(coords[key])
+        ):
+            axis = names.index(key)
+            points = all_points[key]
+            indices, weights, outside = _interpolation_weights(coords[key], points)
+            shape = [1] * out.ndim
+            shape[axis] = -1
+            weights = weights.reshape(shape)
+            out = (
+                np.take(out, indices, axis=axis) * (1 - weights)
+                + np.take(out, indices + 1, axis=axis) * weights
+            )
+            if not extrapolate and outside.any():
+                out[(slice(None),) * axis + (outside,)] = fill_value
+            if points.ndim == 0:
+                out = np.take(out, 0, axis=axis)
+                names.pop(axis)
+        return out
+
     def _xr_interpolate(
         self,
         entries_for_interp,
@@ -931,6 +1021,45 @@ def _is_f_contiguous(all_ys):
     return all(isinstance(y, np.ndarray) and y.data.f_contiguous for y in all_ys)
 
 
+def _interpolation_weights(coord, points):
+    """
+    Return the indices and weights for the linear interpolation of a sorted coordinate
+    at the given points, as for :func:`scipy.interpolate.interp1d`, and a mask of the
+    points outside the coordinate. The value at each point is
+    `(1 - weight) * values[index] + weight * values[index + 1]`, and the results are
+    cached for each coordinate and set of points.
+
+    Args:
+        coord (np.ndarray): the sorted coordinate
+        points (np.ndarray): the points to interpolate at (a scalar or a vector)
+
+    Returns:
+        tuple: the indices, weights and mask, each with the size of `points`
+    """
+    coord = np.asarray(coord, dtype=float)
+    points = np.asarray(points, dtype=float)
+    key = (coord.tobytes(), points.tobytes(), points.shape)
+    cached = _interpolation_weights_cache.get(key)
+    if cached is not None:
+        return cached
+
+    points = points.reshape(-1)
+    # each point is in the interval [coord[index], coord[index + 1]], and equal
+    # coordinates (e.g. at the end of a step) take the value of the first one
+    indices = np.clip(
+        np.searchsorted(coord, points, side="left") - 1, 0, len(coord) - 2
+    )
+    lower = coord[indices]
+    width = coord[indices + 1] - lower
+    weights = np.divide(
+        points - lower, width, out=np.ones_like(points), where=width != 0
+    )
+    outside = (points < coord[0]) | (points > coord[-1])
+
+    _interpolation_weights_cache[key] = (indices, weights, outside)
+    return indices, weights, outside
+
+
 def _is_sorted(t):
     """
     Check if an array is sorted
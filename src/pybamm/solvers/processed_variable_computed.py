@@ -57,7 +57,8 @@ class ProcessedVariableComputed:
         self.all_inputs_casadi = solution.all_inputs_casadi
 
         self.mesh = base_variables[0].mesh
-        self.domain = base_variables[0].domain
+        # the domain lists of symbols are shared, so keep a list of our own
+        self.domain = list(base_variables[0].domain)
         self.domains = base_variables[0].domains
         self.cumtrapz_ic = cumtrapz_ic
 
@@ -130,6 +130,8 @@ class Solution:
         self.set_up_time = None
         self.solve_time = None
         self.integration_time = None
+        # time spent (re)initialising the integrator, if reported by the solver
+        self.integrator_set_up_time = None
 
         # initialize empty variables and data
         self._variables = pybamm.FuzzyDict()
@@ -476,6 +478,7 @@ class Solution:
 
         new_sol.solve_time = 0
         new_sol.integration_time = 0
+        new_sol.integrator_set_up_time = 0
         new_sol.set_up_time = 0
 
         return new_sol
@@ -515,6 +518,7 @@ class Solution:
         new_sol._sub_solutions = self.sub_solutions[-1:]
         new_sol.solve_time = 0
         new_sol.integration_time = 0
+        new_sol.integrator_set_up_time = 0
         new_sol.set_up_time = 0
 
         return new_sol
@@ -570,6 +574,104 @@ class Solution:
         for variable in variables:
             self._update_variable(variable)
 
+    def observe_many(self, variables):
+        """
+        Process several variables at once. For each model of the solution, all the
+        variables are evaluated by a single CasADi function (with common
+        subexpressions of the variables evaluated only once), which is called once
+        for all the time points of the model, instead of creating and evaluating a
+        separate function for each variable.
+
+        Parameters
+        ----------
+        variables : list of str
+            The names of the variables.
+
+        Returns
+        -------
+        dict
+            The :class:`pybamm.ProcessedVariable` of each variable.
+        """
+        # make sure that sensitivities are extracted if required
+        if isinstance(self._all_sensitivities, bool) and self._all_sensitivities:
+            self.extract_explicit_sensitivities()
+
+        if isinstance(variables, str):
+            variables = [variables]
+        new_variables = [
+            variable
+            for variable in dict.fromkeys(variables)
+            if variable not in self._variables
+        ]
+        if new_variables:
+            if any(ys.size == 0 for ys in self.all_ys):
+                # the states are not available, see `_update_variable`
+                self.update(new_variables)
+            else:
+                self._observe_many(new_variables)
+        return {variable: self._variables[variable] for variable in variables}
+
+    def _observe_many(self, variables):
+        time_integrals = {}
+        vars_pybamm = {variable: [] for variable in variables}
+        vars_casadi = {variable: [] for variable in variables}
+        base_values = {variable: [] for variable in variables}
+        key = ("observe many", tuple(variables))
+        for model, ts, ys, inputs, inputs_casadi in zip(
+            self.all_models,
+            self.all_ts,
+            self.all_ys,
+            self.all_inputs,
+            self.all_inputs_casadi,
+        ):
+            for variable in variables:
+                var_pybamm = model.variables_and_events[variable]
+                if isinstance(
+                    var_pybamm, (pybamm.ExplicitTimeIntegral, pybamm.DiscreteTimeSum)
+                ):
+                    time_integrals[variable] = (
+                        pybamm.ProcessedVariableTimeIntegral.from_pybamm_var(var_pybamm)
+                    )
+                    var_pybamm = var_pybamm.child
+                vars_pybamm[variable].append(var_pybamm)
+
+            if key not in model._variables_casadi:
+                pybamm.logger.debug(f"Post-processing {len(variables)} variables")
+                model._variables_casadi[key] = self._get_casadi_vars(
+                    [vars_pybamm[variable][-1] for variable in variables],
+                    inputs,
+                    ys.shape,
+                )
+            fused_casadi = model._variables_casadi[key]
+            # evaluate all the variables at all the time points at once
+            outputs = fused_casadi.map(len(ts))(
+                np.reshape(ts, (1, -1)), ys, inputs_casadi
+            )
+            if len(variables) == 1:
+                outputs = [outputs]
+            for i, variable in enumerate(variables):
+                base_values[variable].append(outputs[i].full())
+                # the function of each variable is still needed for interpolation
+                if variable not in model._variables_casadi:
+                    cache = pybamm.observation_function_cache
+                    model._variables_casadi[variable] = cache.function(
+                        cache.key([vars_pybamm[variable][-1]], inputs, ys.shape),
+                        lambda i=i, fused=fused_casadi: fused.slice(
+                            "variable", [0, 1, 2], [i]
+                        ),
+                    )
+                vars_casadi[variable].append(model._variables_casadi[variable])
+
+        for variable in variables:
+            var = pybamm.process_variable(
+                vars_pybamm[variable],
+                vars_casadi[variable],
+                self,
+                time_integral=time_integrals.get(variable),
+            )
+            var.initialise_from_base_values(np.hstack(base_values[variable]))
+            self._variables[variable] = var
+
     def _update_variable(self, variable):
         time_integral = None
         pybamm.logger.debug(f"Post-processing {variable}")
@@ -601,21 +703,13 @@ class Solution:
                 if variable in model._variables_casadi:
                     var_casadi = model._variables_casadi[variable]
                 else:
-                    var_casadi = self.process_casadi_var(
-                        var_pybamm,
-                        inputs,
-                        ys.shape,
-                    )
+                    var_casadi = self._get_casadi_vars([var_pybamm], inputs, ys.shape)
                     model._variables_casadi[variable] = var_casadi
                 vars_pybamm[i] = var_pybamm
             elif variable in model._variables_casadi:
                 var_casadi = model._variables_casadi[variable]
             else:
-                var_casadi = self.process_casadi_var(
-                    var_pybamm,
-                    inputs,
-                    ys.shape,
-                )
+                var_casadi = self._get_casadi_vars([var_pybamm], inputs, ys.shape)
                 model._variables_casadi[variable] = var_casadi
             vars_casadi.append(var_casadi)
         var = pybamm.process_variable(
@@ -625,19 +719,44 @@ class Solution:
         self._variables[variable] = var
 
     def process_casadi_var(self, var_pybamm, inputs, ys_shape):
+        return self._process_casadi_vars([var_pybamm], inputs, ys_shape)
+
+    def _get_casadi_vars(self, vars_pybamm, inputs, ys_shape):
+        """
+        Return the CasADi function of the variables in `vars_pybamm` (see
+        :meth:`Solution._process_casadi_vars`) from the process-wide
+        :class:`pybamm.ObservationFunctionCache`, creating it if needed.
+        """
+        cache = pybamm.observation_function_cache
+        return cache.function(
+            cache.key(vars_pybamm, inputs, ys_shape),
+            lambda: self._process_casadi_vars(vars_pybamm, inputs, ys_shape),
+        )
+
+    def _process_casadi_vars(self, vars_pybamm, inputs, ys_shape):
+        """
+        Create a CasADi function of (t, y, inputs) with one output for each of the
+        variables in `vars_pybamm`. Common subexpressions of the variables are only
+        evaluated once.
+        """
         t_MX = casadi.MX.sym("t")
         y_MX = casadi.MX.sym("y", ys_shape[0])
         inputs_MX_dict = {
             key: casadi.MX.sym("input", value.shape[0]) for key, value in inputs.items()
         }
         inputs_MX = casadi.vertcat(*[p for p in inputs_MX_dict.values()])
-        var_sym = var_pybamm.to_casadi(t_MX, y_MX, inputs=inputs_MX_dict)
+        # share the conversion of common subtrees between the variables
+        converter = pybamm.CasadiConverter()
+        vars_sym = [
+            converter.convert(var_pybamm, t_MX, y_MX, None, inputs_MX_dict)
+            for var_pybamm in vars_pybamm
+        ]
 
         opts = {
             "cse": True,
             "inputs_check": False,
             "is_diff_in": [False, False, False],
-            "is_diff_out": [False],
+            "is_diff_out": [False] * len(vars_sym),
             "regularity_check": False,
             "error_on_fail": False,
             "enable_jacobian": False,
@@ -648,12 +767,12 @@ class Solution:
         # subtract the same number to the variable to reinforce the
         # variable bounds. This does not affect the answer
         epsilon = 1.0
-        var_sym = (var_sym - epsilon) + epsilon
+        vars_sym = [(var_sym - epsilon) + epsilon for var_sym in vars_sym]
 
         var_casadi = casadi.Function(
             "variable",
             [t_MX, y_MX, inputs_MX],
-            [var_sym],
+            vars_sym,
             opts,
         )
 
@@ -667,6 +786,68 @@ class Solution:
 
         return var_casadi_out
 
+    def _evaluate_scalar_variables(self, variables, index):
+        """
+        Evaluate scalar variables at the first (``index=0``) or last (``index=-1``)
+        state of the solution. All the variables are evaluated with a single compiled
+        CasADi function, which is stored in the model, instead of creating a
+        ProcessedVariable for each of them.
+
+        Parameters
+        ----------
+        variables : list of str
+            The names of the variables.
+        index : int
+            0 for the first state, -1 for the last state.
+
+        Returns
+        -------
+        dict or None
+            The value of each variable, or None if the variables cannot be evaluated
+            in this way (e.g. time integrals or non-scalar variables), in which case
+            ProcessedVariables should be used instead.
+        """
+        if isinstance(self._all_sensitivities, bool) and self._all_sensitivities:
+            # explicit sensitivities need to be extracted from the states first
+            return None
+        model = self.all_models[index]
+        ys = self.all_ys[index]
+        if ys.shape[0] == 0:
+            return None
+
+        key = ("scalar variables", tuple(variables))
+        if key not in model._variables_casadi:
+            vars_pybamm = []
+            for variable in variables:
+                var_pybamm = model.variables_and_events.get(variable)
+                if (
+                    var_pybamm is None
+                    or isinstance(
+                        var_pybamm,
+                        (pybamm.ExplicitTimeIntegral, pybamm.DiscreteTimeSum),
+                    )
+                    or var_pybamm.size != 1
+                ):
+                    vars_pybamm = None
+                    break
+                vars_pybamm.append(var_pybamm)
+            if vars_pybamm is None:
+                model._variables_casadi[key] = None
+            else:
+                model._variables_casadi[key] = self._get_casadi_vars(
+                    [pybamm.NumpyConcatenation(*vars_pybamm)],
+                    self.all_inputs[index],
+                    ys.shape,
+                )
+        var_casadi = model._variables_casadi[key]
+        if var_casadi is None:
+            return None
+
+        values = var_casadi(
+            self.all_ts[index][index], ys[:, index], self.all_inputs_casadi[index]
+        )
+        return dict(zip(variables, values.full().flatten()))
+
     def __getitem__(self, key):
         """Read a variable from the solution. Variables are created 'just in time', i.e.
         only when they are called.
@@ -716,6 +897,25 @@ class Solution:
         with open(filename, "wb") as f:
             pickle.dump(self, f, pickle.HIGHEST_PROTOCOL)
 
+    def save_columnar(self, directory, mesh=None):
+        """
+        Save the solution to a directory in a columnar format, with the states of
+        each sub-solution in a separate file, so that it can be loaded with
+        :func:`pybamm.load_columnar_solution` without reading all the states into
+        memory. See :func:`pybamm.solvers.columnar_solution.save_columnar_solution`.
+
+        Parameters
+        ----------
+        directory : str or path-like
+            The directory in which to save the solution.
+        mesh : :class:`pybamm.Mesh`, optional
+            The mesh the models have been discretised over, required to process the
+            variables of the loaded solution.
+        """
+        pybamm.solvers.columnar_solution.save_columnar_solution(
+            self, directory, mesh=mesh
+        )
+
     def get_data_dict(self, variables=None, short_names=None, cycles_and_steps=True):
         """
         Construct a (standard python) dictionary of the solution data containing the
@@ -748,9 +948,9 @@ class Solution:
             if isinstance(variables, str):
                 variables = [variables]
             # otherwise, save only the variables specified
-            data_long_names = {}
-            for name in variables:
-                data_long_names[name] = self[name].data
+            data_long_names = {
+                name: var.data for name, var in self.observe_many(variables).items()
+            }
         if len(data_long_names) == 0:
             raise ValueError(
                 """
@@ -881,11 +1081,7 @@ class Solution:
             )
         # Special case: new solution only has one timestep and it is already in the
         # existing solution. In this case, return a copy of the existing solution
-        if (
-            len(other.all_ts) == 1
-            and len(other.all_ts[0]) == 1
-            and other.all_ts[0][0] == self.all_ts[-1][-1]
-        ):
+        if _is_repeated_last_timestep(other, self.all_ts[-1][-1]):
             new_sol = self.copy()
             # Update termination using the latter solution
             new_sol._termination = other.termination
@@ -893,76 +1089,9 @@ class Solution:
             new_sol._y_event = other._y_event
             return new_sol
 
-        # Update list of sub-solutions
-        hermite_interpolation = (
-            other.hermite_interpolation and self.hermite_interpolation
-        )
-        if other.all_ts[0][0] == self.all_ts[-1][-1]:
-            # Skip first time step if it is repeated
-            all_ts = self.all_ts + [other.all_ts[0][1:]] + other.all_ts[1:]
-            all_ys = self.all_ys + [other.all_ys[0][:, 1:]] + other.all_ys[1:]
-            if hermite_interpolation:
-                all_yps = self.all_yps + [other.all_yps[0][:, 1:]] + other.all_yps[1:]
-        else:
-            all_ts = self.all_ts + other.all_ts
-            all_ys = self.all_ys + other.all_ys
-            if hermite_interpolation:
-                all_yps = self.all_yps + other.all_yps
-
-        if not hermite_interpolation:
-            all_yps = None
-
-        # sensitivities can be:
-        # - bool if not using sensitivities or using explicit sensitivities which still
-        #   need to be extracted
-        # - dict if sensitivities are provided as a dict of {parameter: sensitivities}
-        # both self and other should have the same type of sensitivities
-        # OR both can be either False or {} (i.e. no sensitivities)
-        if isinstance(self._all_sensitivities, bool) and isinstance(
-            other._all_sensitivities, bool
-        ):
-            all_sensitivities = self._all_sensitivities or other._all_sensitivities
-        elif isinstance(self._all_sensitivities, dict) and isinstance(
-            other._all_sensitivities, dict
-        ):
-            all_sensitivities = self._all_sensitivities
-            # we can assume that the keys are the same for both solutions
-            for key in other._all_sensitivities:
-                all_sensitivities[key] = (
-                    all_sensitivities[key] + other._all_sensitivities[key]
-                )
-        elif not self._all_sensitivities and not other._all_sensitivities:
-            all_sensitivities = {}
-        else:
-            raise ValueError("Sensitivities must be of the same type")
-
-        new_sol = Solution(
-            all_ts,
-            all_ys,
-            self.all_models + other.all_models,
-            self.all_inputs + other.all_inputs,
-            other.t_event,
-            other.y_event,
-            other.termination,
-            all_sensitivities=all_sensitivities,
-            all_yps=all_yps,
-        )
-
-        new_sol.closest_event_idx = other.closest_event_idx
-        new_sol._all_inputs_casadi = self.all_inputs_casadi + other.all_inputs_casadi
-
-        # Add timers (if available)
-        for attr in ["solve_time", "integration_time", "set_up_time"]:
-            if (
-                getattr(self, attr, None) is not None
-                and getattr(other, attr, None) is not None
-            ):
-                setattr(new_sol, attr, getattr(self, attr) + getattr(other, attr))
-
-        # Set sub_solutions
-        new_sol._sub_solutions = self.sub_solutions + other.sub_solutions
-
-        return new_sol
+        builder = SolutionBuilder(self)
+        builder.append(other)
+        return builder.build()
 
     def __radd__(self, other):
         return self.__add__(other)
@@ -986,6 +1115,7 @@ class Solution:
 
         new_sol.solve_time = self.solve_time
         new_sol.integration_time = self.integration_time
+        new_sol.integrator_set_up_time = self.integrator_set_up_time
         new_sol.set_up_time = self.set_up_time
 
         return new_sol
@@ -1050,6 +1180,243 @@ class EmptySolution:
         return EmptySolution(termination=self.termination, t=self.t)
 
 
+def _is_repeated_last_timestep(solution, t_last):
+    """
+    Whether a solution only has one timestep, which is the last timestep of the
+    solution it is added to
+    """
+    return (
+        len(solution.all_ts) == 1
+        and len(solution.all_ts[0]) == 1
+        and solution.all_ts[0][0] == t_last
+    )
+
+
+class SolutionBuilder:
+    """
+    Append-only builder for a :class:`Solution` made up of several solutions, e.g. the
+    solutions of the steps of an experiment.
+
+    Adding solutions one at a time with ``+`` copies the lists of times, states,
+    models, inputs and sub-solutions of the solution built so far each time, so the
+    cost of adding n solutions grows quadratically with n. The builder instead only
+    extends its lists when a solution is appended, and the :class:`Solution` is
+    created once, by :meth:`SolutionBuilder.build`. The result is the same as adding
+    the solutions with ``+``.
+
+    Parameters
+    ----------
+    solution : :class:`Solution` or :class:`EmptySolution`, optional
+        The first solution.
+    """
+
+    def __init__(self, solution=None):
+        self._all_ts = []
+        self._all_ys = []
+        self._all_yps = []
+        self._all_models = []
+        self._all_inputs = []
+        self._all_inputs_casadi = []
+        self._sub_solutions = []
+        self._all_sensitivities = None
+        self._hermite_interpolation = True
+        self._timers = {}
+        self._t_last = None
+        self._last = None
+        self._empty_solution = None
+        self._last_state = None
+        if solution is not None:
+            self.append(solution)
+
+    def append(self, solution):
+        """
+        Append a solution, with the same rules as :meth:`Solution.__add__`.
+
+        Parameters
+        ----------
+        solution : :class:`Solution`, :class:`EmptySolution` or None
+            The solution to append.
+        """
+        if solution is None:
+            return
+        if isinstance(solution, EmptySolution):
+            # An empty solution is only kept if there is nothing else to return
+            if self._last is None:
+                self._empty_solution = solution
+            return
+        if not isinstance(solution, Solution):
+            raise pybamm.SolverError(
+                "Only a Solution or None can be added to a Solution"
+            )
+
+        self._last_state = None
+        if self._last is None:
+            self._append_first(solution)
+            return
+
+        if _is_repeated_last_timestep(solution, self._t_last):
+            # Only update the termination using the latter solution
+            self._set_termination(solution)
+            return
+
+        self._hermite_interpolation = (
+            self._hermite_interpolation and solution.hermite_interpolation
+        )
+        if solution.all_ts[0][0] == self._t_last:
+            # Skip first time step if it is repeated
+            self._all_ts.append(solution.all_ts[0][1:])
+            self._all_ys.append(solution.all_ys[0][:, 1:])
+            if self._hermite_interpolation:
+                self._all_yps.append(solution.all_yps[0][:, 1:])
+            self._all_ts.extend(solution.all_ts[1:])
+            self._all_ys.extend(solution.all_ys[1:])
+            if self._hermite_interpolation:
+                self._all_yps.extend(solution.all_yps[1:])
+        else:
+            self._all_ts.extend(solution.all_ts)
+            self._all_ys.extend(solution.all_ys)
+            if self._hermite_interpolation:
+                self._all_yps.extend(solution.all_yps)
+        if not self._hermite_interpolation:
+            self._all_yps = []
+
+        # sensitivities can be:
+        # - bool if not using sensitivities or using explicit sensitivities which still
+        #   need to be extracted
+        # - dict if sensitivities are provided as a dict of {parameter: sensitivities}
+        # both solutions should have the same type of sensitivities
+        # OR both can be either False or {} (i.e. no sensitivities)
+        sensitivities = solution._all_sensitivities
+        if isinstance(self._all_sensitivities, bool) and isinstance(
+            sensitivities, bool
+        ):
+            self._all_sensitivities = self._all_sensitivities or sensitivities
+        elif isinstance(self._all_sensitivities, dict) and isinstance(
+            sensitivities, dict
+        ):
+            # we can assume that the keys are the same for both solutions
+            for key in sensitivities:
+                self._all_sensitivities[key].extend(sensitivities[key])
+        elif not self._all_sensitivities and not sensitivities:
+            self._all_sensitivities = {}
+        else:
+            raise ValueError("Sensitivities must be of the same type")
+
+        self._all_models.extend(solution.all_models)
+        self._all_inputs.extend(solution.all_inputs)
+        self._all_inputs_casadi.extend(solution.all_inputs_casadi)
+        self._sub_solutions.extend(solution.sub_solutions)
+
+        # Add timers (if available)
+        for attr, value in self._timers.items():
+            other_value = getattr(solution, attr, None)
+            if value is not None and other_value is not None:
+                self._timers[attr] = value + other_value
+            else:
+                self._timers[attr] = None
+
+        self._t_last = solution.all_ts[-1][-1]
+        self._last = solution
+        self._set_termination(solution)
+        self._closest_event_idx = solution.closest_event_idx
+
+    def _set_termination(self, solution):
+        self._t_event = solution._t_event
+        self._y_event = solution._y_event
+        self._termination = solution.termination
+
+    def _append_first(self, solution):
+        self._all_ts = list(solution.all_ts)
+        self._all_ys = list(solution.all_ys)
+        self._hermite_interpolation = solution.hermite_interpolation
+        self._all_yps = list(solution.all_yps) if solution.hermite_interpolation else []
+        self._all_models = list(solution.all_models)
+        self._all_inputs = list(solution.all_inputs)
+        self._all_inputs_casadi = list(solution.all_inputs_casadi)
+        self._sub_solutions = list(solution.sub_solutions)
+        if isinstance(solution._all_sensitivities, dict):
+            self._all_sensitivities = {
+                key: list(value) for key, value in solution._all_sensitivities.items()
+            }
+        else:
+            self._all_sensitivities = solution._all_sensitivities
+        self._timers = {
+            attr: getattr(solution, attr, None)
+            for attr in [
+                "solve_time",
+                "integration_time",
+                "integrator_set_up_time",
+                "set_up_time",
+            ]
+        }
+        self._t_last = solution.all_ts[-1][-1]
+        self._last = solution
+        self._set_termination(solution)
+        self._closest_event_idx = solution.closest_event_idx
+
+    @property
+    def last_state(self):
+        """
+        A Solution object that only contains the final state, see
+        :attr:`Solution.last_state`. This can be used to start the next solution
+        without building the full solution.
+        """
+        if self._last is None:
+            return self._empty_solution
+        if self._last_state is None:
+            # the last appended solution contains the final state
+            last_state = self._last.last_state
+            last_state._t_event = self._t_event
+            last_state._y_event = self._y_event
+            last_state._termination = self._termination
+            self._last_state = last_state
+        return self._last_state
+
+    def build(self):
+        """
+        Create the solution.
+
+        Returns
+        -------
+        :class:`Solution`, :class:`EmptySolution` or None
+            The solution made up of all the appended solutions. If only empty
+            solutions have been appended, the last empty solution is returned, and if
+            no solutions have been appended, None is returned.
+        """
+        if self._last is None:
+            if self._empty_solution is None:
+                return None
+            return self._empty_solution.copy()
+
+        if isinstance(self._all_sensitivities, dict):
+            all_sensitivities = {
+                key: list(value) for key, value in self._all_sensitivities.items()
+            }
+        else:
+            all_sensitivities = self._all_sensitivities
+        new_sol = Solution(
+            list(self._all_ts),
+            list(self._all_ys),
+            list(self._all_models),
+            list(self._all_inputs),
+            self._t_event,
+            self._y_event,
+            self._termination,
+            all_sensitivities=all_sensitivities,
+            all_yps=list(self._all_yps) if self._hermite_interpolation else None,
+        )
+
+        new_sol.closest_event_idx = self._closest_event_idx
+        new_sol._all_inputs_casadi = list(self._all_inputs_casadi)
+        for attr, value in self._timers.items():
+            setattr(new_sol, attr, value)
+
+        # Set sub_solutions
+        new_sol._sub_solutions = list(self._sub_solutions)
+
+        return new_sol
+
+
 def make_cycle_solution(
     step_solutions, esoh_solver=None, save_this_cycle=True, inputs=None
 ):
@@ -1076,27 +1443,10 @@ def make_cycle_solution(
         Dictionary of summary variables for this cycle
 
     """
-    sum_sols = step_solutions[0].copy()
-    for step_solution in step_solutions[1:]:
-        sum_sols = sum_sols + step_solution
-
-    cycle_solution = Solution(
-        sum_sols.all_ts,
-        sum_sols.all_ys,
-        sum_sols.all_models,
-        sum_sols.all_inputs,
-        sum_sols.t_event,
-        sum_sols.y_event,
-        sum_sols.termination,
-        sum_sols._all_sensitivities,
-        sum_sols.all_yps,
-    )
-    cycle_solution._all_inputs_casadi = sum_sols.all_inputs_casadi
-    cycle_solution._sub_solutions = sum_sols.sub_solutions
-
-    cycle_solution.solve_time = sum_sols.solve_time
-    cycle_solution.integration_time = sum_sols.integration_time
-    cycle_solution.set_up_time = sum_sols.set_up_time
+    builder = SolutionBuilder()
+    for step_solution in step_solutions:
+        builder.append(step_solution)
+    cycle_solution = builder.build()
 
     cycle_solution.steps = step_solutions
 
@@ -1119,30 +1469,44 @@ def _get_cycle_summary_variables(cycle_solution, esoh_solver, user_inputs=None):
     model = cycle_solution.all_models[0]
     cycle_summary_variables = pybamm.FuzzyDict({})
 
+    # eSOH variables (full-cell lithium-ion model only, for now)
+    calc_esoh = (
+        esoh_solver is not None
+        and isinstance(model, pybamm.lithium_ion.BaseModel)
+        and model.options.electrode_types["negative"] == "porous"
+        and "Negative electrode capacity [A.h]" in model.variables
+        and "Positive electrode capacity [A.h]" in model.variables
+    )
+    esoh_variables = [
+        "Negative electrode capacity [A.h]",
+        "Positive electrode capacity [A.h]",
+        "Total lithium capacity in particles [A.h]",
+    ]
+
     # Summary variables
+    # All the summary variables (and the variables needed for the eSOH solve) are
+    # evaluated at once at the first and last states if possible
     summary_variables = model.summary_variables
-    first_state = cycle_solution.first_state
-    last_state = cycle_solution.last_state
+    first_values = cycle_solution._evaluate_scalar_variables(summary_variables, 0)
+    last_values = cycle_solution._evaluate_scalar_variables(
+        list(summary_variables) + esoh_variables if calc_esoh else summary_variables, -1
+    )
+    if first_values is None or last_values is None:
+        first_state = cycle_solution.first_state
+        last_state = cycle_solution.last_state
+        first_values = {var: first_state[var].data[0] for var in summary_variables}
+        last_values = {var: last_state[var].data[0] for var in summary_variables}
+        if calc_esoh:
+            last_values.update({var: last_state[var].data[0] for var in esoh_variables})
     for var in summary_variables:
-        data_first = first_state[var].data
-        data_last = last_state[var].data
-        cycle_summary_variables[var] = data_last[0]
+        cycle_summary_variables[var] = last_values[var]
         var_lowercase = var[0].lower() + var[1:]
         cycle_summary_variables["Change in " + var_lowercase] = (
-            data_last[0] - data_first[0]
+            last_values[var] - first_values[var]
         )
 
-    # eSOH variables (full-cell lithium-ion model only, for now)
-    if (
-        esoh_solver is not None
-        and isinstance(model, pybamm.lithium_ion.BaseModel)
-        and model.options.electrode_types["negative"] == "porous"
-        and "Negative electrode capacity [A.h]" in model.variables
-        and "Positive electrode capacity [A.h]" in model.variables
-    ):
-        Q_n = last_state["Negative electrode capacity [A.h]"].data[0]
-        Q_p = last_state["Positive electrode capacity [A.h]"].data[0]
-        Q_Li = last_state["Total lithium capacity in particles [A.h]"].data[0]
+    if calc_esoh:
+        Q_n, Q_p, Q_Li = (last_values[var] for var in esoh_variables)
         all_inputs = {**user_inputs, "Q_n": Q_n, "Q_p": Q_p, "Q_Li": Q_Li}
         try:
             esoh_sol = esoh_solver.solve(inputs=all_inputs)
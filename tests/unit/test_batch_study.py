@@ -4,6 +4,7 @@ Tests for the batch_study.py
 
 import pytest
 import os
+import numpy as np
 import pybamm
 from tempfile import TemporaryDirectory
 
@@ -92,6 +93,72 @@ class TestBatchStudy:
             ]
             assert output_experiment in experiments_list
 
+    def test_solve_in_parallel(self):
+        spm = pybamm.lithium_ion.SPM()
+        spm_uniform = pybamm.lithium_ion.SPM({"particle": "uniform profile"})
+        solvers = {
+            "casadi safe": pybamm.CasadiSolver(mode="safe"),
+            "casadi fast": pybamm.CasadiSolver(mode="fast"),
+        }
+        bs = pybamm.BatchStudy(
+            models={"SPM": spm, "SPM uniform": spm_uniform},
+            solvers=solvers,
+            permutations=True,
+        )
+        bs.solve(t_eval=[0, 3600])
+        voltages = [sim.solution["Voltage [V]"].data for sim in bs.sims]
+
+        bs.solve(t_eval=[0, 3600], nproc=2)
+        assert bs.sims is None
+        assert len(bs.results) == 4
+        assert bs.results[1]["names"] == {
+            "models": "SPM",
+            "solvers": "casadi fast",
+        }
+        for result, voltage in zip(bs.results, voltages):
+            assert set(result["data"]) == {"Time [s]", "Current [A]", "Voltage [V]"}
+            np.testing.assert_allclose(
+                result["data"]["Voltage [V]"], voltage, rtol=1e-6, atol=1e-6
+            )
+
+        # a solver passed to `solve` is used for all the simulations in both modes
+        solver = pybamm.CasadiSolver(mode="fast", rtol=1e-2, atol=1e-2)
+        solved_models = []
+        solver_solve = solver.solve
+
+        def solve(model, *args, **kwargs):
+            solved_models.append(model)
+            return solver_solve(model, *args, **kwargs)
+
+        solver.solve = solve
+        bs.solve(t_eval=[0, 3600], solver=solver)
+        del solver.solve
+        assert len(solved_models) == len(bs.sims)
+        voltages_solver = [sim.solution["Voltage [V]"].data for sim in bs.sims]
+        np.testing.assert_array_equal(voltages_solver[0], voltages_solver[1])
+        bs.solve(t_eval=[0, 3600], solver=solver, nproc=2)
+        for result, voltage in zip(bs.results, voltages_solver):
+            np.testing.assert_allclose(
+                result["data"]["Voltage [V]"], voltage, rtol=1e-6, atol=1e-6
+            )
+
+        # experiments, chunking and compact variables
+        experiment = pybamm.Experiment(["Discharge at 1C for 10 minutes"])
+        bs = pybamm.BatchStudy(
+            models={"SPM": spm, "SPM uniform": spm_uniform},
+            experiments={"1C": experiment},
+            permutations=True,
+            repeats=2,
+        )
+        bs.solve(nproc=2, chunksize=2, compact_variables=["Voltage [V]"])
+        assert [list(result["data"]) for result in bs.results] == [
+            ["Voltage [V]"],
+            ["Voltage [V]"],
+        ]
+
+        with pytest.raises(ValueError, match="solved in parallel"):
+            bs.plot(show_plot=False)
+
     def test_create_gif(self):
         with TemporaryDirectory() as dir_name:
             bs = pybamm.BatchStudy({"spm": pybamm.lithium_ion.SPM()})
@@ -322,6 +322,32 @@ class TestDiscretise:
         assert isinstance(var_av_proc, pybamm.MatrixMultiplication)
         assert isinstance(var_av_proc.right.right, pybamm.StateVector)
 
+    def test_discretise_shared_symbol_meshes(self):
+        # the x-average (on the current collector) and its yz-average (with no
+        # domain) discretise to the same symbol, but have different meshes
+        mesh = get_mesh_for_testing()
+        spatial_methods = {
+            "macroscale": pybamm.FiniteVolume(),
+            "current collector": pybamm.ZeroDimensionalSpatialMethod(),
+        }
+        disc = pybamm.Discretisation(mesh, spatial_methods)
+        var = pybamm.Variable(
+            "var",
+            domain="negative electrode",
+            auxiliary_domains={"secondary": "current collector"},
+        )
+        disc.set_variable_slices([var])
+        var_av = pybamm.x_average(var)
+        var_av_av = pybamm.yz_average(var_av)
+        assert var_av.domain == ["current collector"]
+        assert var_av_av.domain == []
+
+        var_av_disc = disc.process_symbol(var_av)
+        var_av_av_disc = disc.process_symbol(var_av_av)
+        assert var_av_disc == var_av_av_disc
+        assert var_av_disc.mesh is mesh["current collector"]
+        assert var_av_av_disc.mesh is None
+
     def test_process_dict(self):
         # one equation
         whole_cell = ["negative electrode", "separator", "positive electrode"]
@@ -7,6 +7,7 @@ import pybamm
 import numpy as np
 import os
 from datetime import datetime
+from tempfile import TemporaryDirectory
 
 
 class ShortDurationCRate(pybamm.step.CRate):
@@ -535,6 +536,68 @@ class TestSimulationExperiment:
         # Summary variables are not None
         assert sol.summary_variables["Capacity [A.h]"] is not None
 
+    def test_output_sink(self):
+        experiment = pybamm.Experiment(
+            [("Discharge at 1C for 10 minutes", "Charge at 1C for 10 minutes")] * 4,
+        )
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, experiment=experiment)
+        sol_full = sim.solve()
+
+        with TemporaryDirectory() as dir_name:
+            sink = pybamm.NpzOutputSink(
+                dir_name, output_variables=["Time [s]", "Voltage [V]"]
+            )
+            sol = sim.solve(output_sink=sink)
+            # only the first and last cycles are kept in memory
+            assert sol.cycles[0] is not None
+            assert sol.cycles[1] is None
+            assert sol.cycles[2] is None
+            assert sol.cycles[3] is not None
+            np.testing.assert_allclose(sol.t[-1], sol_full.t[-1])
+            np.testing.assert_allclose(
+                sol.summary_variables["Capacity [A.h]"],
+                sol_full.summary_variables["Capacity [A.h]"],
+            )
+
+            # all cycles are written to the sink
+            assert sink.cycle_numbers == [1, 2, 3, 4]
+            for i, cycle in enumerate(sol_full.cycles):
+                data = sink.load_cycle(i + 1)
+                assert list(data.keys()) == ["Time [s]", "Voltage [V]"]
+                np.testing.assert_allclose(
+                    data["Voltage [V]"], cycle["Voltage [V]"].data
+                )
+            summary_variables = sink.load_summary_variables()
+            np.testing.assert_allclose(
+                summary_variables["Total lithium lost [mol]"],
+                sol_full.summary_variables["Total lithium lost [mol]"],
+            )
+
+            sink.clear()
+            assert os.listdir(dir_name) == []
+
+        # the sink is closed if the experiment is interrupted
+        class FailingSink(pybamm.OutputSink):
+            closed = False
+
+            def write_cycle(self, cycle_number, cycle_solution, summary_variables):
+                if cycle_number == 2:
+                    raise KeyboardInterrupt
+
+            def close(self):
+                self.closed = True
+
+        sink = FailingSink()
+        with pytest.raises(KeyboardInterrupt):
+            sim.solve(output_sink=sink)
+        assert sink.closed
+
+        with pytest.raises(NotImplementedError):
+            pybamm.OutputSink().write_cycle(1, sol, {})
+        with pytest.raises(ValueError, match="'output_sink' can only be used"):
+            pybamm.Simulation(model).solve([0, 600], output_sink=pybamm.OutputSink())
+
     def test_cycle_summary_variables(self):
         # Test cycle_summary_variables works for different combinations of data and
         # function OCPs
@@ -981,3 +1044,70 @@ class TestSimulationExperiment:
 
         neg_stoich = sol["Negative electrode stoichiometry"].data
         assert neg_stoich[-1] == pytest.approx(0.5, abs=0.0001)
+
+    def test_share_experiment_discretisation(self):
+        def custom_step_voltage(variables):
+            return 100 * (variables["Voltage [V]"] - 4.2)
+
+        drive_cycle = np.array([np.arange(10), np.arange(10) / 10]).T
+        experiment = pybamm.Experiment(
+            [
+                pybamm.step.string(
+                    "Discharge at 1C for 10 minutes",
+                    start_time=datetime(2023, 1, 1, 8, 0, 0),
+                ),
+                "Rest for 5 minutes",
+                pybamm.step.string(
+                    "Charge at 1C until 4.1V",
+                    start_time=datetime(2023, 1, 1, 8, 30, 0),
+                ),
+                "Hold at 4.1V until 50 mA",
+                "Discharge at 2 W for 5 minutes (1 minute period)",
+                pybamm.step.current(1, duration=60, temperature="35oC"),
+                pybamm.step.current(drive_cycle, duration=9),
+                pybamm.step.CustomStepImplicit(
+                    custom_step_voltage, control="differential", duration=100
+                ),
+            ]
+        )
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, experiment=experiment)
+        sol = sim.solve(calc_esoh=False)
+        sim_shared = pybamm.Simulation(
+            model, experiment=experiment, share_experiment_discretisation=True
+        )
+        sol_shared = sim_shared.solve(calc_esoh=False)
+
+        assert sim_shared.steps_to_built_models.keys() == (
+            sim.steps_to_built_models.keys()
+        )
+        for step, built_model in sim_shared.steps_to_built_models.items():
+            other = sim.steps_to_built_models[step]
+            assert built_model.len_rhs == other.len_rhs
+            assert built_model.len_alg == other.len_alg
+            assert [p.name for p in built_model.input_parameters] == [
+                p.name for p in other.input_parameters
+            ]
+            assert sorted(event.name for event in built_model.events) == sorted(
+                event.name for event in other.events
+            )
+            assert built_model.variables.keys() == other.variables.keys()
+        for name in ["Voltage [V]", "Current [A]"]:
+            np.testing.assert_allclose(
+                sol_shared[name].entries, sol[name].entries, rtol=1e-4, atol=1e-4
+            )
+
+        # models with a different operating mode are processed separately
+        model = pybamm.lithium_ion.SPM({"operating mode": "voltage"})
+        parameter_values = model.default_parameter_values
+        parameter_values.update(
+            {"Voltage function [V]": 4.1}, check_already_exists=False
+        )
+        sim = pybamm.Simulation(
+            model,
+            experiment=["Hold at 4.1V for 1 minute"],
+            parameter_values=parameter_values,
+            share_experiment_discretisation=True,
+        )
+        sol = sim.solve(calc_esoh=False)
+        np.testing.assert_allclose(sol["Voltage [V]"].entries, 4.1, rtol=1e-4)
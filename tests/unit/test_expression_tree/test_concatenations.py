@@ -215,6 +215,12 @@ class TestConcatenations:
             conc.evaluate(16, y), np.concatenate([y, np.array([[16]]), np.array([[3]])])
         )
 
+        # with children that have shape (1, 1) but evaluate to a number
+        conc = pybamm.NumpyConcatenation(a, pybamm.min(a), pybamm.max(a))
+        np.testing.assert_array_equal(
+            conc.evaluate(y=y), np.concatenate([y, np.array([[0]]), np.array([[1]])])
+        )
+
     def test_domain_concatenation_domains(self):
         mesh = get_mesh_for_testing()
         # ensure concatenated domains are sorted correctly
@@ -343,6 +343,23 @@ class TestCasadiConverter:
             casadi_inputs["Input 2"] * casadi_y,
         )
 
+    def test_converter_reuses_symbols(self):
+        casadi_t = casadi.MX.sym("t")
+        casadi_y = casadi.MX.sym("y", 10)
+        pybamm_y = pybamm.StateVector(slice(0, 10))
+        a = pybamm.Scalar(2) * pybamm_y
+
+        converter = pybamm.CasadiConverter()
+        assert converter.n_converted == 0
+        converter.convert(a, casadi_t, casadi_y, None, {})
+        assert converter.n_converted == 3
+        # only the new symbols are converted
+        casadi_a = converter.convert(a + 1, casadi_t, casadi_y, None, {})
+        assert converter.n_converted == 5
+        f = casadi.Function("f", [casadi_y], [casadi_a])
+        y_test = np.linspace(0, 1, 10)
+        np.testing.assert_array_equal(f(y_test), 2 * y_test[:, np.newaxis] + 1)
+
     def test_errors(self):
         y = pybamm.StateVector(slice(0, 10))
         with pytest.raises(
@@ -405,6 +405,14 @@ class TestEvaluate:
         for t, y in zip(t_tests, y_tests):
             result = evaluator(t=t, y=y)
             np.testing.assert_allclose(result, expr.evaluate(t=t, y=y))
+        # children with shape (1, 1) that evaluate to a number
+        d = pybamm.StateVector(slice(0, 3))
+        expr = pybamm.NumpyConcatenation(a, pybamm.min(d), pybamm.max(d) - 1)
+        evaluator = pybamm.EvaluatorPython(expr)
+        for t, y in zip(t_tests, y_tests):
+            result = evaluator(t=t, y=y)
+            assert result.shape == (3, 1)
+            np.testing.assert_allclose(result, expr.evaluate(t=t, y=y))
 
         # test sparse stack
         A = pybamm.Matrix(scipy.sparse.csr_matrix(np.array([[1, 0], [0, 4]])))
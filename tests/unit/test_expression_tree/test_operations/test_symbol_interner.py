@@ -0,0 +1,40 @@
+#
+# Tests for the symbol interner
+#
+import pybamm
+
+
+class TestSymbolInterner:
+    def test_intern(self):
+        interner = pybamm.SymbolInterner()
+        x = pybamm.Variable("x")
+        a = 2 * x
+        b = 2 * x
+        assert a is not b
+
+        assert interner.intern(a) is a
+        assert interner.intern(b) is a
+        assert interner.intern(a) is a
+        assert interner.hits == 1
+        assert interner.misses == 1
+        assert len(interner) == 1
+        assert interner.node_count_reduction == 0.5
+        assert repr(interner) == "SymbolInterner(size=1, hits=1, misses=1)"
+
+        # symbols of a different type are not replaced
+        c = pybamm.Scalar(1)
+        assert interner.intern(c) is c
+
+        # symbols that have been modified since they were added are not used
+        y = pybamm.Variable("y")
+        d = pybamm.PrimaryBroadcast(y, "negative electrode")
+        interner.intern(d)
+        d.copy_domains(pybamm.Variable("z", domain="separator"))
+        e = pybamm.PrimaryBroadcast(y, "negative electrode")
+        assert interner.intern(e) is e
+
+        interner.clear()
+        assert len(interner) == 0
+        assert interner.hits == 0
+        assert interner.misses == 0
+        assert interner.node_count_reduction == 0.0
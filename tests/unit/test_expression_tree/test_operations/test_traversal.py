@@ -0,0 +1,71 @@
+#
+# Tests for the iterative traversal of expression trees
+#
+import casadi
+import numpy as np
+
+import pybamm
+
+
+class TestTraversal:
+    def test_post_order(self):
+        a = pybamm.Symbol("a")
+        b = pybamm.Symbol("b")
+        c = pybamm.Symbol("c")
+        expr = (a * b) + (c - a)
+        names = [node.name for node in pybamm.post_order(expr)]
+        # each node comes after its children, and shared nodes are returned once
+        assert names == ["a", "b", "*", "c", "-", "+"]
+
+        # known nodes and their subtrees are skipped
+        known = {a * b: None}
+        names = [node.name for node in pybamm.post_order(expr, known=known)]
+        assert names == ["c", "a", "-", "+"]
+
+        # children are only returned for expanded nodes
+        names = [
+            node.name
+            for node in pybamm.post_order(expr, expand=lambda x: x.name == "+")
+        ]
+        assert names == ["*", "-", "+"]
+
+        # a pass can fill its memo table while stepping through the tree
+        memo = {}
+        for node in pybamm.post_order(expr, known=memo):
+            memo[node] = len(memo)
+        assert memo[expr] == len(memo) - 1
+
+    def test_deep_trees(self):
+        # trees deeper than the recursion limit
+        y = pybamm.StateVector(slice(0, 1))
+        expr = y
+        for _ in range(3000):
+            expr = pybamm.Addition(expr, pybamm.Scalar(1))
+
+        assert expr.evaluate(y=np.array([1])) == 3001
+
+        jac = expr.jac(y)
+        assert jac.evaluate(y=np.array([1])) == 1
+
+        y_casadi = casadi.MX.sym("y", 1)
+        expr_casadi = expr.to_casadi(y=y_casadi)
+        f = casadi.Function("f", [y_casadi], [expr_casadi])
+        assert f(1).full()[0, 0] == 3001
+
+        # trees that are processed and discretised, simplifying each new node (the
+        # shape checks of debug mode are quadratic in the depth, so are turned off)
+        debug_mode = pybamm.settings.debug_mode
+        pybamm.settings.debug_mode = False
+        try:
+            v = pybamm.Variable("v")
+            expr = v
+            for _ in range(3000):
+                expr = pybamm.Addition(expr, pybamm.Parameter("p") * v)
+            assert not expr.is_constant()
+            expr = pybamm.ParameterValues({"p": 1}).process_symbol(expr)
+            disc = pybamm.Discretisation()
+            disc.set_variable_slices([v])
+            expr = disc.process_symbol(expr)
+            assert expr.evaluate(y=np.array([1])) == 3001
+        finally:
+            pybamm.settings.debug_mode = debug_mode
@@ -3,7 +3,9 @@
 #
 
 import pytest
+import copy
 import os
+import pickle
 from tempfile import TemporaryDirectory
 
 import numpy as np
@@ -69,6 +71,45 @@ class TestSymbol:
         with pytest.raises(NotImplementedError, match="Cannot set domain directly"):
             b.domain = "test"
 
+    def test_compact_nodes(self):
+        # symbols with the same domains share one dictionary
+        a = pybamm.Symbol("a", domain="test", auxiliary_domains={"secondary": "sec"})
+        b = pybamm.Symbol("b", domains={"primary": ["test"], "secondary": ["sec"]})
+        assert a.domains is b.domains
+        assert pybamm.Symbol("c").domains is pybamm.Scalar(1).domains
+
+        # the shared domains cannot be modified in place
+        with pytest.raises(TypeError, match="cannot be modified in place"):
+            a.domains["primary"].append("other")
+        with pytest.raises(TypeError, match="cannot be modified in place"):
+            a.domain[0] = "other"
+        with pytest.raises(TypeError, match="cannot be modified in place"):
+            a.domains["secondary"] = ["other"]
+        assert b.domains == {
+            "primary": ["test"],
+            "secondary": ["sec"],
+            "tertiary": [],
+            "quaternary": [],
+        }
+        # setting new domains does not change the other symbols
+        a.domains = {"primary": ["other"]}
+        assert b.domain == ["test"]
+        # copies and pickles still share the domains
+        assert copy.deepcopy(b).domains is b.domains
+        assert pickle.loads(pickle.dumps(b)).domains is b.domains
+
+        # names are interned
+        name = "".join(["a ", "name"])
+        assert pybamm.Symbol(name).name is pybamm.Symbol("a name").name
+
+        # the common attributes of symbols are kept in slots
+        x = pybamm.Variable("x")
+        assert vars(pybamm.Scalar(1)) == {}
+        assert vars(pybamm.Multiplication(x, x)) == {}
+        # other attributes can still be set
+        x.test_attribute = 1
+        assert vars(x)["test_attribute"] == 1
+
     def test_symbol_auxiliary_domains(self):
         a = pybamm.Symbol(
             "a",
@@ -245,6 +286,24 @@ class TestSymbol:
         with pytest.raises(NotImplementedError):
             a.evaluate()
 
+    def test_evaluate_overridden(self):
+        # operators that override `evaluate` are still evaluated with their own
+        # method when they are not the root of the tree
+        class Doubled(pybamm.UnaryOperator):
+            def __init__(self, child):
+                super().__init__("doubled", child)
+
+            def evaluate(self, t=None, y=None, y_dot=None, inputs=None):
+                return 2 * super().evaluate(t, y, y_dot, inputs)
+
+            def _unary_evaluate(self, child):
+                return child
+
+        a = pybamm.Scalar(3)
+        assert Doubled(a).evaluate() == 6
+        assert (Doubled(a) + 1).evaluate() == 7
+        assert (Doubled(Doubled(a)) - a).evaluate() == 9
+
     def test_evaluate_ignoring_errors(self):
         assert pybamm.t.evaluate_ignoring_errors(t=None) is None
         assert pybamm.t.evaluate_ignoring_errors(t=0) == 0
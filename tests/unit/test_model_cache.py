@@ -0,0 +1,229 @@
+#
+# Tests for the ModelCache class
+#
+import os
+import pytest
+import numpy as np
+import pybamm
+from pybamm.expression_tree.operations.serialise import Serialise
+from tempfile import TemporaryDirectory
+
+_rate = 1
+
+
+def _global_rate_function(x):
+    return _rate * x
+
+
+class TestModelCache:
+    def test_key(self):
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.ModelCache(dir_name)
+            model = pybamm.lithium_ion.SPM()
+            parameter_values = model.default_parameter_values
+            settings = [
+                model.default_geometry,
+                model.default_submesh_types,
+                model.default_var_pts,
+                model.default_spatial_methods,
+            ]
+            key = cache.key(model, parameter_values, *settings)
+
+            # keys are deterministic and don't depend on object identity
+            assert key == cache.key(
+                pybamm.lithium_ion.SPM(), parameter_values.copy(), *settings
+            )
+
+            # different options, parameters, mesh or extra data give different keys
+            assert key != cache.key(
+                pybamm.lithium_ion.SPM({"thermal": "lumped"}),
+                parameter_values,
+                *settings,
+            )
+            new_parameter_values = parameter_values.copy()
+            new_parameter_values["Current function [A]"] = 2
+            assert key != cache.key(model, new_parameter_values, *settings)
+            var_pts = {**model.default_var_pts, "r_n": 10}
+            assert key != cache.key(
+                model, parameter_values, *settings[:2], var_pts, settings[3]
+            )
+            assert key != cache.key(model, parameter_values, *settings, extra="step")
+
+            # models with the same name but different equations give different keys
+            keys = []
+            for rate in [1, 2]:
+                custom_model = pybamm.BaseModel()
+                v = pybamm.Variable("v")
+                custom_model.rhs = {v: -rate * v}
+                custom_model.initial_conditions = {v: 1}
+                keys.append(
+                    cache.key(custom_model, pybamm.ParameterValues({}), {}, {}, {}, {})
+                )
+            assert keys[0] != keys[1]
+
+            # variables with the same name but different scales or bounds give
+            # different keys
+            keys = []
+            for kwargs in [{"scale": 2}, {"scale": 3}, {"bounds": (0, 1)}]:
+                custom_model = pybamm.BaseModel()
+                v = pybamm.Variable("v", **kwargs)
+                custom_model.rhs = {v: -v}
+                custom_model.initial_conditions = {v: 1}
+                keys.append(
+                    cache.key(custom_model, pybamm.ParameterValues({}), {}, {}, {}, {})
+                )
+            assert len(set(keys)) == 3
+
+            # variables with the same name but different expressions give different
+            # keys
+            keys = []
+            for rate in [1, 2]:
+                custom_model = pybamm.BaseModel()
+                v = pybamm.Variable("v")
+                custom_model.rhs = {v: -v}
+                custom_model.initial_conditions = {v: 1}
+                custom_model.variables = {"w": v + rate}
+                keys.append(
+                    cache.key(custom_model, pybamm.ParameterValues({}), {}, {}, {}, {})
+                )
+            assert keys[0] != keys[1]
+
+            # functions with the same code but different closures or globals give
+            # different keys
+            def make_function(rate):
+                def function(x):
+                    return rate * x
+
+                return function
+
+            def function_key(function):
+                return cache.key(
+                    pybamm.BaseModel(),
+                    pybamm.ParameterValues({"Function": function}),
+                    {},
+                    {},
+                    {},
+                    {},
+                )
+
+            assert function_key(make_function(1)) == function_key(make_function(1))
+            assert function_key(make_function(1)) != function_key(make_function(2))
+            global _rate
+            _rate = 1
+            key = function_key(_global_rate_function)
+            _rate = 2
+            assert key != function_key(_global_rate_function)
+
+    def test_simulation(self):
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.ModelCache(dir_name)
+            sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), model_cache=cache)
+            sol = sim.solve([0, 3600])
+            assert (cache.hits, cache.misses) == (0, 1)
+
+            sim_cached = pybamm.Simulation(pybamm.lithium_ion.SPM(), model_cache=cache)
+            sol_cached = sim_cached.solve([0, 3600])
+            assert (cache.hits, cache.misses) == (1, 1)
+            assert sim_cached.built_model.name == sim.built_model.name
+            np.testing.assert_allclose(
+                sol["Voltage [V]"].entries,
+                sol_cached["Voltage [V]"].entries,
+                rtol=1e-6,
+                atol=1e-6,
+            )
+
+            # the state layout is restored
+            assert [var.name for var in sim_cached.built_model.initial_conditions] == [
+                var.name for var in sim.built_model.initial_conditions
+            ]
+            new_model = sim_cached.built_model.set_initial_conditions_from(
+                sol_cached, inplace=False
+            )
+            np.testing.assert_allclose(
+                new_model.concatenated_initial_conditions.evaluate().flatten(),
+                np.array(sol_cached.last_state.y).flatten(),
+            )
+
+            # changing a setting rebuilds the model
+            sim = pybamm.Simulation(
+                pybamm.lithium_ion.SPM(),
+                var_pts={"x_n": 5, "x_s": 5, "x_p": 5, "r_n": 5, "r_p": 5},
+                model_cache=cache,
+            )
+            sim.build()
+            assert (cache.hits, cache.misses) == (1, 2)
+
+            cache.clear()
+            assert os.listdir(dir_name) == []
+
+    def test_simulation_experiment(self):
+        experiment = pybamm.Experiment(
+            [
+                "Discharge at 1C for 10 minutes",
+                "Rest for 5 minutes",
+                "Charge at 1C until 4.1V",
+                "Hold at 4.1V until 50 mA",
+            ]
+        )
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.ModelCache(dir_name)
+            sim = pybamm.Simulation(
+                pybamm.lithium_ion.SPM(), experiment=experiment, model_cache=cache
+            )
+            sol = sim.solve()
+            assert cache.hits == 0
+
+            sim_cached = pybamm.Simulation(
+                pybamm.lithium_ion.SPM(), experiment=experiment, model_cache=cache
+            )
+            sol_cached = sim_cached.solve()
+            assert cache.hits == 4
+            np.testing.assert_allclose(
+                sol["Voltage [V]"].entries,
+                sol_cached["Voltage [V]"].entries,
+                rtol=1e-6,
+                atol=1e-6,
+            )
+
+    def test_save_fail(self):
+        model = pybamm.BaseModel()
+        v = pybamm.Variable("v")
+        model.rhs = {v: -v}
+        model.initial_conditions = {v: 1}
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.ModelCache(dir_name)
+            # undiscretised models can't be serialised
+            assert not cache.save("key", model)
+            assert "key" not in cache
+            assert os.listdir(dir_name) == []
+            assert cache.load("key") is None
+            assert cache.misses == 1
+
+    def test_load_fail(self, monkeypatch):
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.ModelCache(dir_name)
+            key = "0" * 64
+            # a corrupt entry is treated as a miss
+            for suffix in [".json", "_states.json"]:
+                with open(os.path.join(dir_name, key + suffix), "w") as f:
+                    f.write("{")
+            assert key in cache
+            assert cache.load(key) is None
+            assert cache.misses == 1
+
+            # but unexpected errors are raised
+            def load_model(self, filename):
+                raise RuntimeError("unexpected")
+
+            with open(os.path.join(dir_name, key + "_states.json"), "w") as f:
+                f.write("{}")
+            monkeypatch.setattr(Serialise, "load_model", load_model)
+            with pytest.raises(RuntimeError, match="unexpected"):
+                cache.load(key)
+
+            # clear removes every file written by the cache, including the temporary
+            # files of an interrupted save
+            with open(os.path.join(dir_name, key + ".123.tmp.npz"), "w") as f:
+                f.write("")
+            cache.clear()
+            assert os.listdir(dir_name) == []
@@ -4,6 +4,7 @@
 
 import pytest
 import pybamm
+import numpy as np
 
 
 # Fixture for TestElectrodeSOHMSMR, TestCalculateTheoreticalEnergy and TestGetInitialOCPMSMR class.
@@ -55,6 +56,30 @@ class TestElectrodeSOH:
                 energy = esoh_solver.theoretical_energy_integral(inputs)
                 assert sol[key] == pytest.approx(energy, abs=1e-05)
 
+    def test_batch_solve(self):
+        param = pybamm.LithiumIonParameters()
+        parameter_values = pybamm.ParameterValues("Mohtat2020")
+        esoh_solver = pybamm.lithium_ion.ElectrodeSOHSolver(parameter_values, param)
+
+        Q_n = parameter_values.evaluate(param.n.Q_init)
+        Q_p = parameter_values.evaluate(param.p.Q_init)
+        Q_Li = parameter_values.evaluate(param.Q_Li_particles_init)
+        all_inputs = [
+            {"Q_Li": Q_Li * (1 - 0.01 * i), "Q_n": Q_n * (1 - 0.005 * i), "Q_p": Q_p}
+            for i in range(5)
+        ]
+
+        sols = esoh_solver.solve(all_inputs)
+        assert len(sols) == 5
+        assert esoh_solver.solve([]) == []
+        for inputs, sol in zip(all_inputs, sols):
+            sol_single = pybamm.lithium_ion.ElectrodeSOHSolver(
+                parameter_values, param
+            ).solve(inputs)
+            assert sol.keys() == sol_single.keys()
+            for key in sol:
+                assert sol[key] == pytest.approx(sol_single[key], rel=1e-5, abs=1e-8)
+
     def test_known_solution_cell_capacity(self):
         param = pybamm.LithiumIonParameters()
         parameter_values = pybamm.ParameterValues("Mohtat2020")
@@ -291,6 +316,26 @@ class TestGetInitialSOC:
         V = parameter_values.evaluate(param.p.prim.U(y, T) - param.n.prim.U(x, T))
         assert V == pytest.approx(4)
 
+        # several values at once, reusing the same solver
+        esoh_solver = pybamm.lithium_ion.ElectrodeSOHSolver(parameter_values, param)
+        xs, ys = pybamm.lithium_ion.get_initial_stoichiometries(
+            [0.4, "4 V", "3.5 V"], parameter_values, param, esoh_solver=esoh_solver
+        )
+        assert xs[0] == pytest.approx(x0 + 0.4 * (x100 - x0))
+        assert xs[1] == pytest.approx(x)
+        assert ys[1] == pytest.approx(y)
+        V = parameter_values.evaluate(
+            param.p.prim.U(ys[2], T) - param.n.prim.U(xs[2], T)
+        )
+        assert V == pytest.approx(3.5)
+
+        # arrays of integers
+        xs, ys = pybamm.lithium_ion.get_initial_stoichiometries(
+            np.array([0, 1]), parameter_values, param, esoh_solver=esoh_solver
+        )
+        assert xs == pytest.approx([x0, x100])
+        assert ys == pytest.approx([y0, y100])
+
     def test_min_max_stoich(self):
         param = pybamm.LithiumIonParameters()
         parameter_values = pybamm.ParameterValues("Mohtat2020")
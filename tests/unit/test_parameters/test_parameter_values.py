@@ -357,6 +357,16 @@ class TestParameterValues:
         with pytest.raises(TypeError, match="Cannot process parameter"):
             parameter_values.process_symbol(b)
 
+    def test_process_symbol_shares_equal_subtrees(self):
+        parameter_values = pybamm.ParameterValues(
+            {"a": pybamm.InputParameter("p"), "b": pybamm.InputParameter("p")}
+        )
+        x = pybamm.Variable("x")
+        processed_a = parameter_values.process_symbol(pybamm.Parameter("a") * x)
+        processed_b = parameter_values.process_symbol(pybamm.Parameter("b") * x)
+        assert processed_a is processed_b
+        assert parameter_values._symbol_interner.hits > 0
+
     def test_process_input_parameter(self):
         parameter_values = pybamm.ParameterValues(
             {"a": "[input]", "b": 3, "c times 2": pybamm.InputParameter("c") * 2}
@@ -527,6 +527,75 @@ class TestSerialise:
         newest_solver = newest_model.default_solver
         newest_solver.solve(newest_model, [0, 3600])
 
+    def test_save_load_model_binary(self):
+        model = pybamm.lithium_ion.SPM(name="test_spm")
+        geometry = model.default_geometry
+        param = model.default_parameter_values
+        param.process_model(model)
+        param.process_geometry(geometry)
+        mesh = pybamm.Mesh(geometry, model.default_submesh_types, model.default_var_pts)
+        disc = pybamm.Discretisation(mesh, model.default_spatial_methods)
+        disc.process_model(model)
+
+        Serialise().save_model(
+            model, mesh=mesh, variables=model.variables, filename="test_model"
+        )
+        Serialise().save_model(
+            model,
+            mesh=mesh,
+            variables=model.variables,
+            filename="test_model",
+            binary=True,
+        )
+        assert os.path.exists("test_model.npz")
+        assert os.path.getsize("test_model.npz") < os.path.getsize("test_model.json")
+
+        # the nodes are deduplicated and the arrays stored as raw buffers
+        with np.load("test_model.npz") as data:
+            model_data = json.loads(data["header"].tobytes())
+            assert model_data["number_of_buffers"] > 0
+            assert len(data.files) == model_data["number_of_buffers"] + 1
+        ids = [node.get("id") for node in model_data["nodes"] if "id" in node]
+        assert len(ids) == len(set(ids))
+
+        json_model = Serialise().load_model("test_model.json")
+        binary_model = Serialise().load_model("test_model.npz")
+        os.remove("test_model.json")
+        assert isinstance(binary_model, pybamm.lithium_ion.SPM)
+        assert binary_model.concatenated_rhs == json_model.concatenated_rhs
+        assert binary_model.mass_matrix == json_model.mass_matrix
+        assert [event.name for event in binary_model.events] == [
+            event.name for event in json_model.events
+        ]
+
+        json_solution = json_model.default_solver.solve(json_model, [0, 3600])
+        binary_solution = binary_model.default_solver.solve(binary_model, [0, 3600])
+        np.testing.assert_array_equal(binary_solution.y, json_solution.y)
+        np.testing.assert_array_equal(
+            binary_solution["Voltage [V]"].entries,
+            json_solution["Voltage [V]"].entries,
+        )
+        binary_solution.plot(show_plot=False)
+
+        # load when specifying the battery model to use
+        newest_model = Serialise().load_model(
+            "test_model.npz", battery_model=pybamm.lithium_ion.SPM
+        )
+        assert newest_model.concatenated_rhs == json_model.concatenated_rhs
+
+        # error for an unsupported version
+        with np.load("test_model.npz") as data:
+            buffers = {name: data[name] for name in data.files}
+        model_data = json.loads(buffers["header"].tobytes())
+        model_data["binary_format_version"] = 0
+        buffers["header"] = np.frombuffer(
+            json.dumps(model_data).encode(), dtype=np.uint8
+        )
+        np.savez("test_model.npz", **buffers)
+        with pytest.raises(ValueError, match="Unsupported binary model format"):
+            Serialise().load_model("test_model.npz")
+        os.remove("test_model.npz")
+
     def test_save_experiment_model_error(self):
         model = pybamm.lithium_ion.SPM()
         experiment = pybamm.Experiment(["Discharge at 1C for 1 hour"])
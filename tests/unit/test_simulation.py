@@ -291,6 +291,56 @@ class TestSimulation:
         sim.build(initial_soc=0.5)
         assert sim._built_initial_soc == 0.5
 
+    def test_solve_with_initial_soc_as_input(self):
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, initial_soc_as_input=True)
+        sol = sim.solve([0, 600], initial_soc=1)
+        built_model = sim._built_model
+        assert set(sim._initial_soc_inputs) == {
+            "Initial concentration in negative electrode [mol.m-3]",
+            "Initial concentration in positive electrode [mol.m-3]",
+        }
+        assert sim.parameter_values[
+            "Initial concentration in negative electrode [mol.m-3]"
+        ] == pytest.approx(
+            sim._initial_soc_inputs[
+                "Initial concentration in negative electrode [mol.m-3]"
+            ]
+        )
+
+        # changing the initial SOC reuses the built model
+        sol = sim.solve([0, 600], initial_soc=0.5)
+        assert sim._built_model is built_model
+        assert sim._built_initial_soc == 0.5
+
+        # compare with a simulation that is rebuilt
+        sim_rebuilt = pybamm.Simulation(model)
+        sol_rebuilt = sim_rebuilt.solve([0, 600], initial_soc=0.5)
+        np.testing.assert_allclose(
+            sol["Voltage [V]"].data, sol_rebuilt["Voltage [V]"].data, rtol=1e-6
+        )
+
+        # experiment
+        experiment = pybamm.Experiment(["Discharge at 1C for 10 minutes"])
+        sim = pybamm.Simulation(model, experiment=experiment, initial_soc_as_input=True)
+        sim.solve(initial_soc=0.9)
+        built_models = sim.steps_to_built_models
+        sol = sim.solve(initial_soc=0.6)
+        assert sim.steps_to_built_models is built_models
+        sim_rebuilt = pybamm.Simulation(model, experiment=experiment)
+        sol_rebuilt = sim_rebuilt.solve(initial_soc=0.6)
+        np.testing.assert_allclose(
+            sol["Voltage [V]"].data, sol_rebuilt["Voltage [V]"].data, rtol=1e-6
+        )
+
+        # half cell
+        model = pybamm.lithium_ion.SPM({"working electrode": "positive"})
+        sim = pybamm.Simulation(model, initial_soc_as_input=True)
+        sim.solve([0, 1], initial_soc=0.9)
+        assert list(sim._initial_soc_inputs) == [
+            "Initial concentration in positive electrode [mol.m-3]"
+        ]
+
     def test_solve_with_initial_soc_with_input_param_in_ocv(self):
         # test having an input parameter in the ocv function
         model = pybamm.lithium_ion.SPM()
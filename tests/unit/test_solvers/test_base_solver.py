@@ -332,20 +332,137 @@ class TestBaseSolver:
         with pytest.warns(pybamm.SolverWarning):
             solver.solve(model, t_eval=[0, 1])
 
-    def test_multiple_models_error(self):
+    def test_multiple_models(self):
         model = pybamm.BaseModel()
         v = pybamm.Variable("v")
         model.rhs = {v: -1}
         model.initial_conditions = {v: 1}
         model2 = pybamm.BaseModel()
         v2 = pybamm.Variable("v")
-        model2.rhs = {v2: -1}
+        model2.rhs = {v2: -2}
         model2.initial_conditions = {v2: 1}
 
         solver = pybamm.ScipySolver()
-        solver.solve(model, t_eval=[0, 1])
-        with pytest.raises(RuntimeError, match="already been initialised"):
-            solver.solve(model2, t_eval=[0, 1])
+        solution = solver.solve(model, t_eval=[0, 1])
+        solution2 = solver.solve(model2, t_eval=[0, 1])
+        np.testing.assert_allclose(solution.y[0], 1 - solution.t)
+        np.testing.assert_allclose(solution2.y[0], 1 - 2 * solution2.t)
+        assert set(solver._model_set_up) == {model, model2}
+        # the set-up of the first model is kept
+        np.testing.assert_allclose(
+            solver.solve(model, t_eval=[0, 1]).y[0], 1 - solution.t
+        )
+
+    def test_share_set_up(self):
+        def make_model():
+            model = pybamm.BaseModel()
+            v = pybamm.Variable("v")
+            model.rhs = {v: -pybamm.InputParameter("rate") * v}
+            model.initial_conditions = {v: 1}
+            model.variables = {"v": v}
+            pybamm.Discretisation().process_model(model)
+            return model
+
+        model = make_model()
+        model2 = make_model()
+        solver = pybamm.CasadiSolver()
+        t_eval = np.linspace(0, 1, 10)
+        solution = solver.solve(model, t_eval, inputs={"rate": 1})
+        solution2 = solver.solve(model2, t_eval, inputs={"rate": 2})
+        np.testing.assert_allclose(solution["v"].data, np.exp(-t_eval), rtol=1e-4)
+        np.testing.assert_allclose(solution2["v"].data, np.exp(-2 * t_eval), rtol=1e-4)
+        # the models have the same structure, so share the generated functions
+        assert model2.casadi_rhs is model.casadi_rhs
+        assert model2.rhs_algebraic_eval is model.rhs_algebraic_eval
+        assert solver.integrators[model2] is solver.integrators[model]
+
+        # a model with a different structure is set up separately
+        model3 = make_model()
+        model3.concatenated_rhs = 2 * model3.concatenated_rhs
+        solution3 = solver.solve(model3, t_eval, inputs={"rate": 1})
+        np.testing.assert_allclose(solution3["v"].data, np.exp(-2 * t_eval), rtol=1e-4)
+        assert model3.casadi_rhs is not model.casadi_rhs
+
+        # the number of models is bounded
+        solver.models_maxcount = 2
+        assert list(solver._model_set_up) == [model2, model3]
+        assert solver.copy().models_maxcount == 2
+
+    def test_casadi_conversion_stats(self):
+        model = pybamm.BaseModel()
+        v = pybamm.Variable("v")
+        u = pybamm.Variable("u")
+        model.rhs = {v: -pybamm.exp(u) * v}
+        model.algebraic = {u: u - pybamm.sin(v)}
+        model.initial_conditions = {v: 1, u: np.sin(1)}
+        model.variables = {"v": v}
+        pybamm.Discretisation().process_model(model)
+
+        solver = pybamm.BaseSolver()
+        solver.set_up(model)
+        stats = model.casadi_conversion_stats
+        for stage in ["initial_conditions", "RHS", "algebraic", "rhs_algebraic"]:
+            assert stats[stage]["time"] >= 0
+            assert stats[stage]["MX nodes"] > 0
+        # the rhs and algebraic expressions have already been converted, so only
+        # their concatenation is new
+        assert stats["rhs_algebraic"]["new symbols"] == 1
+        np.testing.assert_allclose(
+            model.rhs_algebraic_eval(0, np.array([1, 0.5]), []).full().flatten(),
+            [-np.exp(0.5), 0.5 - np.sin(1)],
+        )
+
+    @pytest.mark.parametrize("convert_to_format", ["casadi", "python"])
+    def test_fused_events(self, convert_to_format):
+        model = pybamm.BaseModel()
+        v = pybamm.Variable("v")
+        model.rhs = {v: -pybamm.InputParameter("rate") * v}
+        model.initial_conditions = {v: 1}
+        model.variables = {"v": v}
+        model.events = [
+            pybamm.Event("v cut-off", v - 0.5),
+            pybamm.Event("time cut-off", 5 - pybamm.t),
+            # evaluate to a number, rather than a (1, 1) array, in the python format
+            pybamm.Event("minimum cut-off", pybamm.min(v) - 0.2),
+            pybamm.Event("maximum cut-off", pybamm.max(v) - 0.1),
+            pybamm.Event(
+                "extrapolation", v + 1, pybamm.EventType.INTERPOLANT_EXTRAPOLATION
+            ),
+            pybamm.Event("switch", v - 0.1, pybamm.EventType.SWITCH),
+        ]
+        model.convert_to_format = convert_to_format
+        pybamm.Discretisation().process_model(model)
+
+        solver = pybamm.BaseSolver()
+        inputs = {"rate": 1}
+        solver.set_up(model, inputs)
+        # the terminate events come before the extrapolation events
+        assert model.event_indices == {
+            "v cut-off": 0,
+            "time cut-off": 1,
+            "minimum cut-off": 2,
+            "maximum cut-off": 3,
+            "extrapolation": 4,
+        }
+        events = solver._evaluate_events(
+            model, model.events[:5], 1, np.array([0.8]), inputs
+        )
+        assert events == pytest.approx(
+            {
+                "v cut-off": 0.3,
+                "time cut-off": 4,
+                "minimum cut-off": 0.6,
+                "maximum cut-off": 0.7,
+                "extrapolation": 1.8,
+            }
+        )
+
+        # the fused events function is used to find the terminating event
+        solution = pybamm.CasadiSolver().solve(
+            model, np.linspace(0, 2, 20), inputs={"rate": 1}
+        )
+        assert solution.termination == "event: v cut-off"
+        assert solution.t[-1] == pytest.approx(np.log(2), rel=1e-3)
 
     def test_multiprocess_context(self):
         solver = pybamm.BaseSolver()
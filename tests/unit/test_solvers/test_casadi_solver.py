@@ -1,3 +1,4 @@
+import pickle
 import pytest
 import pybamm
 import numpy as np
@@ -53,6 +54,43 @@ class TestCasadiSolver:
             solution.y.full()[0], np.exp(0.1 * solution.t), decimal=5
         )
 
+    def test_reuse_integrators(self):
+        model = pybamm.BaseModel()
+        var = pybamm.Variable("var")
+        model.rhs = {var: -0.1 * var}
+        model.initial_conditions = {var: 1}
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        solver = pybamm.CasadiSolver(mode="fast", rtol=1e-8, atol=1e-8)
+        # grids that are the same up to a shift and scaling use the same integrator
+        for t_end in [1, 2, 5]:
+            t_eval = np.linspace(0, t_end, 100)
+            solution = solver.solve(model, t_eval)
+            np.testing.assert_array_equal(solution.t, t_eval)
+            np.testing.assert_allclose(
+                solution.y.full()[0], np.exp(-0.1 * solution.t), rtol=1e-6
+            )
+        assert len(solver.integrators[model]) == 1
+
+        solution = solver.step(None, model, 3, t_eval=np.linspace(0, 3, 100))
+        np.testing.assert_allclose(
+            solution.y.full()[0], np.exp(-0.1 * solution.t), rtol=1e-6
+        )
+        assert len(solver.integrators[model]) == 1
+
+        # the number of grids for each model is bounded
+        solver = pybamm.CasadiSolver(
+            mode="fast", rtol=1e-8, atol=1e-8, integrators_maxcount=2
+        )
+        for npts in [10, 20, 30]:
+            solver.solve(model, np.linspace(0, 1, npts))
+        assert len(solver.integrators[model]) == 2
+
+        # a grid can't be made for an empty time interval
+        with pytest.raises(pybamm.SolverError, match="final time must be greater"):
+            solver.create_integrator(model, None, np.array([1.0, 1.0]))
+
     def test_without_grid(self):
         t_eval = np.linspace(0, 1, 100)
 
@@ -409,6 +447,55 @@ class TestCasadiSolver:
             solution.y.full()[0], np.exp(-1.1 * solution.t), rtol=1e-04
         )
 
+    def test_model_solver_multiple_inputs_worker_pool(self):
+        model = pybamm.BaseModel()
+        domain = ["negative electrode", "separator", "positive electrode"]
+        var = pybamm.Variable("var", domain=domain)
+        model.rhs = {var: -pybamm.InputParameter("rate") * var}
+        model.initial_conditions = {var: 1}
+        mesh = get_mesh_for_testing()
+        spatial_methods = {"macroscale": pybamm.FiniteVolume()}
+        disc = pybamm.Discretisation(mesh, spatial_methods)
+        disc.process_model(model)
+
+        solver = pybamm.CasadiSolver(rtol=1e-8, atol=1e-8)
+        t_eval = np.linspace(0, 10, 100)
+        inputs_list = [{"rate": 0.01 * (i + 1)} for i in range(4)]
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=2)
+        pool = solver._pool
+        assert pool is not None
+
+        # the pool is reused by the next solve
+        inputs_list = [{"rate": 0.02 * (i + 1)} for i in range(4)]
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=2)
+        assert solver._pool is pool
+        for inputs, solution in zip(inputs_list, solutions):
+            assert solution.all_models == [model]
+            np.testing.assert_allclose(
+                solution.y.full()[0], np.exp(-inputs["rate"] * solution.t), rtol=1e-4
+            )
+
+        # copies and pickles of the solver don't share the pool
+        assert solver.copy()._pool is None
+        assert pickle.loads(pickle.dumps(solver))._pool is None
+
+        # a different number of processes requires a new pool
+        solver.solve(model, t_eval, inputs=inputs_list, nproc=3)
+        assert solver._pool is not pool
+
+        # so do different settings of the solver, which are sent to the workers
+        pool = solver._pool
+        solver.solve(model, t_eval, inputs=inputs_list, nproc=3)
+        assert solver._pool is pool
+        solver.rtol = solver.atol = 1e-2
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=3)
+        assert solver._pool is not pool
+        serial_solution = solver.solve(model, t_eval, inputs=inputs_list[0])
+        np.testing.assert_array_equal(solutions[0].y.full(), serial_solution.y.full())
+
+        solver.close_pool()
+        assert solver._pool is None
+
     def test_model_solver_dae_inputs_in_initial_conditions(self):
         # Create model
         model = pybamm.BaseModel()
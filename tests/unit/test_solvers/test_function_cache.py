@@ -0,0 +1,72 @@
+#
+# Tests for the FunctionCache class
+#
+import os
+import numpy as np
+import pybamm
+from tempfile import TemporaryDirectory
+
+
+class TestFunctionCache:
+    def test_key(self):
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.FunctionCache(dir_name)
+            y = pybamm.StateVector(slice(0, 1))
+            key = cache.key(2 * y, "rhs", {"use_jacobian": True})
+            assert key == cache.key(2 * y, "rhs", {"use_jacobian": True})
+            assert key != cache.key(3 * y, "rhs", {"use_jacobian": True})
+            assert key != cache.key(2 * y, "algebraic", {"use_jacobian": True})
+            assert key != cache.key(2 * y, "rhs", {"use_jacobian": False})
+
+    def test_solver(self):
+        model = pybamm.BaseModel()
+        u = pybamm.Variable("u")
+        v = pybamm.Variable("v")
+        a = pybamm.InputParameter("a")
+        model.rhs = {u: -a * u}
+        model.algebraic = {v: v - 2 * u}
+        model.initial_conditions = {u: 1, v: 2}
+        model.events = [pybamm.Event("u = 0.5", u - 0.5)]
+        model.variables = {"u": u, "v": v}
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+        t_eval = np.linspace(0, 1, 10)
+
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.FunctionCache(dir_name)
+            solver = pybamm.CasadiSolver()
+            solver.function_cache = cache
+            solution = solver.solve(model, t_eval, inputs={"a": 1})
+            assert cache.hits == 0
+            assert cache.misses > 0
+            assert len(os.listdir(dir_name)) > 0
+
+            # a new solver (e.g. in a new process) loads the functions
+            misses = cache.misses
+            new_solver = pybamm.CasadiSolver()
+            new_solver.function_cache = cache
+            new_solution = new_solver.solve(model, t_eval, inputs={"a": 1})
+            assert cache.hits == misses
+            assert cache.misses == misses
+            np.testing.assert_allclose(new_solution.y, solution.y)
+            np.testing.assert_allclose(new_solution.t_event, solution.t_event)
+
+            # different inputs with the same shape use the same functions
+            new_solver = pybamm.CasadiSolver()
+            new_solver.function_cache = cache
+            new_solution = new_solver.solve(model, t_eval, inputs={"a": 2})
+            assert cache.misses == misses
+            np.testing.assert_allclose(
+                new_solution["u"].entries, np.exp(-2 * new_solution.t), rtol=1e-4
+            )
+
+            # sensitivities need different functions
+            new_solver = pybamm.CasadiSolver()
+            new_solver.function_cache = cache
+            new_solver.solve(
+                model, t_eval, inputs={"a": 1}, calculate_sensitivities=True
+            )
+            assert cache.misses > misses
+
+            cache.clear()
+            assert os.listdir(dir_name) == []
@@ -62,6 +62,58 @@ class TestIDAKLUSolver:
             true_solution = 0.1 * solution.t
             np.testing.assert_array_almost_equal(solution.y[0, :], true_solution)
 
+    def test_step_reuses_solver(self):
+        model = pybamm.BaseModel()
+        u = pybamm.Variable("u")
+        v = pybamm.Variable("v")
+        model.rhs = {u: 0.1 * v}
+        model.algebraic = {v: 1 - v}
+        model.initial_conditions = {u: 0, v: 1}
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        solver = pybamm.IDAKLUSolver()
+        solution = solver.step(None, model, 1)
+        sundials_solver = solver._setup["solver"]
+        for _ in range(3):
+            step_solution = solver.step(solution, model, 1)
+            # the integrator (and its KLU factorisation) is kept between steps
+            assert solver._setup["solver"] is sundials_solver
+            assert step_solution.integrator_set_up_time >= 0
+            solution = step_solution
+        np.testing.assert_array_almost_equal(solution.y[0, :], 0.1 * solution.t)
+
+    def test_solves_reuse_klu_symbolic_factorisation(self):
+        # the values of the jacobian depend on the input, so each solve refactorises
+        # the kept symbolic factorisation with new values, including a near-zero
+        # diagonal entry
+        model = pybamm.BaseModel()
+        u = pybamm.Variable("u")
+        v = pybamm.Variable("v")
+        w = pybamm.Variable("w")
+        a = pybamm.InputParameter("a")
+        model.rhs = {u: -u}
+        model.algebraic = {v: a * v + w - u, w: v + w - 2 * u}
+        model.initial_conditions = {u: 1, v: 1, w: 1}
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        solver = pybamm.IDAKLUSolver(rtol=1e-8, atol=1e-8)
+        t_eval = np.linspace(0, 1, 10)
+        sundials_solver = None
+        for a_value in [0.5, -1, 1e-10, 3, 0.5]:
+            solution = solver.solve(model, t_eval, inputs={"a": a_value})
+            if sundials_solver is None:
+                sundials_solver = solver._setup["solver"]
+            assert solver._setup["solver"] is sundials_solver
+            u_exact = np.exp(-solution.t)
+            v_exact = u_exact / (1 - a_value)
+            np.testing.assert_allclose(solution.y[0], u_exact, rtol=1e-6)
+            np.testing.assert_allclose(solution.y[1], v_exact, rtol=1e-6)
+            np.testing.assert_allclose(
+                solution.y[2], 2 * u_exact - v_exact, rtol=1e-6, atol=1e-8
+            )
+
     def test_multiple_inputs(self):
         model = pybamm.BaseModel()
         var = pybamm.Variable("var")
@@ -103,6 +155,89 @@ class TestIDAKLUSolver:
                     rtol=1e-4,
                 )
 
+    def test_multiple_inputs_initial_conditions(self):
+        # the initial conditions, and the algebraic state, depend on the inputs
+        model = pybamm.BaseModel()
+        u = pybamm.Variable("u")
+        v = pybamm.Variable("v")
+        u0 = pybamm.InputParameter("u0")
+        rate = pybamm.InputParameter("rate")
+        model.rhs = {u: -rate * u}
+        model.algebraic = {v: v - 2 * u}
+        model.initial_conditions = {u: u0, v: 0}
+        model.events = [pybamm.Event("u = 0.5", u - 0.5)]
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        solver = pybamm.IDAKLUSolver(options={"num_threads": 2, "num_solvers": 2})
+        t_eval = np.linspace(0, 1, 20)
+        inputs_list = [{"u0": 1 + i, "rate": 0.5 + 0.5 * (i % 2)} for i in range(5)] + [
+            {"u0": 0.6, "rate": 5}
+        ]
+        solutions = solver.solve(model, t_eval, inputs=inputs_list)
+
+        for inputs, solution in zip(inputs_list, solutions):
+            np.testing.assert_allclose(
+                solution.y[0],
+                inputs["u0"] * np.exp(-inputs["rate"] * solution.t),
+                rtol=1e-3,
+                atol=1e-4,
+            )
+            np.testing.assert_allclose(
+                solution.y[1], 2 * solution.y[0], rtol=1e-3, atol=1e-4
+            )
+        # the last set of inputs terminates early on the event
+        assert solutions[-1].termination == "event: u = 0.5"
+        assert solutions[0].termination == "final time"
+        # the initial states of each set of inputs are not kept on the model
+        assert model.y0full.ndim == 1
+
+        # solving again for the same number of inputs uses the new initial conditions
+        inputs_list = [{"u0": 3 + i, "rate": 1} for i in range(6)]
+        solutions = solver.solve(model, t_eval, inputs=inputs_list)
+        for inputs, solution in zip(inputs_list, solutions):
+            np.testing.assert_allclose(
+                solution.y[0],
+                inputs["u0"] * np.exp(-solution.t),
+                rtol=1e-3,
+                atol=1e-4,
+            )
+
+    def test_multiple_inputs_shared_initial_conditions(self, mocker):
+        # the initial states are only found for each set of inputs if the initial
+        # conditions or the algebraic equations depend on the inputs
+        t_eval = np.linspace(0, 1, 20)
+        inputs_list = [{"rate": 0.5 + 0.5 * i} for i in range(3)]
+        for algebraic_rate, per_input in [(2, False), (None, True)]:
+            model = pybamm.BaseModel()
+            u = pybamm.Variable("u")
+            v = pybamm.Variable("v")
+            rate = pybamm.InputParameter("rate")
+            model.rhs = {u: -rate * u}
+            model.algebraic = {v: v - (algebraic_rate or rate) * u}
+            model.initial_conditions = {u: 1, v: 0}
+            disc = pybamm.Discretisation()
+            disc.process_model(model)
+
+            solver = pybamm.IDAKLUSolver()
+            assert solver._initial_conditions_depend_on_inputs(model) == per_input
+            spy = mocker.spy(solver, "_consistent_initialization_per_input")
+            solutions = solver.solve(model, t_eval, inputs=inputs_list)
+            assert spy.call_count == per_input
+            for inputs, solution in zip(inputs_list, solutions):
+                np.testing.assert_allclose(
+                    solution.y[0],
+                    np.exp(-inputs["rate"] * solution.t),
+                    rtol=1e-3,
+                    atol=1e-4,
+                )
+                np.testing.assert_allclose(
+                    solution.y[1],
+                    (algebraic_rate or inputs["rate"]) * solution.y[0],
+                    rtol=1e-3,
+                    atol=1e-4,
+                )
+
     def test_model_events(self):
         for form in ["casadi", "iree"]:
             if (form == "iree") and (not pybamm.has_jax() or not pybamm.has_iree()):
@@ -0,0 +1,73 @@
+#
+# Tests for the ObservationFunctionCache class
+#
+import casadi
+import numpy as np
+import pybamm
+
+
+class TestObservationFunctionCache:
+    def test_function(self):
+        cache = pybamm.ObservationFunctionCache(maxsize=2)
+        y = pybamm.StateVector(slice(0, 1))
+        key = cache.key([2 * y], {}, (1, 10))
+        assert key == cache.key([2 * y], {}, (1, 10))
+        assert key != cache.key([3 * y], {}, (1, 10))
+        assert key != cache.key([2 * y], {}, (2, 10))
+        assert key != cache.key([2 * y], {"a": np.array([1])}, (1, 10))
+
+        calls = []
+
+        def create(name):
+            def f():
+                calls.append(name)
+                return casadi.Function(name, [], [])
+
+            return f
+
+        f1 = cache.function(key, create("f1"))
+        assert cache.function(key, create("f1")) is f1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert calls == ["f1"]
+
+        # serialised functions are stored with the functions
+        serialised = cache.serialize(f1)
+        assert cache.serialize(f1) is serialised
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        # least recently used functions are evicted
+        cache.function("key 2", create("f2"))
+        cache.function(key, create("f1"))
+        cache.function("key 3", create("f3"))
+        assert len(cache) == 2
+        cache.function("key 2", create("f2"))
+        assert calls == ["f1", "f2", "f3", "f2"]
+
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+        assert "maxsize=2" in repr(cache)
+
+    def test_shared_between_models(self):
+        pybamm.observation_function_cache.clear()
+        model = pybamm.BaseModel()
+        c = pybamm.Variable("c")
+        model.rhs = {c: -c}
+        model.initial_conditions = {c: 1}
+        model.variables = {"2c": 2 * c}
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+        solver = pybamm.ScipySolver()
+        solution = solver.solve(model, np.linspace(0, 1))
+        solution["2c"].data
+        # with IDAKLU, the serialised function used to observe in C++ is also cached
+        n_lookups = 2 if pybamm.has_idaklu() else 1
+        assert pybamm.observation_function_cache.misses == n_lookups
+
+        # a copy of the model has the same variables, but its own functions
+        new_model = model.new_copy()
+        new_model._variables_casadi = {}
+        new_solution = solver.copy().solve(new_model, np.linspace(0, 1))
+        np.testing.assert_allclose(new_solution["2c"].data, solution["2c"].data)
+        assert pybamm.observation_function_cache.hits == n_lookups
+        assert new_model._variables_casadi["2c"] is model._variables_casadi["2c"]
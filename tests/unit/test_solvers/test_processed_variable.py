@@ -902,6 +902,56 @@ class TestProcessedVariable:
             processed_var(t_sol, x_sol, r_sol).shape, (10, 35, 50)
         )
 
+    def test_processed_var_2D_interpolation_matches_xarray(self):
+        var = pybamm.Variable(
+            "var",
+            domain=["negative particle"],
+            auxiliary_domains={"secondary": ["negative electrode"]},
+        )
+        disc = tests.get_p2d_discretisation_for_testing()
+        disc.set_variable_slices([var])
+        var_sol = disc.process_symbol(var)
+        t_sol = np.linspace(0, 1)
+        y_sol = np.random.default_rng(0).random((var_sol.size, len(t_sol)))
+        processed_var = pybamm.process_variable(
+            [var_sol], [to_casadi(var_sol, y_sol)], self._sol_default(t_sol, y_sol)
+        )
+        processed_var.initialise()
+        entries = processed_var._entries_for_interp_raw
+        coords = processed_var._coords_raw
+
+        t = np.linspace(-0.1, 1.1, 30)
+        x = np.linspace(0, 0.4, 7)
+        r = np.linspace(0, 1.2, 11)
+        for kwargs in [
+            {"t": t, "x": x, "r": r},
+            {"t": 0.55, "x": x, "r": 0.3},
+            {"t": t, "x": 0.2, "r": [0.5]},
+            {"x": x},
+        ]:
+            for fill_value in [np.nan, 0, "extrapolate"]:
+                np.testing.assert_allclose(
+                    processed_var._interpolate(
+                        entries, coords, False, fill_value=fill_value, **kwargs
+                    ),
+                    processed_var._xr_interpolate(
+                        entries, coords, False, fill_value=fill_value, **kwargs
+                    ),
+                    rtol=1e-12,
+                    atol=1e-12,
+                )
+
+        # the interpolation weights are reused for the same query points
+        t = t[t >= 0]
+        processed_var(t, x, r)
+        weights = pybamm.solvers.processed_variable._interpolation_weights(
+            coords["t"], t
+        )
+        assert (
+            pybamm.solvers.processed_variable._interpolation_weights(coords["t"], t)
+            is weights
+        )
+
     @pytest.mark.parametrize("hermite_interp", _hermite_args)
     def test_processed_var_2D_fixed_t_interpolation(self, hermite_interp):
         var = pybamm.Variable(
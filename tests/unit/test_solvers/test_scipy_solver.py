@@ -218,9 +218,14 @@ class TestScipySolver:
         np.testing.assert_array_equal(step_sol1.t, [0, dt])
         np.testing.assert_array_almost_equal(step_sol1.y[0], np.exp(0.1 * step_sol1.t))
 
-        # Step again, the model has changed so this raises an error
-        with pytest.raises(RuntimeError, match="already been initialised"):
-            solver.step(step_sol1, model2, dt)
+        # Step another model with the same solver
+        step_sol2 = solver.step(None, model2, dt)
+        np.testing.assert_array_almost_equal(step_sol2.y[0], np.exp(0.2 * step_sol2.t))
+        np.testing.assert_array_almost_equal(step_sol2.y[1], np.exp(-0.5 * step_sol2.t))
+
+        # Step the first model again
+        step_sol1 = solver.step(step_sol1, model1, dt)
+        np.testing.assert_array_almost_equal(step_sol1.y[0], np.exp(0.1 * step_sol1.t))
 
     def test_model_solver_with_inputs(self):
         # Create model
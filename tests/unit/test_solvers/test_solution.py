@@ -81,6 +81,7 @@ class TestSolution:
         sol1 = pybamm.Solution(t1, y1, pybamm.BaseModel(), {"a": 1}, all_yps=yp1)
         sol1.solve_time = 1.5
         sol1.integration_time = 0.3
+        sol1.integrator_set_up_time = 0.1
 
         # Set up second solution
         t2 = np.linspace(1, 2)
@@ -89,11 +90,13 @@ class TestSolution:
         sol2 = pybamm.Solution(t2, y2, pybamm.BaseModel(), {"a": 2}, all_yps=yp2)
         sol2.solve_time = 1
         sol2.integration_time = 0.5
+        sol2.integrator_set_up_time = 0.2
 
         sol_sum = sol1 + sol2
 
         # Test
         assert sol_sum.integration_time == 0.8
+        assert sol_sum.integrator_set_up_time == pytest.approx(0.3)
         np.testing.assert_array_equal(sol_sum.t, np.concatenate([t1, t2[1:]]))
         np.testing.assert_array_equal(
             sol_sum.y, np.concatenate([y1, y2[:, 1:]], axis=1)
@@ -174,6 +177,66 @@ class TestSolution:
         ):
             sol_sum.y
 
+    def test_solution_builder(self):
+        solutions = []
+        for i in range(5):
+            t = np.linspace(i, i + 1, 10)
+            sol = pybamm.Solution(
+                t, np.tile(t, (3, 1)), pybamm.BaseModel(), {"a": i}, all_yps=t[None]
+            )
+            sol.solve_time = 1
+            sol.integration_time = 0.5
+            solutions.append(sol)
+        # solution already contained in the existing solution, with a new termination
+        sol_event = pybamm.Solution(
+            np.array([5]), np.ones((3, 1)), pybamm.BaseModel(), {}, termination="event"
+        )
+        solutions.append(sol_event)
+
+        sol_sum = solutions[0]
+        builder = pybamm.SolutionBuilder(pybamm.EmptySolution())
+        builder.append(None)
+        for sol in solutions:
+            if sol is not solutions[0]:
+                sol_sum = sol_sum + sol
+            builder.append(sol)
+        sol_built = builder.build()
+
+        np.testing.assert_array_equal(sol_built.t, sol_sum.t)
+        np.testing.assert_array_equal(sol_built.y, sol_sum.y)
+        assert len(sol_built.all_ts) == len(sol_sum.all_ts)
+        assert sol_built.all_inputs == sol_sum.all_inputs
+        assert sol_built.all_models == sol_sum.all_models
+        assert sol_built.sub_solutions == sol_sum.sub_solutions
+        assert sol_built.hermite_interpolation
+        assert sol_built.termination == sol_sum.termination == "event"
+        assert sol_built.solve_time == sol_sum.solve_time == 5
+        assert sol_built.integration_time == sol_sum.integration_time == 2.5
+
+        # building doesn't prevent further appends
+        last_state = builder.last_state
+        assert last_state.t == 5
+        assert last_state.termination == "event"
+        t = np.linspace(5, 6)
+        builder.append(pybamm.Solution(t, np.tile(t, (3, 1)), pybamm.BaseModel(), {}))
+        assert builder.last_state.t == 6
+        assert len(builder.build().all_ts) == 6
+        assert len(sol_built.all_ts) == 5
+        assert not builder.build().hermite_interpolation
+
+        # only empty solutions
+        builder = pybamm.SolutionBuilder()
+        assert builder.build() is None
+        builder.append(pybamm.EmptySolution(termination="test", t=1))
+        assert builder.last_state.termination == "test"
+        assert isinstance(builder.build(), pybamm.EmptySolution)
+
+        with pytest.raises(
+            pybamm.SolverError,
+            match="Only a Solution or None can be added to a Solution",
+        ):
+            builder.append(2)
+
     def test_copy(self):
         # Set up first solution
         t1 = [np.linspace(0, 1), np.linspace(1, 2, 5)]
@@ -263,6 +326,81 @@ class TestSolution:
         np.testing.assert_array_equal(twoc_sol.entries, twoc_sol(solution.t))
         np.testing.assert_array_equal(twoc_sol.entries, 2 * c_sol.entries)
 
+    def test_evaluate_scalar_variables(self):
+        model = pybamm.BaseModel()
+        c = pybamm.Variable("c")
+        a = pybamm.InputParameter("a")
+        model.rhs = {c: -a * c}
+        model.initial_conditions = {c: 1}
+        model.variables = {
+            "c": c,
+            "2c + t": 2 * c + pybamm.t,
+            "Integral of c": pybamm.ExplicitTimeIntegral(c, pybamm.Scalar(0)),
+            "Vector": pybamm.Vector([1, 2]) * c,
+        }
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+        solution = pybamm.ScipySolver().solve(model, np.linspace(0, 1), inputs={"a": 2})
+
+        for index in [0, -1]:
+            values = solution._evaluate_scalar_variables(["c", "2c + t"], index)
+            t = solution.t[index]
+            np.testing.assert_allclose(values["c"], np.exp(-2 * t), rtol=1e-5)
+            np.testing.assert_allclose(
+                values["2c + t"], 2 * np.exp(-2 * t) + t, rtol=1e-5
+            )
+        # the compiled function is stored in the model
+        assert ("scalar variables", ("c", "2c + t")) in model._variables_casadi
+
+        # time integrals, non-scalar and missing variables can't be evaluated
+        for name in ["Integral of c", "Vector", "Missing"]:
+            assert solution._evaluate_scalar_variables(["c", name], -1) is None
+
+    def test_observe_many(self):
+        model = pybamm.BaseModel()
+        c = pybamm.Variable("c", domain="negative electrode")
+        d = pybamm.Variable("d")
+        a = pybamm.InputParameter("a")
+        model.rhs = {c: -a * c, d: -d}
+        model.initial_conditions = {c: 1, d: 1}
+        model.variables = {
+            "c": c,
+            "d": d,
+            "2c + d": 2 * c + d,
+            "Integral of d": pybamm.ExplicitTimeIntegral(d, pybamm.Scalar(0)),
+        }
+        disc = get_discretisation_for_testing()
+        disc.process_model(model)
+        solver = pybamm.ScipySolver()
+
+        def solve():
+            # a solution with two sub-solutions
+            solution = solver.solve(model, np.linspace(0, 1), inputs={"a": 2})
+            return solver.step(solution, model, 1, inputs={"a": 3})
+
+        names = list(model.variables.keys())
+        solution = solve()
+        assert len(solution.all_ts) == 2
+        processed = solution.observe_many([*names, "c"])
+        assert list(processed.keys()) == names
+        for name in names:
+            assert solution[name] is processed[name]
+        # the fused function is stored in the model
+        assert ("observe many", tuple(names)) in model._variables_casadi
+
+        expected = solve()
+        for name in names:
+            np.testing.assert_allclose(
+                processed[name].data, expected[name].data, rtol=1e-10
+            )
+        np.testing.assert_allclose(
+            processed["c"](t=0.5, x=0.1), expected["c"](t=0.5, x=0.1), rtol=1e-10
+        )
+
+        # get_data_dict uses the fused evaluation
+        data = solve().get_data_dict(names)
+        np.testing.assert_allclose(data["2c + d"], expected["2c + d"].data)
+
     def test_plot(self):
         model = pybamm.BaseModel()
         c = pybamm.Variable("c")
@@ -275,6 +413,44 @@ class TestSolution:
 
         solution.plot(["c", "2c"], show_plot=False)
 
+    def test_save_columnar(self):
+        experiment = pybamm.Experiment(
+            [("Discharge at 1C for 10 minutes", "Rest for 5 minutes")] * 2
+        )
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), experiment=experiment)
+        solution = sim.solve()
+
+        with TemporaryDirectory() as dir_name:
+            solution.save_columnar(dir_name, mesh=sim.mesh)
+            # each model is saved once
+            assert sum(name.startswith("model_") for name in os.listdir(dir_name)) == 2
+
+            loaded = pybamm.load_columnar_solution(dir_name)
+            assert len(loaded.all_ys) == len(solution.all_ys)
+            assert all(isinstance(ys, np.memmap) for ys in loaded.all_ys)
+            assert loaded.termination == solution.termination
+            np.testing.assert_array_equal(loaded.t, solution.t)
+            for name in [
+                "Voltage [V]",
+                "Negative particle concentration [mol.m-3]",
+            ]:
+                np.testing.assert_allclose(
+                    loaded[name].data, solution[name].data, rtol=1e-10
+                )
+            np.testing.assert_array_equal(
+                loaded.summary_variables["Capacity [A.h]"],
+                solution.summary_variables["Capacity [A.h]"],
+            )
+
+            # states can also be read into memory
+            loaded = pybamm.load_columnar_solution(dir_name, mmap_mode=None)
+            assert not isinstance(loaded.all_ys[0], np.memmap)
+
+            # without the mesh only the states are saved
+            solution.save_columnar(dir_name)
+            loaded = pybamm.load_columnar_solution(dir_name)
+            np.testing.assert_array_equal(loaded.y, solution.y)
+
     def test_save(self):
         with TemporaryDirectory() as dir_name:
             test_stub = os.path.join(dir_name, "test")